@@ -0,0 +1,71 @@
+"""
+Micro-benchmark de la normalisation du FrequencyParser (lexiques fr et en).
+
+Usage : python -m benchmarks.bench_frequency_parser [--number 2000]
+"""
+import argparse
+import timeit
+
+from todo_bene.domain.services.frequency_parser import FrequencyParser
+
+PHRASES = {
+    "fr": [
+        "Tous les lundis",
+        "Chaque mois",
+        "Le deuxième jour ouvré du mois",
+        "Toutes les 2 semaines pendant 3 mois",
+        "Tous les jours sauf le dimanche",
+        "Le dernier vendredi du trimestre, si férié décaler",
+        "Chaque jour jusqu'à la fin de l'année",
+    ],
+    "en": [
+        "Every monday",
+        "Each month",
+        "The 2nd business day of the month",
+        "Every 2 weeks for 3 months",
+        "Every day except sunday",
+        "The last friday of the quarter, shift if holiday",
+        "Every day until the end of the year",
+    ],
+}
+
+
+def bench_language(language: str, number: int) -> dict[str, float]:
+    """Retourne le temps moyen (µs) par phrase pour _normalize et parse."""
+    parser = FrequencyParser(language=language)
+    phrases = PHRASES[language]
+
+    def run_normalize():
+        for phrase in phrases:
+            parser._normalize(phrase)
+
+    def run_parse():
+        for phrase in phrases:
+            parser.parse(phrase)
+
+    # Construction d'un parser : le lexique compilé doit être réutilisé
+    construct = timeit.timeit(lambda: FrequencyParser(language=language), number=number)
+    normalize = timeit.timeit(run_normalize, number=number)
+    parse = timeit.timeit(run_parse, number=max(1, number // 10))
+
+    per_call = 1_000_000 / len(phrases)
+    return {
+        "init": construct * 1_000_000 / number,
+        "normalize": normalize * per_call / number,
+        "parse": parse * per_call / max(1, number // 10),
+    }
+
+
+def main():
+    cli = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    cli.add_argument("--number", type=int, default=2000, help="Nombre d'itérations par mesure")
+    args = cli.parse_args()
+
+    print(f"{'lang':<6}{'init (µs)':>12}{'normalize (µs)':>16}{'parse (µs)':>12}")
+    for language in PHRASES:
+        res = bench_language(language, args.number)
+        print(f"{language:<6}{res['init']:>12.1f}{res['normalize']:>16.1f}{res['parse']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Benchmark des parcours de la CLI sur une base synthétique (cf. benchmarks.dataset).
+
+Usage : python -m benchmarks.bench_scenarios --roots 5000 --repeat 5 --output results.jsonl
+
+La base est régénérée (même graine, même forme) dans --workdir à chaque lancement : les
+scénarios qui écrivent (complétion, répétition) consomment chacun des racines distinctes.
+Le résultat est un objet JSON (version, forme, temps par scénario) affiché et, avec
+--output, ajouté en une ligne au fichier pour comparer les versions entre elles.
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import duckdb
+
+from benchmarks.dataset import NOUNS, generate, open_database, shape_arguments, shape_from_args, user_ids
+from todo_bene.application.use_cases.todo_complete import TodoCompleteUseCase
+from todo_bene.application.use_cases.todo_find_top_level_by_user import TodoListViewUseCase
+from todo_bene.application.use_cases.todo_get import TodoGetUseCase
+from todo_bene.application.use_cases.todo_repetition import RepetitionTodo
+from todo_bene.domain.services.mail_engine import filter_todos_for_job
+from todo_bene.infrastructure.persistence.cache.caching_todo_repository import CachingTodoRepository
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+
+SCENARIOS = ("list", "detail", "complete", "repeat", "mail", "search", "search_typo", "search_baseline")
+PAGE_SIZE = 20
+
+
+def _roots(conn, user_id, count: int, recurring: bool) -> list:
+    """Racines actives (avec ou sans fréquence), dans un ordre stable."""
+    return [row[0] for row in conn.execute(
+        f"""
+        SELECT uuid FROM todos
+        WHERE user_id = ? AND parent_id IS NULL AND state = false AND frequency {'<>' if recurring else '='} ''
+        ORDER BY uuid LIMIT ?
+        """,
+        [user_id, count],
+    ).fetchall()]
+
+
+def _repository(conn):
+    # Une commande tb = un repository avec son propre cache (cf. get_repository)
+    return CachingTodoRepository(DuckDBTodoRepository(conn))
+
+
+def scenario_list(conn, user_id, run: int) -> None:
+    """tb list : première page de la vue liste."""
+    TodoListViewUseCase(_repository(conn)).execute(user_id, period="all", limit=PAGE_SIZE + 1)
+
+
+def scenario_detail(conn, user_id, run: int, root) -> None:
+    """Vue détail d'une racine puis de son premier enfant (TodoGetUseCase par enfant affiché)."""
+    repo = _repository(conn)
+    todo_id = root
+    for _ in range(2):
+        _, children, _, _ = TodoGetUseCase(repo).execute(todo_id, user_id)
+        for child in children:
+            TodoGetUseCase(repo).execute(child.uuid, user_id)
+        if not children:
+            break
+        todo_id = children[0].uuid
+
+
+def scenario_complete(conn, user_id, run: int, root) -> None:
+    """Complétion forcée d'une racine : cascade sur tout son sous-arbre."""
+    TodoCompleteUseCase(_repository(conn)).execute(root, user_id, force=True)
+
+
+def scenario_repeat(conn, user_id, run: int, root) -> float:
+    """Répétition (matérialisée) d'une racine récurrente ; la complétion préalable n'est pas mesurée."""
+    repo = _repository(conn)
+    TodoCompleteUseCase(repo).execute(root, user_id, force=True)
+    start = time.perf_counter()
+    RepetitionTodo(repo, mode="materialized", horizon=1).execute(root)
+    return time.perf_counter() - start
+
+
+def scenario_mail(conn, user_id, run: int) -> None:
+    """Sélection du mail quotidien sur les tâches actives de l'utilisateur."""
+    filter_todos_for_job(_repository(conn).find_all_active_by_user(user_id), [], [])
+
+
+def scenario_search(conn, user_id, run: int) -> None:
+    """Choix du parent : titres contenant la saisie (passe sous-chaîne seule)."""
+    term = NOUNS[run % len(NOUNS)]
+    _repository(conn).search_by_title(user_id, term)
+
+
+def scenario_search_typo(conn, user_id, run: int) -> None:
+    """Saisie avec une lettre manquante : aucune sous-chaîne, complément par l'index trigrammes."""
+    noun = NOUNS[run % len(NOUNS)]
+    _repository(conn).search_by_title(user_id, noun[:2] + noun[3:])
+
+
+def scenario_search_baseline(conn, user_id, run: int) -> None:
+    """Référence : l'ancienne recherche ILIKE (parcours de todos, sans tolérance aux fautes)."""
+    term = NOUNS[run % len(NOUNS)]
+    conn.execute(
+        "SELECT * FROM todos WHERE user_id = ? AND title ILIKE ? ORDER BY title LIMIT 10", [user_id, f"%{term}%"]
+    ).fetchall()
+
+
+def run_scenarios(conn, user_id, scenarios, repeat: int) -> dict:
+    """Temps (ms) de chaque scénario : min, médiane et moyenne sur `repeat` exécutions."""
+    roots = _roots(conn, user_id, 2 * repeat, recurring=False)
+    recurring = _roots(conn, user_id, repeat, recurring=True)
+    targets = {
+        "detail": lambda run: (roots[run % len(roots)],),
+        "complete": lambda run: (roots[repeat + run],),
+        "repeat": lambda run: (recurring[run],),
+    }
+    results = {}
+    for name in scenarios:
+        if name == "complete" and len(roots) < 2 * repeat or name == "repeat" and len(recurring) < repeat:
+            results[name] = {"skipped": "pas assez de racines actives"}
+            continue
+        scenario = globals()[f"scenario_{name}"]
+        timings = []
+        for run in range(repeat):
+            start = time.perf_counter()
+            measured = scenario(conn, user_id, run, *targets.get(name, lambda run: ())(run))
+            timings.append(1000 * (measured if measured is not None else time.perf_counter() - start))
+        results[name] = {
+            "runs": repeat,
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(statistics.median(timings), 3),
+            "mean_ms": round(statistics.fmean(timings), 3),
+        }
+    return results
+
+
+def _package_version() -> str:
+    try:
+        return version("todo-bene")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main():
+    cli = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    shape_arguments(cli)
+    cli.add_argument("--repeat", type=int, default=5, help="Exécutions par scénario")
+    cli.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Sous-ensemble de {','.join(SCENARIOS)}")
+    cli.add_argument("--workdir", type=Path, default=None, help="Dossier de la base générée (défaut : temporaire)")
+    cli.add_argument("--output", type=Path, default=None, help="Fichier JSONL auquel ajouter le résultat")
+    args = cli.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        cli.error(f"Scénarios inconnus : {', '.join(sorted(unknown))}")
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="tb-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    # Config et caches (fréquences...) isolés dans le dossier de travail
+    os.environ.setdefault("TODO_BENE_CONFIG_PATH", str(workdir / "config.json"))
+    os.environ.setdefault("LANG", "fr_FR.UTF-8")
+
+    shape = shape_from_args(args)
+    db_path = workdir / "bench.db"
+    db_path.unlink(missing_ok=True)
+    conn = open_database(db_path)
+    stats = generate(conn, shape)
+    user_id = user_ids(conn, shape)[0]
+
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "version": _package_version(),
+        "duckdb": duckdb.__version__,
+        "shape": asdict(shape),
+        **stats,
+        "scenarios": run_scenarios(conn, user_id, scenarios, args.repeat),
+    }
+    conn.close()
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Générateur de bases synthétiques (déterministes à graine égale) pour les benchmarks.
+
+Usage : python -m benchmarks.dataset bench.db --users 10 --roots 20000 --depth 2 --fanout 4
+
+Toutes les lignes sont produites côté DuckDB (INSERT ... SELECT sur range()), un niveau
+d'arbre par requête, sans passer par les objets Todo : 100 000 todos en ~3 s, un million
+en ~30 s (l'index trigrammes des titres en représente la majeure partie). Les identifiants sont des md5 de (graine, utilisateur, niveau, index),
+ce qui permet de retrouver le parent d'un nœud sans jointure.
+"""
+import argparse
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import duckdb
+import pendulum
+
+from todo_bene.domain.entities.category import Category
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import TODO_COLUMNS
+
+# Fréquences comprises par FrequencyParser('fr') : les racines récurrentes sont répétables telles quelles
+FREQUENCIES = [
+    "tous les jours pendant 5 jours",
+    "tous les lundis pendant 2 mois",
+    "chaque mois pendant 6 mois",
+    "toutes les 2 semaines pendant 3 mois",
+]
+VERBS = ["Appeler", "Réparer", "Préparer", "Relire", "Envoyer", "Planifier", "Acheter", "Ranger"]
+NOUNS = ["client", "rapport", "évier", "budget", "dossier", "réunion", "facture", "jardin"]
+DAY = 86_400
+
+
+@dataclass
+class DatasetShape:
+    """Forme de la base : `roots` racines par utilisateur, arbres de `depth` niveaux (racine comprise)."""
+    users: int = 1
+    roots: int = 1000
+    depth: int = 3
+    fanout: int = 3
+    recurring_share: float = 0.1  # Part des racines actives avec une fréquence
+    completed_share: float = 0.3  # Part des sous-arbres terminés (datés dans le passé)
+    horizon_days: int = 90  # Étalement des dates, dans le futur (actifs) ou le passé (terminés)
+    categories: dict[str, float] = field(
+        default_factory=lambda: {Category.TRAVAIL: 0.4, Category.QUOTIDIEN: 0.3, Category.LOISIRS: 0.2, "Projet": 0.1}
+    )
+    seed: int = 42
+
+    @property
+    def rows_per_user(self) -> int:
+        return self.roots * sum(self.fanout ** level for level in range(self.depth))
+
+    @property
+    def rows(self) -> int:
+        return self.users * self.rows_per_user
+
+
+def open_database(path) -> duckdb.DuckDBPyConnection:
+    """Connexion non chiffrée avec le schéma à jour (migrations), sans passer par le trousseau."""
+    manager = DuckDBConnectionManager(str(path))
+    manager.conn = duckdb.connect(str(path))
+    manager._ensure_migration_table()
+    manager._run_migrations()
+    return manager.conn
+
+
+def user_ids(conn, shape: DatasetShape) -> list:
+    return [row[0] for row in conn.execute(
+        "SELECT md5(concat_ws('-', ?, 'user', u))::UUID FROM range(?) t(u) ORDER BY u", [shape.seed, shape.users]
+    ).fetchall()]
+
+
+def _sql_list(values: list[str]) -> str:
+    return "[" + ", ".join("'" + value.replace("'", "''") + "'" for value in values) + "]"
+
+
+def _category_case(shape: DatasetShape, bucket: str) -> str:
+    """CASE SQL tirant une catégorie selon la distribution (bucket : entier 0..999)."""
+    total = sum(shape.categories.values())
+    cases, threshold = [], 0.0
+    for name, weight in shape.categories.items():
+        threshold += weight / total
+        cases.append(f"WHEN {bucket} < {round(threshold * 1000)} THEN '{name.replace(chr(39), chr(39) * 2)}'")
+    return f"CASE {' '.join(cases)} ELSE '{Category.QUOTIDIEN}' END"
+
+
+def generate(conn, shape: DatasetShape) -> dict:
+    """Remplit la base (utilisateurs, catégories, todos, index des titres) ; retourne des statistiques."""
+    start = time.perf_counter()
+    now = pendulum.now().int_timestamp
+    seed = shape.seed
+    completed = round(shape.completed_share * 1000)
+    recurring = round(shape.recurring_share * 1000)
+
+    conn.begin()
+    conn.execute(
+        """
+        INSERT INTO users
+        SELECT md5(concat_ws('-', ?1, 'user', u))::UUID, 'bench' || u, 'bench' || u || '@example.com'
+        FROM range(?2) t(u)
+        """,
+        [seed, shape.users],
+    )
+    custom = [name for name in shape.categories if name not in Category.ALL]
+    if custom:
+        conn.execute(
+            """
+            INSERT INTO categories (name, user_id, emoji)
+            SELECT c.name, md5(concat_ws('-', ?1, 'user', u))::UUID, '🏷️'
+            FROM range(?2) t(u), (SELECT unnest(?3::VARCHAR[]) AS name) c
+            """,
+            [seed, shape.users, custom],
+        )
+
+    columns = ", ".join(TODO_COLUMNS)
+    for level in range(shape.depth):
+        # Tout ce qui est partagé par un sous-arbre (état, catégorie, dates) dépend de la racine
+        root_index = f"(i // {shape.fanout ** level})"
+        root_hash = f"hash(concat_ws('-', ?1, u, {root_index}))"
+        node_hash = f"hash(concat_ws('-', ?1, u, {level}, i))"
+        is_done = f"({root_hash} % 1000 < {completed})"
+        parent = (
+            "NULL"
+            if level == 0
+            else f"md5(concat_ws('-', ?1, u, {level - 1}, i // {shape.fanout}))::UUID"
+        )
+        frequency = (
+            f"""CASE WHEN NOT {is_done} AND ({root_hash} // 1000) % 1000 < {recurring}
+                THEN list_element({_sql_list(FREQUENCIES)}, ({node_hash} % {len(FREQUENCIES)})::INTEGER + 1) ELSE '' END"""
+            if level == 0
+            else "''"
+        )
+        conn.execute(
+            f"""
+            INSERT INTO todos ({columns})
+            SELECT
+                md5(concat_ws('-', ?1, u, {level}, i))::UUID,
+                list_element(?3, ({node_hash} % {len(VERBS)})::INTEGER + 1) || ' '
+                    || list_element(?4, ({node_hash} // 7 % {len(NOUNS)})::INTEGER + 1) || ' ' || {level} || '.' || i,
+                'Description générée pour le benchmark ' || i,
+                {_category_case(shape, f"(({root_hash} // 1000000) % 1000)")},
+                {is_done},
+                {node_hash} % 10 = 0,
+                start_ts,
+                start_ts + 3600 * (1 + ({node_hash} // 10) % 48),
+                md5(concat_ws('-', ?1, 'user', u))::UUID,
+                {parent},
+                {frequency},
+                CASE WHEN {is_done} THEN start_ts + 3600 ELSE NULL END
+            FROM (
+                SELECT u, i,
+                    ?2 + CASE WHEN {is_done} THEN -1 ELSE 1 END
+                        * (60 + ({root_hash} // 1000000000) % ({shape.horizon_days * DAY})) AS start_ts
+                FROM range(?5) t(u), range(?6) n(i)
+            )
+            """,
+            [seed, now, VERBS, NOUNS, shape.users, shape.roots * shape.fanout ** level],
+        )
+    conn.execute(
+        """
+        INSERT INTO title_index
+        SELECT * FROM (
+            SELECT uuid, user_id, unnest(trigrams_of(title)) AS trigram FROM todos
+            WHERE user_id IN (SELECT md5(concat_ws('-', ?1, 'user', u))::UUID FROM range(?2) t(u))
+        ) ORDER BY user_id, trigram
+        """,
+        [seed, shape.users],
+    )
+    conn.commit()
+    return {"rows": shape.rows, "generate_s": round(time.perf_counter() - start, 3)}
+
+
+def shape_arguments(cli: argparse.ArgumentParser) -> None:
+    """Options communes (générateur et runner) décrivant la forme de la base."""
+    defaults = DatasetShape()
+    cli.add_argument("--users", type=int, default=defaults.users)
+    cli.add_argument("--roots", type=int, default=defaults.roots, help="Racines par utilisateur")
+    cli.add_argument("--depth", type=int, default=defaults.depth, help="Niveaux par arbre, racine comprise")
+    cli.add_argument("--fanout", type=int, default=defaults.fanout, help="Enfants par nœud")
+    cli.add_argument("--recurring", type=float, default=defaults.recurring_share, help="Part des racines récurrentes")
+    cli.add_argument("--completed", type=float, default=defaults.completed_share, help="Part des arbres terminés")
+    cli.add_argument(
+        "--categories", default=None,
+        help="Distribution 'Nom=poids,...' (défaut : Travail=0.4,Quotidien=0.3,Loisirs=0.2,Projet=0.1)",
+    )
+    cli.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def shape_from_args(args) -> DatasetShape:
+    shape = DatasetShape(
+        users=args.users, roots=args.roots, depth=args.depth, fanout=args.fanout,
+        recurring_share=args.recurring, completed_share=args.completed, seed=args.seed,
+    )
+    if args.categories:
+        shape.categories = {
+            name.strip(): float(weight)
+            for name, weight in (item.split("=") for item in args.categories.split(","))
+        }
+    return shape
+
+
+def main():
+    cli = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    cli.add_argument("db", type=Path, help="Fichier DuckDB à créer (écrasé s'il existe)")
+    shape_arguments(cli)
+    args = cli.parse_args()
+
+    shape = shape_from_args(args)
+    args.db.unlink(missing_ok=True)
+    conn = open_database(args.db)
+    stats = generate(conn, shape)
+    conn.close()
+    print(f"{stats['rows']} todos générés en {stats['generate_s']:.2f} s -> {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import pytest
+import pendulum
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.application.use_cases.todo_find_top_level_by_user import TodoListViewUseCase
+from todo_bene.infrastructure.persistence.memory.memory_todo_repository import MemoryTodoRepository
+
+
+@pytest.fixture(params=["memory", "duckdb"])
+def any_repo(request):
+    if request.param == "memory":
+        return MemoryTodoRepository()
+    return request.getfixturevalue("repo")
+
+
+def test_list_view_counts_descendants_and_filters_period(any_repo, user_id, mocker):
+    mocker.patch(
+        "todo_bene.application.use_cases.todo_find_top_level_by_user.get_last_postpone_date",
+        return_value=pendulum.now().to_date_string(),
+    )
+    now = pendulum.now()
+    today = Todo(title="Aujourd'hui", user=user_id, category="Sport",
+                 date_start=now.int_timestamp, date_due=now.at(23, 0).int_timestamp)
+    any_repo.save(today)
+    for state in (True, False, True):
+        any_repo.save(Todo(title="Sous-tâche", user=user_id, parent=today.uuid, state=state,
+                           date_start=now.int_timestamp, date_due=now.at(23, 0).int_timestamp))
+    later = now.add(months=2)
+    any_repo.save(Todo(title="Plus tard", user=user_id, date_start=later.int_timestamp, date_due=later.int_timestamp))
+
+    items, postponed = TodoListViewUseCase(any_repo).execute(user_id, period="today")
+
+    assert postponed == 0
+    assert [(i.todo.title, i.total, i.completed) for i in items] == [("Aujourd'hui", 3, 2)]
+    all_items, _ = TodoListViewUseCase(any_repo).execute(user_id, period="all")
+    assert [i.todo.title for i in all_items] == ["Aujourd'hui", "Plus tard"]
+
+
+@pytest.mark.parametrize("group_by, expected", [
+    ("day", ["2026-10-18", "2026-10-19", "2026-10-19"]),
+    ("week", ["2026-10-12", "2026-10-19", "2026-10-19"]),
+])
+def test_list_view_groups_in_user_timezone(any_repo, user_id, group_by, expected):
+    tz = "Europe/Paris"
+    # Lundi 00:30 à Paris = dimanche 22:30 UTC : le groupe suit le fuseau de l'utilisateur
+    dues = [
+        pendulum.datetime(2026, 10, 19, 9, 0, tz=tz),
+        pendulum.datetime(2026, 10, 18, 20, 0, tz=tz),
+        pendulum.datetime(2026, 10, 19, 0, 30, tz=tz),
+    ]
+    for i, due in enumerate(dues):
+        any_repo.save(Todo(title=f"T{i}", user=user_id, date_start=due.int_timestamp - 60, date_due=due.int_timestamp))
+
+    items = any_repo.find_list_view(user_id, group_by=group_by, timezone=tz)
+
+    # Pré-triées par groupe puis échéance : le rendu n'a plus qu'à insérer les bandeaux
+    assert [i.group for i in items] == expected
+    assert [i.todo.title for i in items] == ["T1", "T2", "T0"]
+
+
+def test_keyset_pages_cover_roots_once(any_repo, user_id):
+    from todo_bene.domain.entities.series import Series
+
+    # Ex aequo sur les dates : l'identifiant départage, y compris pour les occurrences virtuelles
+    for i in range(7):
+        any_repo.save(Todo(title=f"R{i}", user=user_id, date_start=100 * (i // 2), date_due=1000))
+    modele = Todo(title="Modèle", user=user_id, state=True, date_start=0, date_due=1000)
+    any_repo.save(modele)
+    any_repo.save_series(Series(template=modele.uuid, user=user_id, rule="r", deltas=[0, 50, 100]))
+    expected = any_repo.find_top_level_by_user(user_id)
+
+    pages, after = [], None
+    while page := any_repo.find_top_level_by_user(user_id, after=after, limit=3):
+        pages.append(page)
+        last = page[-1]
+        after = (last.date_start, last.date_due, last.series or last.uuid)
+    assert [t.uuid for page in pages for t in page] == [t.uuid for t in expected]
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+
+    # Page précédente : les lignes juste avant le curseur, dans l'ordre croissant
+    first = pages[1][0]
+    previous = any_repo.find_top_level_by_user(
+        user_id, before=(first.date_start, first.date_due, first.series or first.uuid), limit=3
+    )
+    assert [t.uuid for t in previous] == [t.uuid for t in pages[0]]
+
+    # Même chose sur la vue liste, dont le curseur suit l'ordre des échéances
+    items = any_repo.find_list_view(user_id, limit=4)
+    following = any_repo.find_list_view(user_id, after=items[-1].cursor, limit=20)
+    assert len(items) + len(following) == len(expected)
+    assert any_repo.find_list_view(user_id, before=following[0].cursor, limit=4) == items
+
+
+def test_list_view_truncates_descriptions_in_projection(any_repo, user_id):
+    long_text = "Compte rendu détaillé " * 200
+    todo = Todo(title="Réunion", user=user_id, description=long_text, date_start=0, date_due=10)
+    any_repo.save(todo)
+
+    [item] = any_repo.find_list_view(user_id)
+
+    assert item.todo.description == long_text[:16]
+    # La vue détail relit la tâche complète
+    assert any_repo.get_by_id(todo.uuid).description == long_text
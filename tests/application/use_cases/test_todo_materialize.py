@@ -0,0 +1,96 @@
+import duckdb
+import pytest
+import pendulum
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.application.use_cases.todo_repetition import RepetitionTodo
+from todo_bene.application.use_cases.todo_materialize import MaterializeOccurrenceUseCase
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+from todo_bene.infrastructure.persistence.memory.memory_todo_repository import MemoryTodoRepository
+
+
+@pytest.fixture(params=["memory", "duckdb"])
+def any_repo(request):
+    if request.param == "memory":
+        return MemoryTodoRepository()
+    return request.getfixturevalue("repo")
+
+
+def _completed_template(repo, user_id, start):
+    root = Todo(title="Root", user=user_id, state=True, date_start=start.int_timestamp,
+                frequency="tous les jours pendant 1 an")
+    repo.save(root)
+    child = Todo(title="Child", user=user_id, parent=root.uuid, date_start=start.int_timestamp)
+    repo.save(child)
+    return root
+
+
+def test_series_mode_writes_no_occurrence(any_repo, user_id):
+    """En mode série, la répétition n'écrit que la règle : les occurrences sont développées à la lecture."""
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+    with pendulum.travel_to(now_frozen):
+        root = _completed_template(any_repo, user_id, now_frozen)
+        result = RepetitionTodo(any_repo, mode="series").execute(root.uuid)
+
+        assert len(result) > 300
+        assert all(t.series == result[0].series for t in result)
+        # Aucun Todo écrit : seuls le modèle et son enfant existent
+        assert any_repo.find_by_parent(result[0].uuid) == []
+        week = any_repo.find_top_level_by_user(user_id, max_date=now_frozen.end_of("week").int_timestamp)
+        assert [t.date_start for t in week] == [t.date_start for t in result[:6]]
+        assert week[0].uuid == result[0].uuid
+
+
+def test_materialize_occurrence_clones_template_subtree(any_repo, user_id):
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+    with pendulum.travel_to(now_frozen):
+        root = _completed_template(any_repo, user_id, now_frozen)
+        occurrences = RepetitionTodo(any_repo, mode="series").execute(root.uuid)
+        virtual = occurrences[1]
+
+        real = MaterializeOccurrenceUseCase(any_repo).execute(virtual)
+
+        assert real.series is None
+        assert (real.title, real.date_start, real.state) == ("Root", virtual.date_start, False)
+        assert [t.title for t in any_repo.find_by_parent(real.uuid)] == ["Child"]
+        # L'occurrence n'est plus virtuelle : elle apparaît une seule fois, en tant que vrai Todo
+        roots = any_repo.find_top_level_by_user(user_id, max_date=virtual.date_due)
+        assert [(t.uuid, t.series) for t in roots if t.date_start == virtual.date_start] == [(real.uuid, None)]
+        assert len(any_repo.get_series(virtual.series).deltas) == len(occurrences) - 1
+        with pytest.raises(ValueError):
+            MaterializeOccurrenceUseCase(any_repo).execute(virtual)
+
+
+def test_materialize_returns_saved_todo_unchanged(user_id):
+    repo = MemoryTodoRepository()
+    todo = Todo(title="Simple", user=user_id)
+    repo.save(todo)
+    assert MaterializeOccurrenceUseCase(repo).execute(todo) is todo
+
+
+def test_materialize_is_atomic_when_series_update_fails(db_manager_conn, user_id):
+    class FailingSeriesUpdate:
+        def __getattr__(self, name):
+            return getattr(db_manager_conn, name)
+
+        def execute(self, query, parameters=None):
+            if query.startswith("UPDATE series"):
+                raise duckdb.IOException("échec simulé")
+            return db_manager_conn.execute(query, parameters)
+
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+    with pendulum.travel_to(now_frozen):
+        repo = DuckDBTodoRepository(FailingSeriesUpdate())
+        root = _completed_template(repo, user_id, now_frozen)
+        virtual = RepetitionTodo(repo, mode="series").execute(root.uuid)[1]
+        deltas = list(repo.get_series(virtual.series).deltas)
+
+        with pytest.raises(duckdb.IOException):
+            MaterializeOccurrenceUseCase(repo).execute(virtual)
+
+        # Ni clone orphelin, ni occurrence retirée de la série
+        assert db_manager_conn.execute("SELECT count(*) FROM todos").fetchone()[0] == 2
+        assert repo.get_series(virtual.series).deltas == deltas
@@ -393,4 +393,86 @@ def test_repetition_multiple_occurrences_cycle(user_id):
             actual_dt = pendulum.from_timestamp(dates_obtenues[i], tz=tz)
             expected_dt = pendulum.from_timestamp(expected_ts, tz=tz)
             assert dates_obtenues[i] == expected_ts, \
-                f"Occurrence {i+1} incorrecte. Attendu {expected_dt}, obtenu {actual_dt}"
\ No newline at end of file
+                f"Occurrence {i+1} incorrecte. Attendu {expected_dt}, obtenu {actual_dt}"
+
+def test_repetition_loads_subtree_once_and_saves_in_bulk(user_id, mocker):
+    """
+    Le sous-arbre source est lu une seule fois pour toutes les occurrences,
+    et tous les clones sont écrits en une seule insertion groupée.
+    """
+    repo = MemoryTodoRepository()
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+
+    with pendulum.travel_to(now_frozen):
+        root = Todo(title="Root", user=user_id, state=True, date_start=now_frozen.int_timestamp,
+                    frequency="mardi et jeudi pendant 2 semaines")
+        repo.save(root)
+        child = Todo(title="C1", user=user_id, parent=root.uuid, date_start=now_frozen.int_timestamp)
+        repo.save(child)
+        repo.save(Todo(title="GC1", user=user_id, parent=child.uuid, date_start=now_frozen.int_timestamp))
+
+        find_descendants = mocker.spy(repo, "find_descendants")
+        find_by_parent = mocker.spy(repo, "find_by_parent")
+        save_all = mocker.spy(repo, "save_all")
+        save = mocker.spy(repo, "save")
+
+        result = RepetitionTodo(repo).execute(root.uuid)
+
+    # 4 occurrences x (racine + enfant + petit-enfant)
+    assert len(result) == 12
+    assert find_descendants.call_count == 1
+    assert save_all.call_count == 1
+    # Pas de lecture enfant par enfant ni de sauvegarde ligne à ligne côté use case
+    assert find_by_parent.call_count == 0
+    assert save.call_count == len(result)
+    new_roots = [t for t in result if t.parent is None]
+    for new_root in new_roots:
+        new_child = next(t for t in result if t.parent == new_root.uuid)
+        assert next(t for t in result if t.parent == new_child.uuid).title == "GC1"
+
+
+def test_repetition_with_duckdb_repository(repo, user_id):
+    """Intégration : clonage du sous-arbre via la requête récursive et l'insertion groupée DuckDB."""
+    tz = pendulum.local_timezone()
+    start = pendulum.now(tz=tz).add(days=1)
+    root = Todo(title="Root", user=user_id, state=True, date_start=start.int_timestamp,
+                frequency=start.add(days=2).to_date_string())
+    repo.save(root)
+    child = Todo(title="Child", user=user_id, parent=root.uuid, date_start=start.int_timestamp)
+    repo.save(child)
+    repo.save(Todo(title="Grandchild", user=user_id, parent=child.uuid, date_start=start.int_timestamp))
+
+    result = RepetitionTodo(repo).execute(root.uuid)
+
+    new_root = next(t for t in result if t.parent is None)
+    new_child = repo.find_by_parent(new_root.uuid)
+    assert [t.title for t in new_child] == ["Child"]
+    assert [t.title for t in repo.find_by_parent(new_child[0].uuid)] == ["Grandchild"]
+
+
+@pytest.mark.parametrize("threshold, expect_server_side", [(0, True), (10_000, False)])
+def test_repetition_switches_to_server_side_clone(repo, user_id, mocker, threshold, expect_server_side):
+    """Au-delà du seuil, le clonage est délégué au dépôt et seules les nouvelles racines sont retournées."""
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+
+    with pendulum.travel_to(now_frozen):
+        root = Todo(title="Root", user=user_id, state=True, date_start=now_frozen.int_timestamp,
+                    frequency="mardi et jeudi pendant 2 semaines")
+        repo.save(root)
+        child = Todo(title="C1", user=user_id, parent=root.uuid, date_start=now_frozen.int_timestamp)
+        repo.save(child)
+        clone_subtree = mocker.spy(repo, "clone_subtree")
+        save_all = mocker.spy(repo, "save_all")
+
+        result = RepetitionTodo(repo, server_side_threshold=threshold).execute(root.uuid)
+
+    assert clone_subtree.call_count == int(expect_server_side)
+    assert save_all.call_count == int(not expect_server_side)
+    new_roots = [t for t in result if t.parent is None]
+    assert len(new_roots) == 4
+    assert len(result) == (4 if expect_server_side else 8)
+    # Dans les deux cas, chaque nouvelle racine a bien son enfant en base
+    for new_root in new_roots:
+        assert [t.title for t in repo.find_by_parent(new_root.uuid)] == ["C1"]
@@ -0,0 +1,82 @@
+import duckdb
+import pendulum
+import pytest
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.application.use_cases.todo_repetition import RepetitionTodo
+from todo_bene.application.use_cases.todo_series_horizon import extend_series_horizon
+from todo_bene.application.use_cases.todo_find_top_level_by_user import apply_auto_postpone
+from todo_bene.infrastructure.persistence.memory.memory_todo_repository import MemoryTodoRepository
+
+
+def _repeat_daily_with_horizon(repo, user_id, now, horizon=5):
+    root = Todo(title="Root", user=user_id, state=True, date_start=now.int_timestamp,
+                frequency="tous les jours pendant 1 an")
+    repo.save(root)
+    repo.save(Todo(title="Child", user=user_id, parent=root.uuid, date_start=now.int_timestamp))
+    return RepetitionTodo(repo, mode="horizon", horizon=horizon).execute(root.uuid)
+
+
+def test_horizon_mode_materializes_only_next_occurrences(repo, user_id):
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+    with pendulum.travel_to(now_frozen):
+        new_roots = _repeat_daily_with_horizon(repo, user_id, now_frozen)
+
+        assert [t.date_start for t in new_roots] == [now_frozen.add(days=d).int_timestamp for d in range(1, 6)]
+        for new_root in new_roots:
+            assert [t.title for t in repo.find_by_parent(new_root.uuid)] == ["Child"]
+        # Pas d'occurrence virtuelle : seules les 5 racines écrites sont listées
+        assert len(repo.find_top_level_by_user(user_id)) == 5
+        [series] = repo.find_series_by_user(user_id)
+        assert (series.horizon, series.materialized) == (5, 5)
+        # Rien à compléter le jour même
+        assert extend_series_horizon(repo, user_id) == 0
+
+
+def test_horizon_is_topped_up_by_daily_pass(user_id, mocker):
+    repo = MemoryTodoRepository()
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+    with pendulum.travel_to(now_frozen):
+        _repeat_daily_with_horizon(repo, user_id, now_frozen)
+
+    mocker.patch(
+        "todo_bene.application.use_cases.todo_find_top_level_by_user.get_last_postpone_date",
+        return_value=None,
+    )
+    mocker.patch("todo_bene.application.use_cases.todo_find_top_level_by_user.update_last_postpone_date")
+    three_days_later = now_frozen.add(days=3)
+    with pendulum.travel_to(three_days_later):
+        apply_auto_postpone(repo, user_id)
+
+        # 5 occurrences à venir sont de nouveau matérialisées (du 08/01 au 12/01)
+        [series] = repo.find_series_by_user(user_id)
+        assert series.materialized == 7
+        upcoming = [t for t in repo.find_top_level_by_user(user_id) if t.date_start >= three_days_later.int_timestamp]
+        assert len(upcoming) == 5
+        assert max(t.date_start for t in upcoming) == now_frozen.add(days=7).int_timestamp
+
+
+def test_horizon_top_up_is_atomic_when_series_save_fails(repo, user_id, monkeypatch):
+    tz = pendulum.local_timezone()
+    now_frozen = pendulum.datetime(2026, 1, 5, 10, 0, tz=tz)
+    with pendulum.travel_to(now_frozen):
+        _repeat_daily_with_horizon(repo, user_id, now_frozen)
+    count_todos = "SELECT count(*) FROM todos"
+    before = repo._conn.execute(count_todos).fetchone()[0]
+
+    def disk_full(series):
+        raise duckdb.IOException("échec simulé")
+
+    with pendulum.travel_to(now_frozen.add(days=3)):
+        with monkeypatch.context() as patch:
+            patch.setattr(repo, "save_series", disk_full)
+            with pytest.raises(duckdb.IOException):
+                extend_series_horizon(repo, user_id)
+
+        # Aucune occurrence validée sans son compteur : la passe suivante ne crée pas de doublons
+        assert repo._conn.execute(count_todos).fetchone()[0] == before
+        assert repo.find_series_by_user(user_id)[0].materialized == 5
+        assert extend_series_horizon(repo, user_id) == 2
+        assert repo.find_series_by_user(user_id)[0].materialized == 7
@@ -0,0 +1,71 @@
+import pendulum
+
+from todo_bene.domain.services.frequency_cache import FrequencyParseCache, is_anchor_independent
+from todo_bene.domain.services.frequency_parser import FrequencyParser
+
+
+def test_anchor_independence_detection():
+    assert is_anchor_independent("today@weekly#1mon@∞")
+    assert is_anchor_independent("today@daily#1d@+15d")
+    assert is_anchor_independent("unknown")
+    # Ancre calculée à partir du jour courant
+    assert not is_anchor_independent("2026-02-24@daily#1d@1")
+    # Limite 'jusqu'à' résolue en date
+    assert not is_anchor_independent("today@daily#1d@2026-12-31")
+
+
+def test_parser_reuses_cached_result(mocker):
+    parser = FrequencyParser(language="fr", cache=FrequencyParseCache())
+    spy = mocker.spy(parser, "_parse")
+
+    assert parser.parse("Tous les lundis") == "today@weekly#1mon@∞"
+    assert parser.parse("  tous les LUNDIS ") == "today@weekly#1mon@∞"
+    assert spy.call_count == 1
+
+
+def test_cache_key_includes_language():
+    cache = FrequencyParseCache()
+    FrequencyParser(language="fr", cache=cache).parse("Chaque mois")
+    assert cache.get("en", "Chaque mois", "2026-02-19") is None
+    assert cache.get("fr", "Chaque mois", "2026-02-19") == "today@monthly#1m@∞"
+
+
+def test_anchor_dependent_result_not_reused_next_day():
+    cache = FrequencyParseCache()
+    parser = FrequencyParser(language="fr", cache=cache)
+    tz = pendulum.local_timezone()
+
+    with pendulum.travel_to(pendulum.datetime(2026, 2, 19, tz=tz)):
+        assert parser.parse("Mercredi") == "2026-02-24@daily#1d@1"
+    with pendulum.travel_to(pendulum.datetime(2026, 2, 26, tz=tz)):
+        assert parser.parse("Mercredi") == "2026-03-03@daily#1d@1"
+
+
+def test_disk_store_persists_only_anchor_independent_results(tmp_path):
+    path = tmp_path / "frequency_cache.json"
+    cache = FrequencyParseCache(path=path)
+    cache.put("fr", "Tous les lundis", "2026-02-19", "today@weekly#1mon@∞")
+    cache.put("fr", "Mercredi", "2026-02-19", "2026-02-24@daily#1d@1")
+
+    reloaded = FrequencyParseCache(path=path)
+    assert reloaded.get("fr", "tous les lundis", "2030-01-01") == "today@weekly#1mon@∞"
+    assert reloaded.get("fr", "Mercredi", "2026-02-19") is None
+
+
+def test_disk_store_corrupted_file_is_ignored(tmp_path):
+    path = tmp_path / "frequency_cache.json"
+    path.write_text("{pas du json")
+    cache = FrequencyParseCache(path=path)
+    assert cache.get("fr", "Chaque mois", "2026-02-19") is None
+    cache.put("fr", "Chaque mois", "2026-02-19", "today@monthly#1m@∞")
+    assert FrequencyParseCache(path=path).get("fr", "Chaque mois", "2026-02-19") == "today@monthly#1m@∞"
+
+
+def test_lru_eviction():
+    cache = FrequencyParseCache(maxsize=2)
+    cache.put("fr", "a", "d", "today@daily#1d@∞")
+    cache.put("fr", "b", "d", "today@daily#2d@∞")
+    cache.get("fr", "a", "d")
+    cache.put("fr", "c", "d", "today@daily#3d@∞")
+    assert cache.get("fr", "b", "d") is None
+    assert cache.get("fr", "a", "d") == "today@daily#1d@∞"
@@ -195,6 +195,60 @@ def test_frequency_parser_mixed_units_arbitration():
     # Limite : pendant 3 mois -> @+3m
     assert parser.parse("Toutes les 2 semaines pendant 3 mois") == "today@weekly#2w@+3m"
 
+def test_frequency_parser_shift_english_single_pass():
+    parser = FrequencyParser(language="en")
+    # 'postponed' -> '|shift' ne doit pas être ré-analysé par la clé 'shift'
+    assert parser._normalize("every monday postponed") == "every mon |shift"
+    assert parser.parse("The last friday of the quarter, shift if holiday") == "today@quarter#lastfri@∞|next_workday"
+
+def test_frequency_parser_lexicon_compiled_once_per_language():
+    # Le lexique compilé est partagé entre toutes les instances d'une même langue
+    parser_a = FrequencyParser(language="fr")
+    parser_b = FrequencyParser(language="fr")
+    parser_en = FrequencyParser(language="en")
+    assert parser_a._lexicon_pattern is parser_b._lexicon_pattern
+    assert parser_a._lexicon_pattern is not parser_en._lexicon_pattern
+
+def test_frequency_parser_normalize_longest_key_first():
+    parser = FrequencyParser(language="fr")
+    # 'jour ouvré' doit l'emporter sur 'jour', et les stopwords disparaissent
+    assert parser._normalize("Le deuxième jour ouvré du mois") == "2 workday m"
+    assert parser._normalize("Tous les jours sauf le dimanche") == "every d ! sun"
+
+def test_frequency_parser_plugin_extractor_registration():
+    from todo_bene.domain.services.extractors import BaseExtractor, get_extractors, unregister_extractor
+
+    parser = FrequencyParser(language="en")
+    assert parser.parse("Every blue moon") == "unknown"
+
+    class BlueMoonExtractor(BaseExtractor):
+        priority = 1
+        keywords = ("blue moon",)
+
+        def extract(self, text: str):
+            return ("yearly#1stday", "∞")
+
+    try:
+        # Le parser existant voit le plugin sans re-scanner les sous-classes, et le cache est invalidé
+        assert get_extractors()[0].__class__ is BlueMoonExtractor
+        assert parser.parse("Every blue moon") == "today@yearly#1stday@∞"
+        # Préfiltre : sans le mot-clé, le plugin n'est pas interrogé
+        assert parser.parse("Every monday") == "today@weekly#1mon@∞"
+    finally:
+        unregister_extractor(BlueMoonExtractor)
+    assert parser.parse("Every blue moon") == "unknown"
+
+def test_frequency_parser_extractor_prefilter_skips_candidates(mocker):
+    from todo_bene.domain.services.extractors import SequenceExtractor
+    from todo_bene.domain.services.frequency_cache import FrequencyParseCache
+
+    parser = FrequencyParser(language="fr", cache=FrequencyParseCache())
+    spy = mocker.spy(SequenceExtractor, "extract")
+    assert parser.parse("Tous les lundis") == "today@weekly#1mon@∞"
+    assert parser.parse("1, 2, 4 jours") == "today@sequence#1,2,4d@3"
+    # SequenceExtractor n'a tourné que pour le texte contenant une virgule
+    assert spy.call_count == 1
+
 # advanced cases
 
 def test_parse_specific_yearly_position():
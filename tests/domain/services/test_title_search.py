@@ -0,0 +1,68 @@
+import pytest
+
+from uuid import uuid4
+
+from todo_bene.domain.services.title_search import (
+    TitleEntry,
+    TitleIndex,
+    match_score,
+    normalize_title,
+    trigrams,
+)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Réunion Projet", "reunion projet"),
+    ("Tâche « l'Œuvre » n°2", "tache l oeuvre n 2"),
+    ("  ", ""),
+])
+def test_normalize_title(raw, expected):
+    assert normalize_title(raw) == expected
+
+
+def test_trigrams_are_padded_per_word():
+    assert trigrams("Été") == {"  e", " et", "ete", "te "}
+    assert trigrams("") == set()
+
+
+@pytest.mark.parametrize("term, title, expected_min", [
+    ("projet", "Projet Alpha", 1.0),  # Mot complet
+    ("reunoin", "Réunion d'équipe", 0.5),  # Faute de frappe + accent
+    ("medecin", "Médecin traitant", 1.0),  # Accent
+])
+def test_match_score_tolerates_typos_and_accents(term, title, expected_min):
+    assert match_score(term, title) >= expected_min
+
+
+def test_match_score_rejects_unrelated_titles():
+    assert match_score("facture", "Arroser le jardin") < 0.5
+    assert match_score("", "Arroser le jardin") == 0.0
+
+
+@pytest.fixture
+def title_index():
+    titles = ["Arroser le jardin", "Réunion d'équipe", "Préparer la réunion", "Facture EDF", "Réunion"]
+    return TitleIndex([TitleEntry(uuid4(), title, "Travail") for title in titles])
+
+
+def test_title_index_ranks_prefix_then_word_start(title_index):
+    assert [e.title for e in title_index.search("reunion")] == [
+        "Réunion", "Réunion d'équipe", "Préparer la réunion",
+    ]
+
+
+def test_title_index_refines_incrementally(title_index):
+    for typed in ("f", "fa", "fac", "fact"):
+        results = title_index.search(typed)
+    assert [e.title for e in results] == ["Facture EDF"]
+    # Le résultat précédent est mis en cache et sert de base au filtrage suivant
+    assert "fac" in title_index._matches_cache
+
+
+def test_title_index_falls_back_on_typos(title_index):
+    assert "Réunion" in [e.title for e in title_index.search("reunoin")]
+
+
+def test_title_index_empty_term_lists_entries(title_index):
+    assert len(title_index.search("", limit=3)) == 3
+    assert title_index.search("zzzz") == []
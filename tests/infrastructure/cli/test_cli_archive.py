@@ -0,0 +1,80 @@
+import duckdb
+import pendulum
+from rich.text import Text
+from typer.testing import CliRunner
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.cli.main import app
+from todo_bene.infrastructure.config import get_archive_dir, get_last_archive_date, load_full_config, save_full_config, save_user_config
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+from todo_bene.infrastructure.persistence.duckdb.todo_archive import DuckDBTodoArchive
+
+runner = CliRunner()
+OLD = pendulum.datetime(2025, 3, 10, 12).int_timestamp
+
+
+def _setup(user_id, setup_test_env):
+    db_path = str(setup_test_env["db"])
+    save_user_config(user_id, db_path, "test_profile")
+    with DuckDBConnectionManager(db_path) as conn:
+        repo = DuckDBTodoRepository(conn)
+        repo.save(Todo(title="Déclaration", user=user_id, state=True, date_start=OLD - 3600, date_due=OLD))
+        repo.save(Todo(title="En cours", user=user_id))
+    return db_path
+
+
+def test_archive_command_moves_completed_todos(user_id, setup_test_env):
+    _setup(user_id, setup_test_env)
+
+    result = runner.invoke(app, ["archive", "--days", "30"])
+    assert result.exit_code == 0, result.output
+    assert "2025-03" in Text.from_ansi(result.stdout).plain
+    assert list(get_archive_dir().glob("month=2025-03/*.parquet"))
+
+    stats = runner.invoke(app, ["archive", "--stats"])
+    assert "2025-03" in Text.from_ansi(stats.stdout).plain
+    # list-dev lit aussi l'archive
+    listing = Text.from_ansi(runner.invoke(app, ["list-dev"]).stdout).plain
+    assert "Déclaration" in listing and "En cours" in listing
+
+
+def test_automatic_archive_runs_once_a_day(user_id, setup_test_env):
+    db_path = _setup(user_id, setup_test_env)
+    config = load_full_config()
+    config["profiles"]["test_profile"]["archive_after_days"] = 30
+    save_full_config(config)
+
+    with DuckDBConnectionManager(db_path) as conn:
+        titles = [row[0] for row in conn.execute("SELECT title FROM todos").fetchall()]
+    assert "Déclaration" in titles
+
+    result = runner.invoke(app, ["list", "-p", "all"], input="q\n")
+    assert result.exit_code == 0, result.output
+    assert get_last_archive_date() == pendulum.now().to_date_string()
+    with DuckDBConnectionManager(db_path) as conn:
+        assert [row[0] for row in conn.execute("SELECT title FROM todos").fetchall()] == ["En cours"]
+
+
+def test_failed_automatic_archive_does_not_block_commands(user_id, setup_test_env, monkeypatch):
+    db_path = _setup(user_id, setup_test_env)
+    config = load_full_config()
+    config["profiles"]["test_profile"]["archive_after_days"] = 30
+    save_full_config(config)
+
+    def disk_full(self, *args):
+        raise duckdb.IOException("No space left on device")
+
+    monkeypatch.setattr(DuckDBTodoArchive, "archive", disk_full)
+    result = runner.invoke(app, ["list", "-p", "all"], input="q\n")
+    assert result.exit_code == 0, result.output
+    # Nouvel essai au prochain lancement, rien n'a quitté la base
+    assert get_last_archive_date() is None
+    with DuckDBConnectionManager(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM todos").fetchone()[0] == 2
+
+
+def test_archive_is_unavailable_with_memory_engine(user_id, setup_test_env):
+    _setup(user_id, setup_test_env)
+    result = runner.invoke(app, ["--engine", "memory", "archive"])
+    assert result.exit_code == 1
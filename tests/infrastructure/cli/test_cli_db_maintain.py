@@ -0,0 +1,83 @@
+import os
+
+import duckdb
+from typer.testing import CliRunner
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.cli import main
+from todo_bene.infrastructure.cli.main import app
+from todo_bene.infrastructure.config import save_user_config
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+from todo_bene.infrastructure.persistence.duckdb.maintenance import maintain_database
+
+runner = CliRunner()
+
+
+def test_maintain_compacts_database_and_keeps_data(user_id, setup_test_env):
+    db_path = str(setup_test_env["db"])
+    save_user_config(user_id, db_path, "test_profile")
+    with DuckDBConnectionManager(db_path) as conn:
+        repo = DuckDBTodoRepository(conn)
+        kept = Todo(title="Conservée", user=user_id)
+        repo.save(kept)
+        repo.save_all([Todo(title=f"Éphémère {i}", description="x" * 200, user=user_id) for i in range(5000)])
+        conn.execute("CHECKPOINT")
+        conn.execute("DELETE FROM title_index WHERE todo_id <> ?", [kept.uuid])
+        conn.execute("DELETE FROM todos WHERE uuid <> ?", [kept.uuid])
+    size_before = os.path.getsize(db_path)
+
+    result = runner.invoke(app, ["db", "maintain"])
+    assert result.exit_code == 0, result.output
+    assert "Gain" in result.stdout
+
+    assert os.path.getsize(db_path) < size_before / 2
+    assert not os.path.exists(db_path + ".compact")
+    with DuckDBConnectionManager(db_path) as conn:
+        repo = DuckDBTodoRepository(conn)
+        assert repo.get_by_id(kept.uuid).title == "Conservée"
+        assert [t.title for t in repo.search_by_title(user_id, "Conservée")] == ["Conservée"]
+        assert conn.execute("SELECT count(*) FROM duckdb_indexes() WHERE index_name = 'idx_title_index_todo'").fetchone()[0] == 1
+        assert conn.execute("SELECT max(version) FROM _migrations").fetchone()[0] >= 7
+
+
+def test_maintain_twice_is_stable(setup_test_env):
+    db_path = str(setup_test_env["db"])
+    with DuckDBConnectionManager(db_path):
+        pass
+    first = maintain_database(db_path)
+    second = maintain_database(db_path)
+    assert second.before == first.after
+    assert second.wal_after == 0
+
+
+def test_maintain_reports_failure_without_traceback(user_id, setup_test_env, monkeypatch):
+    save_user_config(user_id, str(setup_test_env["db"]), "test_profile")
+
+    def locked(db_path):
+        raise duckdb.IOException("Could not set lock on file")
+
+    monkeypatch.setattr(main, "maintain_database", locked)
+    result = runner.invoke(app, ["db", "maintain"])
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Could not set lock" in result.stdout
+
+
+def test_maintain_puts_title_index_back_in_trigram_order(user_id, setup_test_env):
+    db_path = str(setup_test_env["db"])
+    save_user_config(user_id, db_path, "test_profile")
+    with DuckDBConnectionManager(db_path) as conn:
+        repo = DuckDBTodoRepository(conn)
+        # Ajouts successifs : chaque save() range ses trigrammes en fin de table
+        for title in ["Zèbre", "Yaourt", "Abricot"]:
+            repo.save(Todo(title=title, user=user_id))
+        stored = [row[0] for row in conn.execute("SELECT trigram FROM title_index").fetchall()]
+        assert stored != sorted(stored)
+
+    maintain_database(db_path)
+
+    with DuckDBConnectionManager(db_path) as conn:
+        stored = [row[0] for row in conn.execute("SELECT trigram FROM title_index").fetchall()]
+        assert stored == sorted(stored)
+        assert [t.title for t in DuckDBTodoRepository(conn).search_by_title(user_id, "abricto")] == ["Abricot"]
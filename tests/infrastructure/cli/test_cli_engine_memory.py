@@ -0,0 +1,36 @@
+from rich.text import Text
+from typer.testing import CliRunner
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.cli.main import app
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+
+runner = CliRunner()
+
+
+def test_memory_engine_works_on_a_snapshot(user_id, monkeypatch, setup_test_env):
+    db_path = str(setup_test_env["db"])
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, db_path, "test_profile"),
+    )
+    with DuckDBConnectionManager(db_path) as conn:
+        DuckDBTodoRepository(conn).save(Todo(title="Persistante", user=user_id))
+    env = {"TODO_BENE_CONFIG_PATH": str(setup_test_env["config"])}
+
+    result = runner.invoke(app, ["--engine", "memory", "add", "Éphémère"], env=env)
+    assert result.exit_code == 0
+
+    listing = runner.invoke(app, ["--engine", "memory", "list", "-p", "all"], input="q\n", env=env)
+    output = Text.from_ansi(listing.stdout).plain
+    assert "Persistante" in output
+    # L'ajout précédent n'a touché que la copie en mémoire
+    assert "Éphémère" not in output
+    with DuckDBConnectionManager(db_path) as conn:
+        assert [t.title for t in DuckDBTodoRepository(conn).find_top_level_by_user(user_id)] == ["Persistante"]
+
+
+def test_unknown_engine_is_rejected(setup_test_env):
+    result = runner.invoke(app, ["--engine", "sqlite", "list"])
+    assert result.exit_code != 0
@@ -0,0 +1,53 @@
+from typer.testing import CliRunner
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.cli.main import TitleCompleter, app
+from todo_bene.domain.services.title_search import TitleIndex
+
+from prompt_toolkit.document import Document
+
+runner = CliRunner()
+
+
+def test_find_opens_best_match(repository, user_id, monkeypatch, test_config_env, mock_prompt_session):
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, "dev.db", "test_profile"),
+    )
+    repository.save(Todo(title="Projet Alpha", user=user_id, description="Détail alpha"))
+    repository.save(Todo(title="Projet Beta", user=user_id))
+
+    result = runner.invoke(
+        app, ["find"], input="alpha\nr\n", env={"TODO_BENE_CONFIG_PATH": str(test_config_env)}
+    )
+
+    assert result.exit_code == 0
+    assert "Détail alpha" in result.stdout
+
+
+def test_find_completions_come_from_memory_index(repository, user_id):
+    parent = Todo(title="Projet Alpha", user=user_id)
+    child = Todo(title="Relire le rapport", user=user_id, parent=parent.uuid)
+    repository.save(parent)
+    repository.save(child)
+    completer = TitleCompleter(TitleIndex(repository.find_title_entries(user_id)))
+
+    completions = list(completer.get_completions(Document("rapport"), None))
+
+    assert [c.text for c in completions] == [f"Relire le rapport #{str(child.uuid)[:8]}"]
+    assert "Projet Alpha" in completions[0].display_meta_text
+
+
+def test_find_reports_no_match(repository, user_id, monkeypatch, test_config_env, mock_prompt_session):
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, "dev.db", "test_profile"),
+    )
+    repository.save(Todo(title="Projet Alpha", user=user_id))
+
+    result = runner.invoke(
+        app, ["find"], input="zzzz\n", env={"TODO_BENE_CONFIG_PATH": str(test_config_env)}
+    )
+
+    assert result.exit_code == 0
+    assert "Aucun Todo ne correspond" in result.stdout
@@ -0,0 +1,53 @@
+import pendulum
+from rich.text import Text
+from typer.testing import CliRunner
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.cli.main import app
+
+runner = CliRunner()
+
+
+def test_list_month_shows_week_headers(repository, user_id, monkeypatch, test_config_env):
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, "dev.db", "test_profile"),
+    )
+    tz = pendulum.local_timezone()
+    with pendulum.travel_to(pendulum.datetime(2026, 10, 6, 8, 0, tz=tz), freeze=True):
+        for day in (6, 7, 14):
+            due = pendulum.datetime(2026, 10, day, 18, 0, tz=tz)
+            repository.save(Todo(title=f"Tâche du {day}", user=user_id,
+                                 date_start=due.int_timestamp - 3600, date_due=due.int_timestamp))
+
+        result = runner.invoke(app, ["list", "-p", "month"], input="q\n",
+                               env={"TODO_BENE_CONFIG_PATH": str(test_config_env)})
+
+    output = Text.from_ansi(result.stdout).plain
+    assert result.exit_code == 0
+    assert output.count("SEMAINE") == 2
+    assert "SEMAINE 41 (05/10)" in output
+    assert "SEMAINE 42 (12/10)" in output
+
+
+def test_list_pages_with_next_and_previous(repository, user_id, monkeypatch, test_config_env):
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, "dev.db", "test_profile"),
+    )
+    monkeypatch.setattr("todo_bene.infrastructure.cli.main._list_page_size", lambda: 5)
+    for i in range(12):
+        repository.save(Todo(title=f"Tâche {i:02}", user=user_id, date_start=1000 + i, date_due=2000 + i))
+
+    result = runner.invoke(app, ["list", "-p", "all"], input="n\nn\np\n",
+                           env={"TODO_BENE_CONFIG_PATH": str(test_config_env)})
+
+    output = Text.from_ansi(result.stdout).plain
+    assert result.exit_code == 0
+    assert "Tâches racines 1 à 5" in output
+    before_last, after_last = output.split("Tâches racines 11 à 12")
+    # Dernière page : les 2 dernières tâches, sans page suivante
+    assert "Tâche 11" in before_last.split("Tâches racines 6 à 10")[1]
+    assert "Page suivante" not in after_last.split("Saisissez")[0]
+    # Retour en arrière : la page 6 à 10 est réaffichée
+    assert "Tâches racines 6 à 10" in after_last
@@ -0,0 +1,30 @@
+import pstats
+
+from typer.testing import CliRunner
+
+from todo_bene.infrastructure.cli.main import app
+
+runner = CliRunner()
+
+
+def test_cli_profile_writes_pstats_and_collapsed_stacks(user_id, monkeypatch, setup_test_env):
+    db_path = str(setup_test_env["db"])
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, db_path, "test_profile"),
+    )
+    env = {"TODO_BENE_CONFIG_PATH": str(setup_test_env["config"])}
+
+    result = runner.invoke(app, ["--profile", "add", "Profilée"], env=env)
+    assert result.exit_code == 0
+
+    profile_dir = setup_test_env["config"].parent / "profiles"
+    [pstats_path] = profile_dir.glob("tb-add-*.pstats")
+    [collapsed_path] = profile_dir.glob("tb-add-*.collapsed")
+    assert str(pstats_path) in result.stdout.replace("\n", "")
+
+    functions = {name for _, _, name in pstats.Stats(str(pstats_path)).stats}
+    assert "create" in functions
+    for line in collapsed_path.read_text(encoding="utf-8").splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and stack
@@ -0,0 +1,60 @@
+import json
+
+import duckdb
+from rich.text import Text
+from typer.testing import CliRunner
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.cli.main import app
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+from todo_bene.infrastructure.persistence.duckdb.profiled_connection import (
+    ProfiledConnection,
+    QueryProfiler,
+    fingerprint,
+)
+
+runner = CliRunner()
+
+
+def test_fingerprint_masks_literals():
+    assert fingerprint("SELECT *  FROM t\n WHERE a = 'x' AND b > 42") == "SELECT * FROM t WHERE a = ? AND b > ?"
+
+
+def test_profiled_connection_counts_statements_and_rows():
+    profiler = QueryProfiler()
+    conn = ProfiledConnection(duckdb.connect(), profiler)
+    conn.execute("CREATE TABLE t (a INTEGER)")
+    for value in (1, 2, 3):
+        conn.execute("INSERT INTO t VALUES (?)", [value])
+    assert conn.execute("SELECT a FROM t WHERE a > 1").fetchall() == [(2,), (3,)]
+    assert conn.execute("SELECT a FROM t WHERE a > 2").fetchall() == [(3,)]
+
+    stats = {s.fingerprint: s for s in profiler.summary()}
+    assert stats["INSERT INTO t VALUES (?)"].count == 3
+    select = stats["SELECT a FROM t WHERE a > ?"]
+    assert (select.count, select.rows) == (2, 3)
+    assert profiler.total_count == 6
+
+
+def test_cli_profile_db_prints_summary_and_appends_jsonl(user_id, monkeypatch, setup_test_env):
+    db_path = str(setup_test_env["db"])
+    monkeypatch.setattr(
+        "todo_bene.infrastructure.cli.main.load_user_info",
+        lambda: (user_id, db_path, "test_profile"),
+    )
+    with DuckDBConnectionManager(db_path) as conn:
+        DuckDBTodoRepository(conn).save(Todo(title="Mesurée", user=user_id))
+    env = {"TODO_BENE_CONFIG_PATH": str(setup_test_env["config"])}
+
+    result = runner.invoke(app, ["--profile-db", "list", "-p", "all"], input="q\n", env=env)
+    output = Text.from_ansi(result.stdout).plain
+    assert result.exit_code == 0
+    assert "Requêtes SQL de 'tb list'" in output
+
+    log_path = setup_test_env["config"].parent / "query_profile.jsonl"
+    assert not log_path.exists()
+    runner.invoke(app, ["list", "-p", "all"], input="q\n", env={**env, "TODO_BENE_PROFILE_DB": "jsonl"})
+    entry = json.loads(log_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["command"] == "list"
+    assert sum(s["count"] for s in entry["statements"]) > 0
@@ -0,0 +1,141 @@
+import duckdb
+import pytest
+from uuid import uuid4
+
+from todo_bene.infrastructure.config import (
+    get_crypto_needs_httpfs,
+    get_db_encrypted,
+    get_or_create_master_key,
+    save_db_encrypted,
+    save_user_config,
+)
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+
+
+@pytest.fixture
+def encrypted_db(setup_test_env):
+    """Base chiffrée avec la clé maître, créée hors du manager (sans httpfs : crypto intégré non sûr, test seulement)."""
+    db_path = str(setup_test_env["db"])
+    conn = duckdb.connect()
+    conn.execute("SET force_mbedtls_unsafe = 'true'")
+    conn.execute(f"ATTACH '{db_path}' AS enc_db (ENCRYPTION_KEY '{get_or_create_master_key().decode()}')")
+    conn.execute("CREATE TABLE enc_db.notes AS SELECT 'secret' AS body")
+    conn.close()
+    save_user_config(uuid4(), db_path, "test_profile")
+    return db_path
+
+
+class _ConnectSpy:
+    """Compte les ouvertures directes (en clair) du fichier de la base."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.plain_opens = 0
+        self._connect = duckdb.connect
+
+    def __call__(self, database=":memory:", *args, **kwargs):
+        if database == self.db_path:
+            self.plain_opens += 1
+        return self._connect(database, *args, **kwargs)
+
+
+def test_encrypted_database_is_remembered_and_attached_directly(encrypted_db, monkeypatch):
+    spy = _ConnectSpy(encrypted_db)
+    monkeypatch.setattr(duckdb, "connect", spy)
+    assert get_db_encrypted(encrypted_db) is None
+
+    with DuckDBConnectionManager(encrypted_db, read_only=True) as conn:
+        assert conn.execute("SELECT body FROM notes").fetchone()[0] == "secret"
+    assert get_db_encrypted(encrypted_db) is True
+    assert spy.plain_opens == 1
+
+    # Ouvertures suivantes : plus d'essai en clair voué à l'échec
+    with DuckDBConnectionManager(encrypted_db, read_only=True) as conn:
+        assert conn.execute("SELECT body FROM notes").fetchone()[0] == "secret"
+    assert spy.plain_opens == 1
+
+
+def test_plain_database_is_remembered(setup_test_env):
+    db_path = str(setup_test_env["db"])
+    save_user_config(uuid4(), db_path, "test_profile")
+    with DuckDBConnectionManager(db_path):
+        pass
+    assert get_db_encrypted(db_path) is False
+
+
+def test_stale_encrypted_flag_falls_back_to_plain_open(setup_test_env):
+    db_path = str(setup_test_env["db"])
+    save_user_config(uuid4(), db_path, "test_profile")
+    with DuckDBConnectionManager(db_path):
+        pass
+    save_db_encrypted(db_path, True)
+
+    with DuckDBConnectionManager(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM _migrations").fetchone()[0] > 0
+    assert get_db_encrypted(db_path) is False
+
+
+def test_crypto_extension_is_installed_only_when_not_cached():
+    class FakeConnection:
+        def __init__(self, cached):
+            self.cached = cached
+            self.calls = []
+
+        def load_extension(self, name):
+            self.calls.append(("load", name))
+            if not self.cached:
+                raise duckdb.IOException("extension absente du cache")
+
+        def install_extension(self, name):
+            self.calls.append(("install", name))
+            self.cached = True
+
+    manager = DuckDBConnectionManager("unused.db")
+    manager.conn = FakeConnection(cached=True)
+    manager._load_crypto_extension()
+    assert manager.conn.calls == [("load", "httpfs")]
+
+    manager.conn = FakeConnection(cached=False)
+    manager._load_crypto_extension()
+    assert manager.conn.calls == [("load", "httpfs"), ("install", "httpfs"), ("load", "httpfs")]
+
+
+class _CryptoConnection:
+    """Connexion simulée : l'ATTACH en écriture d'une base chiffrée exige httpfs si `needs_httpfs`."""
+
+    def __init__(self, needs_httpfs):
+        self.needs_httpfs = needs_httpfs
+        self.httpfs = False
+        self.calls = []
+
+    def load_extension(self, name):
+        self.calls.append("load")
+        self.httpfs = True
+
+    def execute(self, query):
+        if query.startswith("ATTACH"):
+            self.calls.append("attach")
+            if "READ_WRITE" in query and self.needs_httpfs and not self.httpfs:
+                raise duckdb.InvalidInputException("read-only crypto module loaded")
+
+
+@pytest.mark.parametrize("needs_httpfs", [True, False])
+def test_httpfs_need_is_checked_once_per_duckdb_version(needs_httpfs, monkeypatch):
+    connections = []
+
+    def connect(*args, **kwargs):
+        connections.append(_CryptoConnection(needs_httpfs))
+        return connections[-1]
+
+    monkeypatch.setattr(duckdb, "connect", connect)
+    assert get_crypto_needs_httpfs(duckdb.__version__) is None
+
+    DuckDBConnectionManager("enc.db")._attach_encrypted()
+    assert get_crypto_needs_httpfs(duckdb.__version__) is needs_httpfs
+
+    # Ouvertures suivantes : httpfs chargé d'office s'il faut, jamais sinon ; plus d'ATTACH refusé
+    DuckDBConnectionManager("enc.db")._attach_encrypted()
+    assert connections[1].calls == (["load", "attach"] if needs_httpfs else ["attach"])
+    # La lecture seule n'en a jamais besoin
+    DuckDBConnectionManager("enc.db", read_only=True)._attach_encrypted()
+    assert connections[2].calls == ["attach"]
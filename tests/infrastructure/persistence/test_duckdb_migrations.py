@@ -0,0 +1,58 @@
+from pathlib import Path
+from uuid import uuid4
+
+import duckdb
+
+from todo_bene.infrastructure.persistence.duckdb import duckdb_connection_manager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+
+MIGRATIONS = Path(duckdb_connection_manager.__file__).parent / "migrations"
+
+
+def _legacy_database(db_path: str, last_version: int) -> duckdb.DuckDBPyConnection:
+    """Base au schéma d'une version antérieure (migrations appliquées jusqu'à last_version)."""
+    manager = DuckDBConnectionManager(db_path)
+    manager.conn = duckdb.connect(db_path)
+    manager._ensure_migration_table()
+    for path in sorted(MIGRATIONS.glob("*.sql")):
+        version = int(path.name.split("_")[0])
+        if version <= last_version:
+            manager.conn.execute(path.read_text())
+            manager.conn.execute("INSERT INTO _migrations (version, name) VALUES (?, ?)", [version, path.name])
+    return manager.conn
+
+
+def test_migration_007_converts_dates_to_bigint_and_keeps_rows(setup_test_env, user_id):
+    db_path = str(setup_test_env["db"])
+    parent, child = uuid4(), uuid4()
+    conn = _legacy_database(db_path, 6)
+    conn.execute(
+        """
+        INSERT INTO todos VALUES
+            (?, 'Parent', 'desc', 'Travail', false, true, 1770000000.4, 1770003600.6, ?, NULL, 'chaque mois', NULL),
+            (?, 'Enfant', NULL, NULL, NULL, NULL, 1770000100, 1770000200, ?, ?, NULL, 1770000300)
+        """,
+        [parent, user_id, child, user_id, parent],
+    )
+    conn.execute("INSERT INTO title_index SELECT uuid, user_id, unnest(trigrams_of(title)) FROM todos")
+    conn.close()
+
+    with DuckDBConnectionManager(db_path) as conn:
+        types = dict(conn.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'todos'"
+        ).fetchall())
+        repo = DuckDBTodoRepository(conn)
+        migrated_parent = repo.get_by_id(parent)
+        migrated_child = repo.get_by_id(child)
+        children = repo.find_by_parent(parent)
+        trigrams = conn.execute("SELECT count(*) FROM title_index").fetchone()[0]
+
+    assert types["date_start"] == types["date_due"] == types["date_final"] == "BIGINT"
+    assert (migrated_parent.date_start, migrated_parent.date_due) == (1770000000, 1770003601)
+    assert (migrated_parent.priority, migrated_parent.frequency, migrated_parent.category) == (True, "chaque mois", "Travail")
+    # Les valeurs absentes prennent les valeurs par défaut du domaine
+    assert (migrated_child.state, migrated_child.priority, migrated_child.category) == (False, False, "Quotidien")
+    assert (migrated_child.parent, migrated_child.date_final) == (parent, 1770000300)
+    assert [t.uuid for t in children] == [child]
+    assert trigrams > 0
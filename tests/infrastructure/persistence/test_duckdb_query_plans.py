@@ -0,0 +1,158 @@
+"""
+Garde-fous sur les plans d'exécution des requêtes des repositories DuckDB.
+
+Chaque méthode est appelée sur une base générée (benchmarks.dataset) à travers une connexion
+qui enregistre ses requêtes ; chacune est ensuite rejouée sous EXPLAIN (ANALYZE, FORMAT JSON)
+dans une transaction annulée. DuckDB ne décide du parcours d'index qu'à l'exécution :
+un EXPLAIN simple affiche toujours 'Sequential Scan'.
+"""
+import json
+
+import pytest
+
+from benchmarks.dataset import DatasetShape, generate, open_database, user_ids
+from todo_bene.infrastructure.persistence.duckdb.duckdb_category_repository import DuckDBCategoryRepository
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+
+SHAPE = DatasetShape(users=2, roots=500, depth=3, fanout=3)
+NESTED_LOOPS = {"NESTED_LOOP_JOIN", "BLOCKWISE_NL_JOIN", "CROSS_PRODUCT"}
+
+
+class _RecordingConnection:
+    """
+    Connexion qui mémorise (requête, paramètres) de chaque execute().
+    Les transactions des repositories sont neutralisées : l'appel entier est annulé par le test.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.statements = []
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def execute(self, query, parameters=None):
+        self.statements.append((query, parameters))
+        self._conn.execute(query, parameters)
+        return self
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _operators(node):
+    yield node
+    for child in node.get("children", []):
+        yield from _operators(child)
+
+
+def _scans(plan, table: str) -> list[dict]:
+    return [
+        op for op in _operators(plan)
+        if op.get("operator_type") == "TABLE_SCAN" and op["extra_info"].get("Table", "").endswith(f".{table}")
+    ]
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    conn = open_database(":memory:")
+    generate(conn, SHAPE)
+    user = user_ids(conn, SHAPE)[0]
+    root = conn.execute(
+        "SELECT uuid FROM todos WHERE user_id = ? AND parent_id IS NULL AND state = false ORDER BY uuid LIMIT 1",
+        [user],
+    ).fetchone()[0]
+    yield conn, user, root
+    conn.close()
+
+
+def _plans(seeded, call) -> list[tuple[str, dict]]:
+    """Plans analysés des requêtes émises par `call(todo_repo, category_repo, user, root)`."""
+    conn, user, root = seeded
+    recorder = _RecordingConnection(conn)
+    conn.begin()
+    try:
+        call(DuckDBTodoRepository(recorder), DuckDBCategoryRepository(recorder), user, root)
+    finally:
+        conn.rollback()
+    plans = []
+    for query, params in recorder.statements:
+        conn.begin()
+        try:
+            explained = conn.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}", params).fetchall()
+        finally:
+            conn.rollback()
+        plans.append((query, json.loads(explained[0][1])))
+    return plans
+
+
+# Méthode -> appel ; le sous-arbre supprimé ou terminé est celui d'une racine active
+CALLS = {
+    "get_by_id": lambda repo, cats, user, root: repo.get_by_id(root),
+    "find_by_parent": lambda repo, cats, user, root: repo.find_by_parent(root),
+    "find_descendants": lambda repo, cats, user, root: repo.find_descendants(root),
+    "count_all_descendants": lambda repo, cats, user, root: repo.count_all_descendants(root),
+    "find_top_level_by_user": lambda repo, cats, user, root: repo.find_top_level_by_user(user, limit=21),
+    "find_list_view": lambda repo, cats, user, root: repo.find_list_view(user, group_by="week", limit=21),
+    "find_all_active_by_user": lambda repo, cats, user, root: repo.find_all_active_by_user(user),
+    "find_title_entries": lambda repo, cats, user, root: repo.find_title_entries(user),
+    "search_by_title": lambda repo, cats, user, root: repo.search_by_title(user, "raport"),
+    "get_pending_completion_parents": lambda repo, cats, user, root: repo.get_pending_completion_parents(user),
+    "update_state": lambda repo, cats, user, root: repo.update_state(root, True),
+    "delete": lambda repo, cats, user, root: repo.delete(root),
+    "category_exists": lambda repo, cats, user, root: cats.category_exists("Projet", user),
+    "get_all_categories_with_emojis": lambda repo, cats, user, root: cats.get_all_categories_with_emojis(user),
+}
+
+
+@pytest.mark.parametrize("method", CALLS)
+def test_no_nested_loop_join_over_tables(seeded, method):
+    # Une boucle imbriquée n'est tolérée que contre une ligne unique (ex: agrégat de la requête)
+    for query, plan in _plans(seeded, CALLS[method]):
+        for op in _operators(plan):
+            if op.get("operator_type") in NESTED_LOOPS:
+                sides = [child["operator_cardinality"] for child in op["children"]]
+                assert min(sides) <= 1, f"{method} : {op['operator_type']} {sides}\n{query}"
+
+
+@pytest.mark.parametrize("method", ["get_by_id", "update_state"])
+def test_point_lookups_use_primary_key(seeded, method):
+    [(_, plan)] = _plans(seeded, CALLS[method])
+    [scan] = _scans(plan, "todos")
+    assert scan["extra_info"]["Type"] == "Index Scan"
+    assert scan["operator_rows_scanned"] == 1
+
+
+def test_pending_completion_parents_scans_todos_linearly(seeded):
+    # EXISTS / NOT EXISTS décorrélés en jointures de hachage : trois parcours, aucun par ligne de p
+    [(_, plan)] = _plans(seeded, CALLS["get_pending_completion_parents"])
+    joins = {op["operator_type"] for op in _operators(plan) if "JOIN" in op.get("operator_type", "")}
+    assert joins and joins <= {"HASH_JOIN", "LEFT_DELIM_JOIN", "RIGHT_DELIM_JOIN"}
+    assert len(_scans(plan, "todos")) == 3
+    assert plan["cumulative_rows_scanned"] <= 3 * SHAPE.rows
+
+
+def test_recursive_delete_uses_indexes(seeded):
+    conn, _, root = seeded
+    subtree_size = sum(SHAPE.fanout ** level for level in range(SHAPE.depth))
+    plans = dict(_plans(seeded, CALLS["delete"]))
+    tree, title_delete, todo_delete, _ = plans.values()
+
+    # Le parcours récursif part de la racine par la clé primaire
+    anchor = [scan for scan in _scans(tree, "todos") if scan["extra_info"]["Type"] == "Index Scan"]
+    assert [scan["operator_rows_scanned"] for scan in anchor] == [1]
+
+    # Les DELETE ne lisent que les lignes du sous-arbre, pas toute la table
+    [title_scan] = _scans(title_delete, "title_index")
+    assert title_scan["extra_info"]["Type"] == "Index Scan"
+    trigrams = conn.execute("SELECT count(*) FROM title_index").fetchone()[0]
+    assert title_scan["operator_rows_scanned"] < trigrams / 100
+    [todo_scan] = _scans(todo_delete, "todos")
+    assert todo_scan["extra_info"]["Type"] == "Index Scan"
+    assert todo_scan["operator_rows_scanned"] == subtree_size
@@ -0,0 +1,79 @@
+import duckdb
+import pendulum
+import pytest
+
+from todo_bene.domain.entities.series import Series
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import DuckDBTodoRepository
+from todo_bene.infrastructure.persistence.duckdb.todo_archive import DuckDBTodoArchive
+
+OLD = pendulum.datetime(2025, 3, 10, 12).int_timestamp
+RECENT = pendulum.now().subtract(days=2).int_timestamp
+CUTOFF = pendulum.now().subtract(days=30).int_timestamp
+
+
+def _tree(repo, user_id, title, due, states=(True, True)):
+    root = Todo(title=title, user=user_id, state=states[0], date_start=due - 3600, date_due=due)
+    child = Todo(title=f"{title} (étape)", user=user_id, parent=root.uuid, state=states[1],
+                 date_start=due - 3600, date_due=due)
+    repo.save(root)
+    repo.save(child)
+    return root, child
+
+
+@pytest.fixture
+def archive(db_manager_conn, tmp_path):
+    return DuckDBTodoArchive(db_manager_conn, tmp_path / "archive")
+
+
+def test_archive_moves_old_completed_subtrees_to_monthly_parquet(db_manager_conn, archive, user_id):
+    repo = DuckDBTodoRepository(db_manager_conn)
+    old_root, old_child = _tree(repo, user_id, "Déclaration", OLD)
+    _tree(repo, user_id, "Récente", RECENT)
+    _tree(repo, user_id, "Entamée", OLD, states=(True, False))
+
+    assert archive.archive(user_id, CUTOFF) == {"2025-03": 2}
+
+    assert repo.get_by_id(old_root.uuid) is None and repo.get_by_id(old_child.uuid) is None
+    assert [path.parent.name for path in archive.files()] == ["month=2025-03"]
+    assert db_manager_conn.execute(
+        "SELECT count(*) FROM title_index WHERE todo_id = ?", [old_root.uuid]
+    ).fetchone()[0] == 0
+    # L'historique réunit la base et l'archive
+    history = db_manager_conn.execute(f"SELECT title FROM {archive.history_source()} h ORDER BY title").fetchall()
+    assert [row[0] for row in history] == [
+        "Déclaration", "Déclaration (étape)", "Entamée", "Entamée (étape)", "Récente", "Récente (étape)"
+    ]
+    assert archive.completion_stats(user_id) == [("2025-03", 3), (pendulum.from_timestamp(RECENT).format("YYYY-MM"), 2)]
+    # Un second passage n'a plus rien à déplacer
+    assert archive.archive(user_id, CUTOFF) == {}
+
+
+def test_archive_keeps_series_templates(db_manager_conn, archive, user_id):
+    repo = DuckDBTodoRepository(db_manager_conn)
+    template, _ = _tree(repo, user_id, "Modèle", OLD)
+    repo.save_series(Series(template=template.uuid, user=user_id, rule="today@daily#1d@∞"))
+
+    assert archive.archive(user_id, CUTOFF) == {}
+    assert repo.get_by_id(template.uuid) is not None
+
+
+def test_failed_archive_rolls_back_and_removes_batch_files(db_manager_conn, archive, user_id):
+    repo = DuckDBTodoRepository(db_manager_conn)
+    root, _ = _tree(repo, user_id, "Déclaration", OLD)
+
+    class FailingDelete:
+        def __getattr__(self, name):
+            return getattr(db_manager_conn, name)
+
+        def execute(self, query, parameters=None):
+            if query.startswith("DELETE FROM todos"):
+                raise duckdb.ConstraintException("échec simulé")
+            return db_manager_conn.execute(query, parameters)
+
+    archive._conn = FailingDelete()
+    with pytest.raises(duckdb.ConstraintException):
+        archive.archive(user_id, CUTOFF)
+
+    assert repo.get_by_id(root.uuid) is not None
+    assert archive.files() == []
@@ -109,3 +109,228 @@ def test_repository_recursive_delete(repository, user_id):
     assert repository.get_by_id(parent.uuid) is None
     assert repository.get_by_id(child.uuid) is None
     assert repository.get_by_id(grand_child.uuid) is None
+
+
+def test_repository_find_descendants_single_query(repository, user_id):
+    racine = Todo(title="Racine", user=user_id, date_start=1000, date_due=5000)
+    enfant = Todo(title="Enfant", user=user_id, parent=racine.uuid, date_start=2000, date_due=5000)
+    petit_enfant = Todo(title="Petit-enfant", user=user_id, parent=enfant.uuid, date_start=3000, date_due=5000)
+    autre_enfant = Todo(title="Autre Enfant", user=user_id, parent=racine.uuid, date_start=1500, date_due=5000)
+    etranger = Todo(title="Étranger", user=user_id)
+    for todo in (racine, enfant, petit_enfant, autre_enfant, etranger):
+        repository.save(todo)
+
+    descendants = repository.find_descendants(racine.uuid)
+
+    # Tous les niveaux, sans la racine, triés par date de début
+    assert [t.title for t in descendants] == ["Autre Enfant", "Enfant", "Petit-enfant"]
+    assert repository.find_descendants(petit_enfant.uuid) == []
+
+
+def test_repository_save_all_bulk_insert(repository, user_id):
+    parent = Todo(title="Parent", user=user_id, date_start=1000, date_due=9000)
+    todos = [parent] + [
+        Todo(title=f"Bulk {i} « l'été »", user=user_id, parent=parent.uuid, priority=i % 2 == 0,
+             description=None if i else "desc", date_start=1000 + i, date_due=2000 + i)
+        for i in range(5)
+    ]
+
+    repository.save_all(todos)
+
+    for todo in todos:
+        retrieved = repository.get_by_id(todo.uuid)
+        assert (retrieved.title, retrieved.parent, retrieved.priority) == (todo.title, todo.parent, todo.priority)
+        assert (retrieved.date_start, retrieved.date_due) == (todo.date_start, todo.date_due)
+        assert retrieved.user == user_id
+    assert repository.get_by_id(todos[1].uuid).description == "desc"
+
+
+def test_tuple_frequency_round_trips_identically_through_save_and_save_all(repository, user_id):
+    unitaire = Todo(title="Unitaire", user=user_id, frequency="tous les jours,3")
+    en_masse = Todo(title="En masse", user=user_id, frequency="tous les jours,3")
+    assert unitaire.frequency == ("tous les jours", 3)
+
+    repository.save(unitaire)
+    repository.save_all([en_masse])
+
+    assert repository.get_by_id(unitaire.uuid).frequency == ("tous les jours", 3)
+    assert repository.get_by_id(en_masse.uuid).frequency == ("tous les jours", 3)
+
+
+def test_repository_save_all_is_atomic(repository, user_id):
+    import duckdb
+
+    ok = Todo(title="OK", user=user_id)
+    casse = Todo(title="Cassé", user=user_id)
+    casse.uuid = "pas-un-uuid"
+    # Une ligne invalide annule toute l'insertion
+    with pytest.raises(duckdb.Error):
+        repository.save_all([ok, casse])
+
+    assert repository.get_by_id(ok.uuid) is None
+
+
+def test_repository_clone_subtree_server_side(repository, user_id):
+    racine = Todo(title="Racine", user=user_id, state=True, frequency="tous les jours",
+                  date_start=1000, date_due=5000)
+    enfant = Todo(title="Enfant", user=user_id, parent=racine.uuid, priority=True, date_start=2000, date_due=5000)
+    petit_enfant = Todo(title="Petit-enfant", user=user_id, parent=enfant.uuid, date_start=3000, date_due=5000)
+    for todo in (racine, enfant, petit_enfant):
+        repository.save(todo)
+
+    new_roots = repository.clone_subtree(racine.uuid, [172800, 86400])
+
+    # Une racine par décalage, dans l'ordre chronologique, sans fréquence et non terminée
+    assert [r.date_start for r in new_roots] == [1000 + 86400, 1000 + 172800]
+    for delta, new_root in zip((86400, 172800), new_roots):
+        assert (new_root.parent, new_root.state, new_root.frequency) == (None, False, "")
+        assert new_root.uuid != racine.uuid
+        [new_child] = repository.find_by_parent(new_root.uuid)
+        assert (new_child.title, new_child.priority, new_child.date_start) == ("Enfant", True, 2000 + delta)
+        [new_grand_child] = repository.find_by_parent(new_child.uuid)
+        assert (new_grand_child.title, new_grand_child.date_due) == ("Petit-enfant", 5000 + delta)
+    # L'original n'est pas modifié
+    assert [t.title for t in repository.find_by_parent(enfant.uuid)] == ["Petit-enfant"]
+
+
+def test_repository_expands_virtual_series_in_period_window(repository, user_id):
+    from todo_bene.domain.entities.series import Series
+
+    modele = Todo(title="Arrosage", user=user_id, state=True, category="Maison",
+                  date_start=1000, date_due=2000)
+    repository.save(modele)
+    repository.save(Todo(title="Étape", user=user_id, parent=modele.uuid, date_start=1000, date_due=2000))
+    reel = Todo(title="Réel", user=user_id, category="Travail", date_start=1500, date_due=90000)
+    repository.save(reel)
+    series = Series(template=modele.uuid, user=user_id, rule="today@daily#1d@3", deltas=[86400, 172800, 259200])
+    repository.save_series(series)
+
+    # Seules les occurrences dont l'échéance tombe dans la fenêtre sont développées
+    roots = repository.find_top_level_by_user(user_id, max_date=2000 + 172800)
+    assert [(r.title, r.date_start) for r in roots] == [
+        ("Réel", 1500), ("Arrosage", 1000 + 86400), ("Arrosage", 1000 + 172800)
+    ]
+    virtual = roots[1]
+    assert virtual.series == series.uuid
+    assert virtual.uuid == Series.occurrence_id(series.uuid, 1000 + 86400)
+    assert repository.get_by_id(virtual.uuid) is None
+    # Les filtres de catégorie s'appliquent aussi aux occurrences virtuelles
+    assert [r.title for r in repository.find_top_level_by_user(user_id, exclude_category=["Maison"])] == ["Réel"]
+
+    # La suppression du modèle supprime la série
+    repository.delete(modele.uuid)
+    assert repository.get_series(series.uuid) is None
+    assert [r.title for r in repository.find_top_level_by_user(user_id)] == ["Réel"]
+
+
+def test_sql_trigrams_match_python_normalization(repository):
+    from todo_bene.domain.services.title_search import trigrams
+
+    for title in ["Réunion Projet", "Tâche « l'Œuvre » n°2", "", "ÉTÉ   2026!"]:
+        [sql_trigrams] = repository._conn.execute("SELECT trigrams_of(?)", [title]).fetchone()
+        assert set(sql_trigrams) == trigrams(title)
+
+
+def test_search_by_title_is_fuzzy_and_ranked(repository, user_id):
+    for title in ["Réunion d'équipe", "Réunion projet Alpha", "Préparer la réunion", "Arroser le jardin"]:
+        repository.save(Todo(title=title, user=user_id))
+
+    # Faute de frappe et accent absent : les titres les plus proches d'abord
+    results = repository.search_by_title(user_id, "reunoin projet")
+    assert results[0].title == "Réunion projet Alpha"
+    assert "Arroser le jardin" not in [t.title for t in results]
+    assert [t.title for t in repository.search_by_title(user_id, "jardn")] == ["Arroser le jardin"]
+
+
+def test_search_by_title_matches_substrings_first_in_any_script(repository, user_id):
+    for title in ["Купить хлеб", "Rapport annuel", "Raport brouillon", "Relire le rapport"]:
+        repository.save(Todo(title=title, user=user_id))
+
+    # Pas de trigramme hors alphabet latin : la recherche par sous-chaîne les trouve quand même
+    assert [t.title for t in repository.search_by_title(user_id, "купить")] == ["Купить хлеб"]
+    # Titres contenant la recherche (ordre alphabétique), puis titres approchants
+    assert [t.title for t in repository.search_by_title(user_id, "rapport")] == [
+        "Rapport annuel", "Relire le rapport", "Raport brouillon"
+    ]
+
+
+def test_save_reindexes_title_only_when_it_changes(repository, user_id):
+    todo = Todo(title="Arroser le jardin", user=user_id)
+    repository.save(todo)
+    repository._conn.execute("DELETE FROM title_index WHERE todo_id = ?", [todo.uuid])
+
+    # Changement d'état seul : l'index trigrammes n'est pas réécrit
+    todo.state = True
+    repository.save(todo)
+    assert repository._conn.execute("SELECT count(*) FROM title_index WHERE todo_id = ?", [todo.uuid]).fetchone()[0] == 0
+
+    todo.title = "Arroser les fleurs"
+    repository.save(todo)
+    assert [t.uuid for t in repository.search_by_title(user_id, "aroser fleur")] == [todo.uuid]
+
+
+def test_title_index_follows_writes(repository, user_id):
+    parent = Todo(title="Ancien titre", user=user_id, state=True, date_start=1000, date_due=2000)
+    repository.save(parent)
+    child = Todo(title="Sous-tâche", user=user_id, parent=parent.uuid, date_start=1000, date_due=2000)
+    repository.save_all([child])
+
+    # Renommage : l'ancien titre n'est plus trouvé
+    parent.title = "Nouveau libellé"
+    repository.save(parent)
+    assert repository.search_by_title(user_id, "ancien") == []
+    assert [t.uuid for t in repository.search_by_title(user_id, "libelle")] == [parent.uuid]
+
+    # Les clones côté serveur sont indexés
+    [clone] = repository.clone_subtree(parent.uuid, [86400])
+    assert {t.uuid for t in repository.search_by_title(user_id, "libellé")} == {parent.uuid, clone.uuid}
+
+    # La suppression récursive nettoie l'index
+    repository.delete(parent.uuid)
+    assert [t.uuid for t in repository.search_by_title(user_id, "sous tache")] == [
+        t.uuid for t in repository.find_by_parent(clone.uuid)
+    ]
+    count = repository._conn.execute(
+        "SELECT count(*) FROM title_index WHERE todo_id IN (?, ?)", [parent.uuid, child.uuid]
+    ).fetchone()[0]
+    assert count == 0
+
+
+def test_repository_list_view_single_query(repository, category_repo, user_id):
+    from todo_bene.domain.entities.category import Category
+    from todo_bene.domain.entities.series import Series
+
+    category_repo.save_category(Category(name="Jardin", user_id=user_id, emoji="🌱"))
+    projet = Todo(title="Projet", user=user_id, category="Jardin", date_start=100, date_due=5000)
+    repository.save(projet)
+    etape = Todo(title="Étape", user=user_id, parent=projet.uuid, state=True, date_start=100, date_due=200)
+    repository.save(etape)
+    repository.save(Todo(title="Sous-étape", user=user_id, parent=etape.uuid, date_start=100, date_due=200))
+    modele = Todo(title="Arrosage", user=user_id, state=True, category="Maison", date_start=0, date_due=1000)
+    repository.save(modele)
+    repository.save(Todo(title="Bac", user=user_id, parent=modele.uuid, state=True, date_start=0, date_due=1000))
+    repository.save_series(Series(template=modele.uuid, user=user_id, rule="today@daily#1d@1", deltas=[86400]))
+
+    items = repository.find_list_view(user_id)
+
+    # Triées par échéance ; émoji stocké en base, repli 🔖 pour une catégorie inconnue
+    assert [(i.todo.title, i.emoji, i.total, i.completed) for i in items] == [
+        ("Projet", "🌱", 2, 1),
+        ("Arrosage", "🔖", 1, 0),  # Occurrence virtuelle : sous-arbre du modèle, rien de terminé
+    ]
+    assert items[1].todo.series is not None
+    assert [i.todo.title for i in repository.find_list_view(user_id, category=["Maison"])] == ["Arrosage"]
+
+
+def test_list_view_uses_default_emoji_of_builtin_categories(repository, category_repo, user_id):
+    from todo_bene.domain.entities.category import Category
+
+    # Les catégories par défaut n'ont pas de ligne dans categories
+    category_repo.save_category(Category(name="Jardin", user_id=user_id, emoji="🌱"))
+    repository.save(Todo(title="Budget", user=user_id, category=Category.FINANCES, date_start=100, date_due=1000))
+    repository.save(Todo(title="Réunion", user=user_id, category=Category.TRAVAIL, date_start=100, date_due=2000))
+    repository.save(Todo(title="Semis", user=user_id, category="Jardin", date_start=100, date_due=3000))
+
+    items = repository.find_list_view(user_id)
+
+    assert [(i.todo.title, i.emoji) for i in items] == [("Budget", "💰"), ("Réunion", "💼"), ("Semis", "🌱")]
@@ -0,0 +1,52 @@
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.infrastructure.persistence.memory.memory_todo_repository import MemoryTodoRepository
+
+
+def test_indexes_follow_modified_todos(user_id):
+    repo = MemoryTodoRepository()
+    parent_a = Todo(title="A", user=user_id, date_start=1_000, date_due=1_100)
+    parent_b = Todo(title="B", user=user_id, date_start=1_000, date_due=1_300)
+    child = Todo(title="Enfant", user=user_id, parent=parent_a.uuid, date_start=1_000, date_due=1_050)
+    repo.save_all([parent_a, parent_b, child])
+
+    # Le même objet est modifié puis sauvegardé : il quitte les index sous ses anciennes valeurs
+    child.parent = parent_b.uuid
+    repo.save(child)
+    parent_a.date_due = 1_500
+    repo.save(parent_a)
+
+    assert repo.find_by_parent(parent_a.uuid) == []
+    assert repo.find_by_parent(parent_b.uuid) == [child]
+    assert [t.title for t in repo.find_top_level_by_user(user_id, max_date=1_300)] == ["B"]
+
+    repo.update_state(child.uuid, True)
+    assert repo.get_pending_completion_parents(user_id) == [parent_b]
+    assert {t.title for t in repo.find_all_active_by_user(user_id)} == {"A", "B"}
+
+    repo.delete(parent_b.uuid)
+    assert repo.get_by_id(child.uuid) is None
+    assert [t.title for t in repo.find_top_level_by_user(user_id)] == ["A"]
+
+
+def test_deep_tree_counts_without_quadratic_scans(user_id):
+    repo = MemoryTodoRepository()
+    todos = [Todo(title="Racine", user=user_id)]
+    for i in range(3000):
+        todos.append(Todo(title=f"N{i}", user=user_id, parent=todos[i // 2].uuid, state=i % 2 == 0))
+    repo.save_all(todos)
+
+    assert repo.count_all_descendants(todos[0].uuid) == (3000, 1500)
+    assert len(repo.find_descendants(todos[1].uuid)) < 3000
+
+
+def test_search_by_title_matches_substrings_first_in_any_script(user_id):
+    repo = MemoryTodoRepository()
+    repo.save_all([
+        Todo(title=title, user=user_id, date_start=1_000, date_due=1_100)
+        for title in ["Купить хлеб", "Rapport annuel", "Raport brouillon", "Relire le rapport"]
+    ])
+
+    assert [t.title for t in repo.search_by_title(user_id, "купить")] == ["Купить хлеб"]
+    assert [t.title for t in repo.search_by_title(user_id, "rapport")] == [
+        "Rapport annuel", "Relire le rapport", "Raport brouillon"
+    ]
@@ -0,0 +1,85 @@
+import stat
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from todo_bene.infrastructure import config
+from todo_bene.infrastructure.key_agent import KeyAgent, agent_request, is_supported, start_agent, stop_agent
+
+pytestmark = pytest.mark.skipif(not is_supported(), reason="sockets Unix indisponibles")
+
+
+@contextmanager
+def _serving(agent: KeyAgent):
+    """Agent servi dans un thread, prêt à répondre, arrêté à la sortie."""
+    thread = threading.Thread(target=agent.serve, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if agent_request(agent.socket_path, b"PING") == b"PONG":
+            break
+        threading.Event().wait(0.01)
+    try:
+        yield agent
+    finally:
+        agent_request(agent.socket_path, b"STOP")
+        thread.join(timeout=5)
+
+
+@pytest.fixture
+def running_agent(tmp_path):
+    with _serving(KeyAgent(tmp_path / "agent.sock", b"cle-de-test", idle_timeout=5)) as agent:
+        yield agent
+
+
+def test_agent_serves_the_key_to_the_owner_only(running_agent):
+    assert agent_request(running_agent.socket_path) == b"cle-de-test"
+    assert stat.S_IMODE(running_agent.socket_path.stat().st_mode) == 0o600
+
+
+def test_agent_stops_on_request_and_removes_its_socket(running_agent):
+    assert agent_request(running_agent.socket_path, b"STOP") == b"OK"
+    for _ in range(100):
+        if not running_agent.socket_path.exists():
+            break
+        threading.Event().wait(0.01)
+    assert not running_agent.socket_path.exists()
+    assert agent_request(running_agent.socket_path) is None
+
+
+def test_agent_exits_after_idle_timeout(tmp_path):
+    agent = KeyAgent(tmp_path / "agent.sock", b"cle", idle_timeout=0.2)
+    thread = threading.Thread(target=agent.serve, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not agent.socket_path.exists()
+
+
+def test_master_key_comes_from_the_agent(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "_SESSION_MASTER_KEY", None)
+    monkeypatch.setattr(config, "get_agent_socket_path", lambda: tmp_path / "agent.sock")
+
+    def keyring_unavailable(*args):
+        raise AssertionError("le trousseau ne doit pas être interrogé")
+
+    monkeypatch.setattr(config.keyring, "get_password", keyring_unavailable)
+    key = config.Fernet.generate_key()
+    with _serving(KeyAgent(tmp_path / "agent.sock", key, idle_timeout=5)):
+        assert config.get_or_create_master_key() == key
+    # Une seule instance Fernet par processus
+    assert config.get_fernet() is config.get_fernet()
+    assert config.decrypt_value(config.encrypt_value("secret")) == "secret"
+
+
+def test_start_and_stop_background_agent(tmp_path, monkeypatch):
+    # Le sous-processus ne voit pas le trousseau simulé : on lui interdit le vrai (clé de test volatile)
+    monkeypatch.setenv("PYTHON_KEYRING_BACKEND", "keyring.backends.fail.Keyring")
+    socket_path = tmp_path / "agent.sock"
+    assert start_agent(socket_path, idle_timeout=30) is True
+    try:
+        assert start_agent(socket_path, idle_timeout=30) is False
+        assert agent_request(socket_path)
+    finally:
+        assert stop_agent(socket_path) is True
+    assert stop_agent(socket_path) is False
@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from uuid import UUID
 from todo_bene.domain.entities.todo import Todo
+from todo_bene.domain.entities.series import Series
+from todo_bene.domain.entities.todo_list_item import TodoListItem
+from todo_bene.domain.services.title_search import TitleEntry
 
 
 class TodoRepository(ABC):
@@ -17,6 +20,57 @@ class TodoRepository(ABC):
     def find_by_parent(self, parent_id: UUID) -> list[Todo]:
         pass
 
+    @abstractmethod
+    def save_all(self, todos: list[Todo]) -> None:
+        """Enregistre plusieurs Todos en une seule opération (transaction)."""
+        pass
+
+    @abstractmethod
+    def find_descendants(self, todo_uuid: UUID) -> list[Todo]:
+        """Récupère en une seule lecture tous les descendants d'un Todo (tous niveaux, triés par date_start)."""
+        pass
+
+    @abstractmethod
+    def clone_subtree(self, todo_uuid: UUID, time_deltas: list[int]) -> list[Todo]:
+        """
+        Duplique un Todo et tout son sous-arbre une fois par décalage (en secondes) :
+        nouveaux uuids, parents remappés, dates décalées, fréquence vidée, état non terminé.
+        Retourne uniquement les nouvelles racines, dans l'ordre chronologique.
+        """
+        pass
+
+    @abstractmethod
+    def materialize_occurrence(self, series: Series, delta: int) -> Todo:
+        """
+        Matérialise l'occurrence `delta` d'une série : clone le sous-arbre du modèle et retire
+        le décalage de la série, les deux écritures dans une même transaction.
+        Retourne la nouvelle racine.
+        """
+        pass
+
+    @abstractmethod
+    def materialize_horizon(self, series: Series, deltas: list[int]) -> list[Todo]:
+        """
+        Complément d'une série à horizon : clone le sous-arbre du modèle pour chaque décalage et
+        avance `series.materialized` d'autant, les deux écritures dans une même transaction.
+        Retourne les nouvelles racines, dans l'ordre chronologique.
+        """
+        pass
+
+    @abstractmethod
+    def save_series(self, series: Series) -> None:
+        """Enregistre (ou met à jour) une série récurrente non matérialisée."""
+        pass
+
+    @abstractmethod
+    def get_series(self, series_id: UUID) -> Optional[Series]:
+        pass
+
+    @abstractmethod
+    def find_series_by_user(self, user_id: UUID) -> list[Series]:
+        """Récupère toutes les séries (virtuelles et à horizon) d'un utilisateur."""
+        pass
+
     @abstractmethod
     def count_all_descendants(self, todo_uuid: UUID) -> tuple[int, int]:
         """Compte récursivement tous les descendants d'un Todo."""
@@ -33,13 +87,52 @@ class TodoRepository(ABC):
         user_id: UUID, 
         category: Optional[list[str]] = None,
         exclude_category: Optional[list[str]] = None,
-        max_date: Optional[int] = None
+        max_date: Optional[int] = None,
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None,
+        limit: Optional[int] = None,
     ) -> list[Todo]:
-        """Récupère les tâches racines, avec filtres optionnels par liste de catégories, exclusion, et date échéance."""
+        """
+        Récupère les tâches racines, avec filtres optionnels par liste de catégories, exclusion, et date échéance.
+        Les occurrences virtuelles des séries (Todo.series renseigné) sont développées dans la même fenêtre.
+        Pagination par clé : after / before = (date_start, date_due, uuid) d'une ligne déjà reçue
+        (uuid de la série pour une occurrence virtuelle), limit = taille de la page.
+        """
+        pass
+
+    @abstractmethod
+    def find_list_view(
+        self,
+        user_id: UUID,
+        category: Optional[list[str]] = None,
+        exclude_category: Optional[list[str]] = None,
+        max_date: Optional[int] = None,
+        group_by: Optional[str] = None,
+        timezone: str = "UTC",
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None,
+        limit: Optional[int] = None,
+    ) -> list[TodoListItem]:
+        """
+        Projection de la vue liste : mêmes racines que find_top_level_by_user (mêmes filtres),
+        avec l'émoji de la catégorie et le nombre de descendants (total, terminés), triées par échéance.
+        group_by ('day' ou 'week') renseigne TodoListItem.group : début du jour / de la semaine
+        d'échéance dans le fuseau `timezone`.
+        Pagination par clé sur TodoListItem.cursor (after / before / limit).
+        """
         pass
 
     @abstractmethod
     def search_by_title(self, user_id: UUID, search_term: str) -> list[Todo]:
+        """
+        10 titres au plus : ceux qui contiennent la recherche (casse ignorée) par ordre alphabétique,
+        complétés si besoin par une recherche approchée (trigrammes), les plus proches d'abord.
+        """
+        pass
+
+    @abstractmethod
+    def find_title_entries(self, user_id: UUID) -> list[TitleEntry]:
+        """Charge l'index compact (uuid, titre, catégorie, parent) des tâches actives d'un utilisateur."""
         pass
 
     @abstractmethod
@@ -2,6 +2,8 @@ from uuid import UUID
 import pendulum
 from todo_bene.application.interfaces.todo_repository import TodoRepository
 from todo_bene.domain.entities.todo import Todo
+from todo_bene.domain.entities.todo_list_item import TodoListItem
+from todo_bene.application.use_cases.todo_series_horizon import extend_series_horizon
 from todo_bene.infrastructure.config import (
     get_last_postpone_date,
     update_last_postpone_date,
@@ -16,6 +18,9 @@ def apply_auto_postpone(repository, user_id):
         # On a déjà fait le ménage aujourd'hui, on quitte immédiatement
         return 0
 
+    # Complément des séries à horizon glissant (avant le report, qui traite aussi ces occurrences)
+    extend_series_horizon(repository, user_id)
+
     now_ts = pendulum.now().timestamp()
     new_due_ts = pendulum.now().at(23, 59, 59).timestamp()
 
@@ -54,6 +59,20 @@ def apply_auto_postpone(repository, user_id):
     return postponed_count
 
 
+def period_max_date(period: str) -> int | None:
+    """Borne d'échéance d'une période de la vue liste (None pour 'all')."""
+    now = pendulum.now()
+    if period == "today":
+        return int(now.at(23, 59, 59).timestamp())
+    if period == "week":
+        # Fin de la semaine calendaire (dimanche 23:59:59)
+        return int(now.end_of('week').timestamp())
+    if period == "month":
+        # Fin du mois calendaire
+        return int(now.end_of('month').timestamp())
+    return None
+
+
 class TodoGetAllRootsByUserUseCase:
     def __init__(self, todo_repo: TodoRepository):
         self.todo_repo = todo_repo
@@ -61,25 +80,39 @@ class TodoGetAllRootsByUserUseCase:
     def execute(self, user_id: UUID, category: list[str] = None, exclude_category: list[str] = None, period: str = "all") -> list[Todo]:
         # 1. Application de la règle métier système (auto-postpone)
         count = apply_auto_postpone(self.todo_repo, user_id)
-        
-        # 2. Calcul de la borne temporelle selon la période
-        max_date = None
-        now = pendulum.now()
-
-        if period == "today":
-            max_date = int(now.at(23, 59, 59).timestamp())
-        elif period == "week":
-            # Fin de la semaine calendaire (dimanche 23:59:59)
-            max_date = int(now.end_of('week').timestamp())
-        elif period == "month":
-            # Fin du mois calendaire
-            max_date = int(now.end_of('month').timestamp())
-
-        # 3. Récupération filtrée
+
+        # 2. Récupération filtrée jusqu'à la borne temporelle de la période
         roots = self.todo_repo.find_top_level_by_user(
             user_id, 
             category=category,
             exclude_category=exclude_category,
-            max_date=max_date
+            max_date=period_max_date(period)
+        )
+        return roots, count
+
+
+class TodoListViewUseCase:
+    """Vue liste de `tb list` : racines prêtes à afficher (émoji, progression, groupe), en une requête."""
+    # Vue agenda : la semaine est découpée par jour, le mois par semaine
+    PERIOD_GROUPS = {"week": "day", "month": "week"}
+
+    def __init__(self, todo_repo: TodoRepository):
+        self.todo_repo = todo_repo
+
+    def execute(
+        self, user_id: UUID, category: list[str] = None, exclude_category: list[str] = None, period: str = "all",
+        after: tuple = None, before: tuple = None, limit: int = None,
+    ) -> tuple[list[TodoListItem], int]:
+        count = apply_auto_postpone(self.todo_repo, user_id)
+        items = self.todo_repo.find_list_view(
+            user_id,
+            category=category,
+            exclude_category=exclude_category,
+            max_date=period_max_date(period),
+            group_by=self.PERIOD_GROUPS.get(period),
+            timezone=pendulum.local_timezone().name,
+            after=after,
+            before=before,
+            limit=limit,
         )
-        return roots, count
\ No newline at end of file
+        return items, count
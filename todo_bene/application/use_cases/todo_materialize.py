@@ -0,0 +1,28 @@
+from todo_bene.application.interfaces.todo_repository import TodoRepository
+from todo_bene.domain.entities.todo import Todo
+
+
+class MaterializeOccurrenceUseCase:
+    """
+    Transforme une occurrence virtuelle de série en vrais Todos (racine + sous-arbre du modèle),
+    au moment où elle doit être modifiée ou terminée.
+    """
+    def __init__(self, todo_repo: TodoRepository):
+        self.todo_repo = todo_repo
+
+    def execute(self, todo: Todo) -> Todo:
+        # Un Todo déjà enregistré est retourné tel quel
+        if not todo.series:
+            return todo
+
+        series = self.todo_repo.get_series(todo.series)
+        template = self.todo_repo.get_by_id(series.template) if series else None
+        if not template:
+            raise ValueError("Série introuvable pour cette occurrence")
+
+        delta = int(todo.date_start - template.date_start)
+        if delta not in series.deltas:
+            raise ValueError("Occurrence déjà matérialisée")
+
+        # L'occurrence quitte la série (elle n'est plus développée à la lecture) dans la même transaction
+        return self.todo_repo.materialize_occurrence(series, delta)
@@ -4,14 +4,41 @@ from pendulum.parsing.exceptions import ParserError
 from typing import List, Optional
 
 from todo_bene.domain.entities.todo import Todo
+from todo_bene.domain.entities.series import Series
 from todo_bene.domain.services.frequency_engine import FrequencyEngine
 from todo_bene.domain.services.frequency_parser import FrequencyParser
+from todo_bene.domain.services.frequency_cache import get_parse_cache
+from todo_bene.application.use_cases.todo_series_horizon import materialize_horizon
+from todo_bene.infrastructure.config import (
+    get_frequency_cache_path,
+    get_repetition_horizon,
+    get_repetition_mode,
+)
 
 
 class RepetitionTodo:
-    def __init__(self, todo_repository):
+    # Au-delà de ce nombre de clones (occurrences x taille du sous-arbre), la duplication
+    # est déléguée au dépôt (INSERT ... SELECT côté DuckDB) au lieu d'être faite en Python
+    SERVER_SIDE_CLONE_THRESHOLD = 2000
+
+    def __init__(
+        self,
+        todo_repository,
+        server_side_threshold: Optional[int] = None,
+        mode: Optional[str] = None,
+        horizon: Optional[int] = None,
+    ):
         self.todo_repository = todo_repository
-        self.frequency_parser = FrequencyParser(getenv("LANG")[:2])
+        # 'materialized' : occurrences écrites dans todos / 'series' : série virtuelle développée à la lecture
+        # 'horizon' : seules les `horizon` prochaines occurrences sont écrites, le reste au fil des jours
+        self.mode = mode or get_repetition_mode()
+        self.horizon = horizon or get_repetition_horizon()
+        self.server_side_threshold = (
+            self.SERVER_SIDE_CLONE_THRESHOLD if server_side_threshold is None else server_side_threshold
+        )
+        self.frequency_parser = FrequencyParser(
+            getenv("LANG")[:2], cache=get_parse_cache(get_frequency_cache_path())
+        )
         self.frequency_engine = FrequencyEngine()
 
     def execute(self, todo_id: str) -> List[Todo] | None:
@@ -31,9 +58,15 @@ class RepetitionTodo:
         
         created_todos = []
 
+        # Le sous-arbre source est chargé une seule fois (requête récursive) puis répliqué en mémoire
+        children_map = {}
+        for descendant in self.todo_repository.find_descendants(original_todo.uuid):
+            children_map.setdefault(descendant.parent, []).append(descendant)
+
         try:
             # Gestion du cas spécifique "tomorrow" (Règle métier par défaut)
             if original_todo.frequency == "tomorrow":
+                dsl_instruction = "tomorrow"
                 occurrences = [original_dt.add(days=1)]
             else:
                 # a. Récupération des dates via le parser et l'engine
@@ -43,7 +76,8 @@ class RepetitionTodo:
             if not occurrences:
                 raise ValueError("Aucune occurrence trouvée")
 
-            # b. Boucle sur chaque occurrence pour créer une salve (Racine + Enfants)
+            # b. Calcul du delta (en secondes) de chaque occurrence par rapport à l'original
+            time_deltas = []
             for next_date in occurrences:
                 # On réinjecte l'heure/min/sec de l'original dans la date de l'engine
                 # next_date peut être un DateTime (via engine) ou un objet pendulum (via tomorrow)
@@ -52,36 +86,54 @@ class RepetitionTodo:
                     original_dt.minute, 
                     original_dt.second
                 ).in_timezone(tz)
+                time_deltas.append(target_dt.int_timestamp - original_todo.date_start)
 
-                # Calcul du delta en secondes pour cette occurrence précise
-                time_delta = target_dt.int_timestamp - original_todo.date_start
-
-                # Création du clone de la racine
-                new_root = self._create_clone(original_todo, time_delta=time_delta)
-                self.todo_repository.save(new_root)
-                created_todos.append(new_root)
-
-                # Création des descendants pour cette occurrence (Règle 2)
-                self._clone_descendants(original_todo.uuid, new_root.uuid, created_todos, time_delta)
-                
         except Exception as e:
             # Si c'est déjà notre ValueError "Aucune occurrence", on la laisse remonter
             if str(e) == "Aucune occurrence trouvée":
                 raise e
             # Sinon, on lève l'exception d'instruction invalide
             raise ValueError(f"Instruction de répétition invalide : '{original_todo.frequency}'")
-        
+
+        # c. Mode série : seule la règle compilée est enregistrée, l'original sert de modèle
+        if self.mode == "series":
+            series = Series(
+                template=original_todo.uuid, user=original_todo.user, rule=dsl_instruction, deltas=time_deltas
+            )
+            self.todo_repository.save_series(series)
+            return [series.occurrence(original_todo, delta) for delta in series.deltas]
+        if self.mode == "horizon":
+            series = Series(
+                template=original_todo.uuid, user=original_todo.user, rule=dsl_instruction,
+                deltas=time_deltas, horizon=self.horizon,
+            )
+            return materialize_horizon(self.todo_repository, series, original_todo, pendulum.now().int_timestamp)
+
+        # d. Grosse série : la base duplique elle-même le sous-arbre, seules les nouvelles racines sont retournées
+        subtree_size = 1 + sum(len(children) for children in children_map.values())
+        if len(time_deltas) * subtree_size > self.server_side_threshold:
+            return self.todo_repository.clone_subtree(original_todo.uuid, time_deltas)
+
+        # e. Sinon, une salve (Racine + Enfants) est créée en mémoire pour chaque occurrence
+        for time_delta in time_deltas:
+            # Création du clone de la racine
+            new_root = self._create_clone(original_todo, time_delta=time_delta)
+            created_todos.append(new_root)
+
+            # Création des descendants pour cette occurrence (Règle 2)
+            self._clone_descendants(original_todo.uuid, new_root.uuid, children_map, created_todos, time_delta)
+
+        # Toutes les occurrences (racines + descendants) sont écrites en une seule insertion groupée
+        self.todo_repository.save_all(created_todos)
         return created_todos
 
-    def _clone_descendants(self, old_parent_id, new_parent_id, created_list, time_delta):
-        """Cherche et duplique récursivement tous les enfants avec le même delta."""
-        children = self.todo_repository.find_by_parent(old_parent_id)
-        for child in children:
+    def _clone_descendants(self, old_parent_id, new_parent_id, children_map, created_list, time_delta):
+        """Duplique récursivement (depuis le sous-arbre en mémoire) tous les enfants avec le même delta."""
+        for child in children_map.get(old_parent_id, []):
             new_child = self._create_clone(child, new_parent_id=new_parent_id, time_delta=time_delta)
-            self.todo_repository.save(new_child)
             created_list.append(new_child)
             # Appel récursif pour les niveaux inférieurs
-            self._clone_descendants(child.uuid, new_child.uuid, created_list, time_delta)
+            self._clone_descendants(child.uuid, new_child.uuid, children_map, created_list, time_delta)
 
     def _create_clone(self, source: Todo, new_parent_id: Optional[str] = None, time_delta: int = 0) -> Todo:
         """
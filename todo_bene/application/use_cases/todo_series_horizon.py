@@ -0,0 +1,34 @@
+from uuid import UUID
+from typing import Optional
+
+import pendulum
+
+from todo_bene.application.interfaces.todo_repository import TodoRepository
+from todo_bene.domain.entities.series import Series
+from todo_bene.domain.entities.todo import Todo
+
+
+def materialize_horizon(repository: TodoRepository, series: Series, template: Todo, now_ts: int) -> list[Todo]:
+    """
+    Écrit les occurrences manquantes d'une série à horizon et enregistre son point d'arrêt,
+    dans une même transaction : une passe interrompue ne laisse pas d'occurrences que la
+    passe suivante clonerait une seconde fois.
+    """
+    return repository.materialize_horizon(series, series.pending_deltas(template, now_ts))
+
+
+def extend_series_horizon(repository: TodoRepository, user_id: UUID, now_ts: Optional[int] = None) -> int:
+    """
+    Complément des séries à horizon glissant (appelé par la passe quotidienne d'apply_auto_postpone).
+    Retourne le nombre de nouvelles occurrences matérialisées.
+    """
+    now_ts = now_ts or pendulum.now().int_timestamp
+    created = 0
+    for series in repository.find_series_by_user(user_id):
+        if series.horizon is None:
+            continue
+        template = repository.get_by_id(series.template)
+        if not template:
+            continue
+        created += len(materialize_horizon(repository, series, template, now_ts))
+    return created
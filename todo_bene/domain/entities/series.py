@@ -0,0 +1,68 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID, uuid4, uuid5
+
+from todo_bene.domain.entities.todo import Todo
+
+
+@dataclass
+class Series:
+    """
+    Série récurrente non matérialisée.
+
+    Le sous-arbre de la tâche modèle (template) sert de gabarit ; chaque occurrence
+    est un décalage (en secondes) appliqué à ses dates. Les occurrences restent
+    virtuelles tant qu'elles ne sont ni modifiées ni terminées.
+
+    Avec un horizon, la série n'est pas développée à la lecture : deltas contient tout
+    le calendrier et seules les `horizon` prochaines occurrences sont matérialisées,
+    `materialized` indiquant où la série s'est arrêtée.
+    """
+    template: UUID
+    user: UUID
+    rule: str  # Instruction DSL compilée par FrequencyParser (ex: 'today@daily#1d@∞')
+    deltas: list[int] = field(default_factory=list)  # Occurrences encore virtuelles (ou calendrier complet)
+    uuid: UUID = field(default_factory=uuid4)
+    horizon: Optional[int] = None
+    materialized: int = 0
+
+    def __post_init__(self):
+        if isinstance(self.template, str):
+            self.template = UUID(self.template)
+        if isinstance(self.user, str):
+            self.user = UUID(self.user)
+        if isinstance(self.uuid, str):
+            self.uuid = UUID(self.uuid)
+        self.deltas = sorted(set(int(delta) for delta in self.deltas))
+
+    def pending_deltas(self, template: Todo, now_ts: int) -> list[int]:
+        """
+        Série à horizon : décalages à matérialiser pour garder `horizon` occurrences à venir.
+        Les occurrences passées non encore écrites le sont aussi (elles seront reportées comme les autres).
+        """
+        if self.horizon is None:
+            return []
+        first_upcoming = bisect_left(self.deltas, now_ts - template.date_start)
+        target = min(len(self.deltas), first_upcoming + self.horizon)
+        return self.deltas[self.materialized:target]
+
+    @staticmethod
+    def occurrence_id(series_id: UUID, date_start: int) -> UUID:
+        """Identifiant stable d'une occurrence virtuelle (identique d'un affichage à l'autre)."""
+        return uuid5(series_id, str(int(date_start)))
+
+    def occurrence(self, template: Todo, delta: int) -> Todo:
+        """Construit l'occurrence virtuelle (racine seule) correspondant au décalage."""
+        date_start = template.date_start + delta
+        return Todo(
+            uuid=self.occurrence_id(self.uuid, date_start),
+            title=template.title,
+            user=self.user,
+            category=template.category,
+            description=template.description,
+            priority=template.priority,
+            date_start=date_start,
+            date_due=template.date_due + delta,
+            series=self.uuid,
+        )
@@ -33,6 +33,8 @@ class Todo:
     date_start: Optional[int | str] = None
     date_due: Optional[int | str] = None
     date_final: int = 0
+    # Série d'origine d'une occurrence virtuelle (non enregistrée dans todos)
+    series: Optional[UUID] = None
 
     def __post_init__(self):
         # 1. On délègue les conversions d'IDs et de fréquence
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from todo_bene.domain.entities.todo import Todo
+
+
+@dataclass
+class TodoListItem:
+    """
+    Ligne de la vue liste (`tb list`) : la tâche racine et ce qu'il faut pour l'afficher,
+    calculé par le repository en une seule requête.
+
+    Projection en lecture seule : la description de `todo` n'est qu'un extrait, la vue
+    détail recharge la tâche complète (ne jamais sauvegarder ce Todo tel quel).
+    """
+    todo: Todo
+    emoji: str = "🔖"
+    total: int = 0  # Nombre de descendants (récursif)
+    completed: int = 0  # Dont terminés
+    group: Optional[str] = None  # Début ('YYYY-MM-DD') du jour ou de la semaine d'échéance, si regroupement
+
+    @property
+    def cursor(self) -> tuple:
+        """Clé de pagination de la ligne dans l'ordre de la vue liste (échéance, début, identifiant)."""
+        return (self.todo.date_due, self.todo.date_start, self.todo.series or self.todo.uuid)
@@ -1,24 +1,81 @@
 # todo_bene/domain/services/extractors.py
 import re
 
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+DIGITS = tuple("0123456789")
+
+# Registre des extracteurs (instances triées par priorité), alimenté à la définition des classes
+_REGISTRY: list["BaseExtractor"] = []
+_SIGNATURE: tuple[str, ...] = ()
+
 
 class BaseExtractor:
-    """Classe parente définissant l'interface et la priorité des extracteurs."""
+    """
+    Classe parente définissant l'interface et la priorité des extracteurs.
+
+    Toute sous-classe s'enregistre automatiquement à sa définition (y compris depuis un plugin) ;
+    une classe intermédiaire peut s'en dispenser avec `class X(BaseExtractor, register=False)`.
+    `keywords` est un préfiltre bon marché : l'extracteur n'est interrogé que si au moins un
+    des mots-clés apparaît dans le texte (tuple vide = toujours interrogé).
+    """
     priority = 100
     description = "Base extractor"
     example = ""
+    keywords: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if register:
+            register_extractor(cls)
+
+    def accepts(self, text: str) -> bool:
+        return not self.keywords or any(k in text for k in self.keywords)
 
     def extract(self, text: str):
         raise NotImplementedError("Chaque extracteur doit implémenter la méthode extract.")
 
+
+def _refresh_signature():
+    global _SIGNATURE
+    _SIGNATURE = tuple(f"{type(e).__module__}.{type(e).__qualname__}" for e in _REGISTRY)
+
+
+def register_extractor(cls: type[BaseExtractor]) -> type[BaseExtractor]:
+    """Enregistre (ou remplace) un extracteur ; utilisable comme décorateur."""
+    _REGISTRY[:] = [e for e in _REGISTRY if type(e) is not cls]
+    _REGISTRY.append(cls())
+    # Tri stable : à priorité égale, l'ordre de définition est conservé
+    _REGISTRY.sort(key=lambda e: e.priority)
+    _refresh_signature()
+    return cls
+
+
+def unregister_extractor(cls: type[BaseExtractor]) -> None:
+    """Retire un extracteur du registre (ex: désactivation d'un plugin)."""
+    _REGISTRY[:] = [e for e in _REGISTRY if type(e) is not cls]
+    _refresh_signature()
+
+
+def get_extractors() -> list[BaseExtractor]:
+    """Retourne le registre partagé (trié par priorité), mis à jour en place."""
+    return _REGISTRY
+
+
+def extractors_signature() -> tuple[str, ...]:
+    """Identifie le jeu d'extracteurs actif (sert à invalider les résultats mis en cache)."""
+    return _SIGNATURE
+
 class NextOccurrencesExtractor(BaseExtractor):
     """Gère 'Les 5 prochains jours', 'Next 3 weeks'."""
     priority = 5
+    keywords = ("next",)
+    pattern = re.compile(r"(?P<num>\d+)\s*next\s*(?P<unit>[wdmy])\b|next\s*(?P<num2>\d+)\s*(?P<unit2>[wdmy])\b")
+
     def extract(self, text: str):
         if text.strip().startswith("every"):
             return None
             
-        match = re.search(r"(?P<num>\d+)\s*next\s*(?P<unit>[wdmy])\b|next\s*(?P<num2>\d+)\s*(?P<unit2>[wdmy])\b", text)
+        match = self.pattern.search(text)
         if match:
             num = int(match.group("num") or match.group("num2"))
             unit = match.group("unit") or match.group("unit2")
@@ -33,28 +90,33 @@ class SimpleIntervalExtractor(BaseExtractor):
     """Gère 'Chaque jour' (∞) ou 'Toutes les 3 semaines' (∞)."""
     # Priorité augmentée (donc passe APRÈS les positions relatives)
     priority = 15 
+    keywords = ("every",)
+    # On ancre au début (^) pour éviter de matcher le milieu d'une phrase
+    # Mais on ne met pas de $ à la fin pour laisser passer les exceptions (! ...)
+    pattern = re.compile(r"^every\s*(?P<num>\d+)?\s*(?P<unit>[wdmy])\b")
+    TYPE_MAP = {"w": "weekly", "d": "daily", "m": "monthly", "y": "yearly"}
+
     def extract(self, text: str):
-        # On ancre au début (^) pour éviter de matcher le milieu d'une phrase
-        # Mais on ne met pas de $ à la fin pour laisser passer les exceptions (! ...)
-        match = re.search(r"^every\s*(?P<num>\d+)?\s*(?P<unit>[wdmy])\b", text.strip())
+        match = self.pattern.search(text.strip())
         
         if match:
             num = match.group("num") or "1"
             unit = match.group("unit")
-            type_map = {"w": "weekly", "d": "daily", "m": "monthly", "y": "yearly"}
-            return (f"{type_map[unit]}#{num}{unit}", "∞")
+            return (f"{self.TYPE_MAP[unit]}#{num}{unit}", "∞")
         return None
 
 class MultiDayExtractor(BaseExtractor):
     """Gère 'Lundi et Jeudi' (Limite par défaut : 1)."""
     priority = 12
+    keywords = DAYS
+    pattern = re.compile(r"(mon|tue|wed|thu|fri|sat|sun)")
+
     def extract(self, text: str):
         # Si le texte contient une exception, cet extracteur ne doit pas gérer les jours qui sont après le !
         if "!" in text:
             # On ne regarde que ce qui est AVANT le !
             text = text.split("!")[0]
-        days_pattern = r"(mon|tue|wed|thu|fri|sat|sun)"
-        found_days = re.findall(days_pattern, text)
+        found_days = self.pattern.findall(text)
         if len(found_days) > 1:
             days_str = ",".join(found_days)
             # Pas de tuple ici -> le parser utilisera la limite par défaut (1)
@@ -64,21 +126,20 @@ class MultiDayExtractor(BaseExtractor):
 class YearlySpecificMonthExtractor(BaseExtractor):
     """Gère '1 mon 10' -> yearly#1stmon@oct"""
     priority = 14
-    
+    keywords = DAYS
+    MONTHS_MAP = {
+        "01": "jan", "1": "jan", "02": "feb", "2": "feb", "03": "mar", "3": "mar",
+        "04": "apr", "4": "apr", "05": "may", "5": "may", "06": "jun", "6": "jun",
+        "07": "jul", "7": "jul", "08": "aug", "8": "aug", "09": "sep", "9": "sep",
+        "10": "oct", "11": "nov", "12": "dec"
+    }
+    MONTHS_REGEX = r"01|02|03|04|05|06|07|08|09|10|11|12|[1-9]"
+    POSITIONS = r"last|1|2|3|\d+"
+    DAYS_REGEX = r"mon|tue|wed|thu|fri|sat|sun"
+    pattern = re.compile(rf"^(?P<pos>{POSITIONS})\s+(?P<day>{DAYS_REGEX})\s+(?P<month>{MONTHS_REGEX})$")
+
     def extract(self, text: str):
-        MONTHS_MAP = {
-            "01": "jan", "1": "jan", "02": "feb", "2": "feb", "03": "mar", "3": "mar",
-            "04": "apr", "4": "apr", "05": "may", "5": "may", "06": "jun", "6": "jun",
-            "07": "jul", "7": "jul", "08": "aug", "8": "aug", "09": "sep", "9": "sep",
-            "10": "oct", "11": "nov", "12": "dec"
-        }
-        
-        MONTHS_REGEX = r"01|02|03|04|05|06|07|08|09|10|11|12|[1-9]"
-        POSITIONS = r"last|1|2|3|\d+"
-        DAYS = r"mon|tue|wed|thu|fri|sat|sun"
-        
-        pattern = rf"^(?P<pos>{POSITIONS})\s+(?P<day>{DAYS})\s+(?P<month>{MONTHS_REGEX})$"
-        match = re.search(pattern, text)
+        match = self.pattern.search(text)
         
         if match:
             pos_raw = match.group("pos")
@@ -93,7 +154,7 @@ class YearlySpecificMonthExtractor(BaseExtractor):
             else: pos = f"{pos_raw}th"
             
             # 2. Conversion chiffre -> code (ex: 10 -> oct)
-            month_code = MONTHS_MAP.get(month_num, "jan")
+            month_code = self.MONTHS_MAP.get(month_num, "jan")
             
             # 3. Retour du tuple avec Cadence + Limite
             # On ajoute un second '@∞' pour forcer la structure attendue
@@ -103,9 +164,11 @@ class YearlySpecificMonthExtractor(BaseExtractor):
 class SpecificDayExtractor(BaseExtractor):
     """Gère 'Tous les lundis' (∞)."""
     priority = 15
+    keywords = ("every",)
+    pattern = re.compile(r"every\s*(mon|tue|wed|thu|fri|sat|sun)")
+
     def extract(self, text: str):
-        days_pattern = r"(mon|tue|wed|thu|fri|sat|sun)"
-        match = re.search(fr"every\s*{days_pattern}", text)
+        match = self.pattern.search(text)
         if match:
             day = match.group(1)
             # "Tous les" implique l'infini
@@ -117,27 +180,27 @@ class RelativePositionExtractor(BaseExtractor):
     """Gère les positions relatives : '2nd workday m', '135 d y', 'last fri m'."""
     # Priorité diminuée (donc passe AVANT les intervalles simples)
     priority = 10 
+    # Une position ('last', 'latest' ou un nombre) est obligatoire
+    keywords = ("last", "latest") + DIGITS
+    p_pos = r"(?P<pos>last|latest|\d+(?:ème|th|st|nd|rd)?)"
+    p_target = r"(?P<target>workday|workingday|non_workday|day|d|mon|tue|wed|thu|fri|sat|sun)"
+    # On s'assure que 'every' optionnel est bien géré au milieu
+    p_period = r"(?:every\s+)?(?P<period>y|m|w|d|quarter|semester|fortnight)"
+    pattern = re.compile(rf"{p_pos}\s*{p_target}\s*{p_period}")
+    PERIOD_MAP = {
+        "y": "yearly", "m": "monthly", "w": "weekly", "d": "daily",
+        "quarter": "quarter", "semester": "semester", "fortnight": "fortnight"
+    }
 
     def extract(self, text: str):
-        p_pos = r"(?P<pos>last|latest|\d+(?:ème|th|st|nd|rd)?)"
-        p_target = r"(?P<target>workday|workingday|non_workday|day|d|mon|tue|wed|thu|fri|sat|sun)"
-        # On s'assure que 'every' optionnel est bien géré au milieu
-        p_period = r"(?:every\s+)?(?P<period>y|m|w|d|quarter|semester|fortnight)"
-
-        pattern = rf"{p_pos}\s*{p_target}\s*{p_period}"
-        
-        match = re.search(pattern, text)
+        match = self.pattern.search(text)
         if match:
             pos_raw = match.group("pos")
             target_raw = match.group("target")
             period_raw = match.group("period")
 
             # Mappage de la période
-            period_map = {
-                "y": "yearly", "m": "monthly", "w": "weekly", "d": "daily",
-                "quarter": "quarter", "semester": "semester", "fortnight": "fortnight"
-            }
-            period = period_map.get(period_raw, "monthly")
+            period = self.PERIOD_MAP.get(period_raw, "monthly")
 
             # Normalisation de la cible (ex: 'd' doit redevenir 'day' techniquement)
             target = "day" if target_raw == "d" else target_raw
@@ -161,8 +224,11 @@ class RelativePositionExtractor(BaseExtractor):
 class SequenceExtractor(BaseExtractor):
     """Gère '1, 2, 4 jours' (Limite par défaut : 1)."""
     priority = 20
+    keywords = (",",)
+    pattern = re.compile(r"(?P<seq>[\d\s,]+)\s*(?P<unit>[wdmy])$")
+
     def extract(self, text: str):
-        match = re.search(r"(?P<seq>[\d\s,]+)\s*(?P<unit>[wdmy])$", text)
+        match = self.pattern.search(text)
         if match and "," in match.group("seq"):
             raw_seq = match.group("seq").replace(" ", "").strip(",")
             unit = match.group("unit")
@@ -180,9 +246,16 @@ class SimpleCadenceExtractor(BaseExtractor):
     Ces formes arrivent quand 'every' est absent ou supprimé par les stopwords.
     """
     priority = 25
+    keywords = DIGITS
+    # Regex capable de capturer : chiffre + espace + unité technique
+    pattern = re.compile(r"^(?P<num>\d+)\s*(?P<unit>w|d|m|y|quarter|semester|fortnight)$")
+    TYPE_MAP = {
+        "w": "weekly", "d": "daily", "m": "monthly", "y": "yearly",
+        "quarter": "quarter", "semester": "semester", "fortnight": "fortnight"
+    }
+
     def extract(self, text: str):
-        # Regex capable de capturer : chiffre + espace + unité technique
-        match = re.search(r"^(?P<num>\d+)\s*(?P<unit>w|d|m|y|quarter|semester|fortnight)$", text.strip())
+        match = self.pattern.search(text.strip())
         
         if match:
             num = match.group("num")
@@ -190,11 +263,7 @@ class SimpleCadenceExtractor(BaseExtractor):
             
             
             # Mapping vers les fréquences techniques de ton système
-            type_map = {
-                "w": "weekly", "d": "daily", "m": "monthly", "y": "yearly",
-                "quarter": "quarter", "semester": "semester", "fortnight": "fortnight"
-            }
-            frequency = type_map.get(unit, "yearly")
+            frequency = self.TYPE_MAP.get(unit, "yearly")
             
             # Conversion du chiffre en position ordinale (1 -> 1st, 2 -> 2nd...)
             # Crucial pour le format attendu 'monthly#1stday'
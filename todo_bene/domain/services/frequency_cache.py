@@ -0,0 +1,135 @@
+# todo_bene/domain/services/frequency_cache.py
+import json
+import logging
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from todo_bene.domain.services.extractors import extractors_signature
+
+logger = logging.getLogger()
+
+# Une date résolue (ex: 'jusqu'à fin de semaine' -> 2026-02-22) rend le résultat dépendant du jour d'ancrage
+_RESOLVED_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def is_anchor_independent(result: str) -> bool:
+    """
+    Indique si un résultat de FrequencyParser.parse reste valable quel que soit le jour.
+
+    'today@weekly#1mon@∞' est relatif à l'ancre ('today' est résolu par l'engine),
+    alors que '2026-02-24@daily#1d@1' ou une limite '@2026-12-31' ont été calculés
+    à partir de la date du jour.
+    """
+    if result == "unknown":
+        return True
+    return result.startswith("today@") and not _RESOLVED_DATE.search(result)
+
+
+class FrequencyParseCache:
+    """
+    Cache LRU des résultats de FrequencyParser.parse, clé (langue, phrase, jour d'ancrage).
+
+    Les résultats indépendants du jour sont stockés sans jour d'ancrage et sont les
+    seuls à être persistés dans le fichier optionnel (ils restent valables demain).
+    Le cache est vidé si le jeu d'extracteurs enregistrés change (ex: chargement d'un plugin).
+    """
+    FORMAT_VERSION = 2
+    ANY_DAY = "*"
+
+    def __init__(self, maxsize: int = 256, path: Optional[Path] = None):
+        self.maxsize = maxsize
+        self.path = Path(path) if path else None
+        self._entries: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._loaded = self.path is None
+        self._signature = extractors_signature()
+
+    @staticmethod
+    def _phrase_key(text: str) -> str:
+        # Même normalisation que l'entrée de parse : les espaces internes restent significatifs
+        return text.lower().strip()
+
+    def _check_signature(self) -> None:
+        signature = extractors_signature()
+        if signature != self._signature:
+            self._entries.clear()
+            self._signature = signature
+
+    def get(self, language: str, text: str, anchor_day: str) -> Optional[str]:
+        self._load()
+        self._check_signature()
+        phrase = self._phrase_key(text)
+        for key in ((language, phrase, self.ANY_DAY), (language, phrase, anchor_day)):
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        return None
+
+    def put(self, language: str, text: str, anchor_day: str, result: str) -> None:
+        self._load()
+        self._check_signature()
+        independent = is_anchor_independent(result)
+        key = (language, self._phrase_key(text), self.ANY_DAY if independent else anchor_day)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        if independent:
+            self._save()
+
+    def clear(self) -> None:
+        """Vide le cache mémoire (le fichier est réécrit au prochain ajout)."""
+        self._entries.clear()
+        self._loaded = True
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Cache des fréquences illisible, il sera reconstruit.")
+            return
+        if data.get("version") != self.FORMAT_VERSION:
+            return
+        if tuple(data.get("extractors", [])) != self._signature:
+            return
+        for language, phrase, result in data.get("entries", [])[-self.maxsize:]:
+            self._entries[(language, phrase, self.ANY_DAY)] = result
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        entries = [
+            [language, phrase, result]
+            for (language, phrase, day), result in self._entries.items()
+            if day == self.ANY_DAY
+        ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(
+                    {"version": self.FORMAT_VERSION, "extractors": list(self._signature), "entries": entries},
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+        except OSError:
+            # Le cache disque est une optimisation : un échec d'écriture n'est jamais bloquant
+            logger.warning("Impossible d'écrire le cache des fréquences.")
+
+
+# Un cache partagé par chemin (None = mémoire seule) pour toutes les instances de parser
+_SHARED_CACHES: dict[Optional[Path], FrequencyParseCache] = {}
+
+
+def get_parse_cache(path: Optional[Path] = None) -> FrequencyParseCache:
+    """Retourne le cache partagé associé à `path` (mémoire seule si None)."""
+    key = Path(path) if path else None
+    if key not in _SHARED_CACHES:
+        _SHARED_CACHES[key] = FrequencyParseCache(path=key)
+    return _SHARED_CACHES[key]
@@ -1,17 +1,46 @@
 import pendulum
 import re
+from functools import lru_cache
 from text_to_num import alpha2digit
 from todo_bene.i18n.lexicons import LEXICONS
-from todo_bene.domain.services.extractors import *
+from todo_bene.domain.services.frequency_cache import FrequencyParseCache, get_parse_cache
+from todo_bene.domain.services.extractors import get_extractors
+
+@lru_cache(maxsize=None)
+def _compile_lexicon(language: str) -> tuple[re.Pattern, dict[str, str], re.Pattern | None]:
+    """
+    Compile le lexique d'une langue en une seule alternance regex (mémoïsée par langue).
+
+    Les clés sont triées de la plus longue à la plus courte : à une position donnée,
+    l'alternance essaie d'abord 'jour ouvré' avant 'jour', comme le faisait la boucle
+    de substitutions successives.
+    Retourne (regex du lexique, table de remplacement, regex des stopwords).
+    """
+    lexicon = LEXICONS[language]
+    replacements = {k: v for k, v in lexicon.items() if k != "stopwords"}
+    sorted_keys = sorted(replacements, key=len, reverse=True)
+    lexicon_pattern = re.compile(r'\b(?:' + "|".join(map(re.escape, sorted_keys)) + r')\b')
+
+    stopwords = lexicon.get("stopwords", [])
+    stopwords_pattern = None
+    if stopwords:
+        stopwords_pattern = re.compile(r'\b(?:' + "|".join(map(re.escape, stopwords)) + r')\b')
+    return lexicon_pattern, replacements, stopwords_pattern
+
 
 class FrequencyParser:
     SUPPORTED_LANGUAGES = ["en", "fr"]
     DEFAULT_LANGUAGE = "en"
 
-    def __init__(self, language="en"):
+    def __init__(self, language="en", cache: FrequencyParseCache | None = None):
         self.language = language if language in self.SUPPORTED_LANGUAGES else self.DEFAULT_LANGUAGE
+        # Cache partagé des phrases déjà analysées (mémoire seule par défaut)
+        self._cache = cache if cache is not None else get_parse_cache()
         self._lexicon = LEXICONS[self.language]
-        self.extractors = [cls() for cls in sorted(BaseExtractor.__subclasses__(), key=lambda x: x.priority)]
+        # Lexique compilé une seule fois par langue et partagé entre les instances
+        self._lexicon_pattern, self._replacements, self._stopwords_pattern = _compile_lexicon(self.language)
+        # Registre partagé, trié par priorité (les plugins s'y ajoutent à leur définition)
+        self.extractors = get_extractors()
     
     def _normalize(self, text: str) -> str:        
         normalized = text.lower().strip()
@@ -20,19 +49,14 @@ class FrequencyParser:
         # On fait ça avant le lexique pour ne pas casser les groupes de mots
         normalized = alpha2digit(normalized, lang=self.language, threshold=0) 
 
-        # 2. Substitution via le lexique (ex: 135ème -> 135, jour -> d, année -> y)
-        translation_keys = [k for k in self._lexicon.keys() if k != "stopwords"]
-        sorted_keys = sorted(translation_keys, key=len, reverse=True)
-
-        for human_word in sorted_keys:
-            pattern = r'\b' + re.escape(human_word) + r'\b'
-            normalized = re.sub(pattern, self._lexicon[human_word], normalized)
+        # 2. Substitution via le lexique en une seule passe (ex: 135ème -> 135, jour -> d, année -> y)
+        # Une seule passe : un remplacement n'est jamais ré-analysé (ex: 'postponed' -> '|shift' ne redevient pas '||shift')
+        replacements = self._replacements
+        normalized = self._lexicon_pattern.sub(lambda m: replacements[m.group(0)], normalized)
         
         # 3. Nettoyage des stopwords (ex: le, de, l')
-        stopwords = self._lexicon.get("stopwords", [])
-        for sw in stopwords:
-            pattern = r'\b' + re.escape(sw) + r'\b'
-            normalized = re.sub(pattern, "", normalized)
+        if self._stopwords_pattern:
+            normalized = self._stopwords_pattern.sub("", normalized)
             
         return " ".join(normalized.split())
 
@@ -67,6 +91,21 @@ class FrequencyParser:
         return "∞"
 
     def parse(self, text: str) -> str:
+        """
+        Transforme une phrase naturelle en chaîne technique de fréquence (résultat mémoïsé).
+
+        Clé du cache : (langue, phrase, jour d'ancrage). Les résultats dépendant de la date
+        du jour (nom de jour isolé, 'jusqu'à fin de mois'...) ne sont réutilisés que le même jour.
+        """
+        anchor_day = pendulum.now(tz=pendulum.local_timezone()).to_date_string()
+        cached = self._cache.get(self.language, text, anchor_day)
+        if cached is not None:
+            return cached
+        result = self._parse(text)
+        self._cache.put(self.language, text, anchor_day, result)
+        return result
+
+    def _parse(self, text: str) -> str:
         """
         Transforme une phrase naturelle en chaîne technique de fréquence.
         
@@ -189,6 +228,9 @@ class FrequencyParser:
 
             # Boucle sur les extracteurs avec le texte nettoyé
             for extractor in self.extractors:
+                # Préfiltre par mots-clés : seuls les extracteurs candidats exécutent leur regex
+                if not extractor.accepts(clean_text_for_ext):
+                    continue
                 result = extractor.extract(clean_text_for_ext)
                 if result:
                     if isinstance(result, tuple):
@@ -88,6 +88,19 @@ def prepare_todos_for_notification(todos, job_transformers):
     return prepared_list
 
 
+def has_pending_mail_jobs() -> bool:
+    """Indique si un job du profil actif n'a pas encore envoyé son mail aujourd'hui."""
+    _, _, profile_name = load_user_info()
+    if not profile_name:
+        return False
+    profile = load_full_config().get("profiles", {}).get(profile_name, {})
+    today_str = pendulum.now().to_date_string()
+    return any(
+        job.get("last_mail_sent_date") != today_str
+        for job in profile.get("mail_jobs", {}).values()
+    )
+
+
 def run_mail_jobs_background(all_todos: List[Todo]):
     """
     Orchestrateur (Thread) : Parcourt les jobs du profil actif et gère les envois.
@@ -0,0 +1,138 @@
+# todo_bene/domain/services/title_search.py
+import re
+import unicodedata
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+# Part minimale des trigrammes de la recherche à retrouver dans un titre pour qu'il soit proposé
+MATCH_THRESHOLD = 0.5
+# Nombre maximal de titres renvoyés par search_by_title
+SEARCH_LIMIT = 10
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_title(text: str) -> str:
+    """
+    Minuscules, sans accents ni ponctuation (mêmes règles que la macro SQL trigrams_of).
+    'Tâche « l'Œuvre »' -> 'tache l oeuvre'
+    """
+    text = (text or "").lower()
+    if not text.isascii():
+        text = text.replace("œ", "oe").replace("æ", "ae")
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrammes à la pg_trgm : chaque mot est complété par deux espaces devant et un derrière."""
+    return _word_trigrams(normalize_title(text))
+
+
+def _word_trigrams(normalized: str) -> set[str]:
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def match_score(search_term: str, title: str) -> float:
+    """Part des trigrammes de la recherche présents dans le titre (1.0 = sous-chaîne de mots complète)."""
+    wanted = trigrams(search_term)
+    if not wanted:
+        return 0.0
+    return len(wanted & trigrams(title)) / len(wanted)
+
+
+@dataclass(frozen=True)
+class TitleEntry:
+    """Entrée compacte de l'index de recherche en mémoire."""
+    uuid: UUID
+    title: str
+    category: str
+    parent: Optional[UUID] = None
+
+
+class TitleIndex:
+    """
+    Index de titres chargé une fois par session, interrogé à chaque frappe sans accès base.
+
+    Les titres normalisés sont concaténés en une seule chaîne : la recherche de sous-chaîne
+    s'appuie sur str.find (boucle C). Quand la saisie prolonge la précédente d'un caractère,
+    seuls les résultats précédents sont refiltrés. Si trop peu de titres contiennent la saisie,
+    les titres contenant son plus long préfixe sont notés par trigrammes (fautes de frappe).
+    """
+    MAX_CANDIDATES = 500
+    FUZZY_CANDIDATES = 100
+    FUZZY_MIN_LENGTH = 4
+    CACHE_SIZE = 256
+
+    def __init__(self, entries: list[TitleEntry]):
+        self.entries = list(entries)
+        self._normalized = [normalize_title(entry.title) for entry in self.entries]
+        self._haystack = "\n".join(self._normalized)
+        self._starts = []
+        offset = 0
+        for text in self._normalized:
+            self._starts.append(offset)
+            offset += len(text) + 1
+        self._matches_cache: dict[str, list[int]] = {}
+        self._trigrams_cache: dict[int, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, term: str, limit: int = 10) -> list[TitleEntry]:
+        needle = normalize_title(term)
+        if not needle:
+            return self.entries[:limit]
+
+        # Classement : titre qui commence par la saisie, puis début de mot, puis titres les plus courts
+        ranked = sorted(self._matches(needle), key=lambda i: self._rank(i, needle))[:limit]
+        if len(ranked) < limit and len(needle) >= self.FUZZY_MIN_LENGTH:
+            ranked += self._fuzzy_matches(needle, set(ranked), limit - len(ranked))
+        return [self.entries[i] for i in ranked]
+
+    def _rank(self, position: int, needle: str) -> tuple:
+        text = self._normalized[position]
+        return (not text.startswith(needle), f" {needle}" not in f" {text}", len(text), self.entries[position].title)
+
+    def _matches(self, needle: str) -> list[int]:
+        """Positions des titres contenant la saisie (au plus MAX_CANDIDATES)."""
+        if needle in self._matches_cache:
+            return self._matches_cache[needle]
+        previous = self._matches_cache.get(needle[:-1])
+        if previous is not None and len(previous) < self.MAX_CANDIDATES:
+            matches = [i for i in previous if needle in self._normalized[i]]
+        else:
+            matches, pos = [], self._haystack.find(needle)
+            while pos != -1 and len(matches) < self.MAX_CANDIDATES:
+                position = bisect_right(self._starts, pos) - 1
+                matches.append(position)
+                # On reprend après la fin du titre trouvé (un titre n'est compté qu'une fois)
+                pos = self._haystack.find(needle, self._starts[position] + len(self._normalized[position]) + 1)
+        if len(self._matches_cache) >= self.CACHE_SIZE:
+            self._matches_cache.clear()
+        self._matches_cache[needle] = matches
+        return matches
+
+    def _fuzzy_matches(self, needle: str, exclude: set[int], count: int) -> list[int]:
+        candidates = []
+        for end in range(len(needle) - 1, 1, -1):
+            candidates = self._matches(needle[:end])
+            if candidates:
+                break
+        wanted = _word_trigrams(needle)
+        scored = []
+        for position in candidates[:self.FUZZY_CANDIDATES]:
+            if position in exclude:
+                continue
+            if position not in self._trigrams_cache:
+                self._trigrams_cache[position] = _word_trigrams(self._normalized[position])
+            hits = len(wanted & self._trigrams_cache[position])
+            if hits >= MATCH_THRESHOLD * len(wanted):
+                scored.append((-hits, len(self._normalized[position]), position))
+        return [position for _, _, position in sorted(scored)[:count]]
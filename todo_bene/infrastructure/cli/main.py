@@ -1,5 +1,6 @@
 # Copyright (c) 2026 PhilFiftyEight
 # Licensed under the MIT License.
+import logging
 import sys
 from os import getenv
 import threading
@@ -9,6 +10,7 @@ from contextlib import contextmanager
 import locale
 from uuid import UUID
 from pathlib import Path
+import duckdb
 import typer
 import questionary
 
@@ -26,6 +28,7 @@ from rich.columns import Columns
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import InMemoryHistory
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+from prompt_toolkit.completion import Completer, Completion
 
 import pendulum
 
@@ -39,15 +42,25 @@ from todo_bene.infrastructure.config import (
     setup_logging,
     get_cached_categories,
     save_cached_categories,
+    get_query_profile_path,
+    get_profile_dir,
+    get_archive_dir,
+    get_archive_after_days,
+    get_last_archive_date,
+    update_last_archive_date,
+    get_agent_socket_path,
 )
-from todo_bene.domain.services.mail_engine import run_mail_jobs_background
+from todo_bene.domain.services.mail_engine import has_pending_mail_jobs, run_mail_jobs_background
 
 from todo_bene.domain.services.utils import mask_email
 
 from todo_bene.domain.services.transformer_service import TRANSFORMERS_REGISTRY
 
+from todo_bene.domain.services.title_search import TitleEntry, TitleIndex
+
 from todo_bene.domain.entities.todo import Todo
 from todo_bene.domain.entities.category import Category
+from todo_bene.domain.entities.todo_list_item import TodoListItem
 
 from todo_bene.application.use_cases.user_create import UserCreateUseCase
 
@@ -59,26 +72,43 @@ from todo_bene.application.use_cases.todo_delete import TodoDeleteUseCase
 from todo_bene.application.use_cases.todo_complete import TodoCompleteUseCase
 from todo_bene.application.use_cases.todo_find_top_level_by_user import (
     TodoGetAllRootsByUserUseCase,
+    TodoListViewUseCase,
 )
 from todo_bene.application.use_cases.todo_repetition import RepetitionTodo
 from todo_bene.application.use_cases.todo_update import TodoUpdateUseCase
 from todo_bene.application.use_cases.todo_get import TodoGetUseCase
+from todo_bene.application.use_cases.todo_materialize import MaterializeOccurrenceUseCase
 
+from todo_bene.infrastructure.profiling import ProfileSession
+from todo_bene.infrastructure.key_agent import DEFAULT_IDLE_TIMEOUT, agent_request, is_supported, start_agent, stop_agent
+from todo_bene.infrastructure.persistence.cache.caching_todo_repository import CachingTodoRepository
+from todo_bene.infrastructure.persistence.memory.memory_todo_repository import MemoryTodoRepository
+from todo_bene.infrastructure.persistence.memory.snapshot import load_snapshot
 from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import (
     DuckDBConnectionManager,
 )
 from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import (
     DuckDBTodoRepository,
 )
+from todo_bene.infrastructure.persistence.duckdb.profiled_connection import (
+    ProfiledConnection,
+    QueryProfiler,
+)
 from todo_bene.infrastructure.persistence.duckdb.duckdb_category_repository import (
     DuckDBCategoryRepository,
 )
+from todo_bene.infrastructure.persistence.duckdb.todo_archive import DuckDBTodoArchive
+from todo_bene.infrastructure.persistence.duckdb.maintenance import maintain_database
 
 setup_logging()
+logger = logging.getLogger()
 
 
 app = typer.Typer()
 console = Console()
+# Options globales de la commande en cours (renseignées par le callback)
+ENGINES = ("duckdb", "memory")
+state = {"engine": "duckdb", "query_profiler": None}
 
 # get locale
 def _get_locale():
@@ -214,18 +244,51 @@ def ensure_user_setup() -> Tuple[UUID, str]:
 
 @contextmanager
 def get_repository(read_only: bool = False):
-    _, db_path, _ = load_user_info()
+    user_id, db_path, _ = load_user_info()
     if not db_path:
         raise RuntimeError(
             "Configuration introuvable. Veuillez lancer 'tb' pour configurer votre profil."
         )
 
+    profiler = state["query_profiler"]
+    if state["engine"] == "memory":
+        # Instantané de la base : la commande travaille en mémoire, rien n'est réécrit sur disque
+        with DuckDBConnectionManager(db_path, read_only=True) as conn:
+            repo = load_snapshot(ProfiledConnection(conn, profiler) if profiler else conn)
+        yield repo
+        return
+
     with DuckDBConnectionManager(db_path, read_only=read_only) as conn:
+        if profiler:
+            conn = ProfiledConnection(conn, profiler)
+        if not read_only:
+            _auto_archive(conn, user_id)
         # repo = DuckDBTodoRepository(manager.get_connection())
-        repo = DuckDBTodoRepository(conn)
+        # Cache write-through pour la durée de la commande (lectures répétées des use cases)
+        repo = CachingTodoRepository(DuckDBTodoRepository(conn))
         yield repo
 
 
+def _auto_archive(conn, user_id: UUID):
+    """Archivage automatique du profil ("archive_after_days"), au plus une fois par jour."""
+    days = get_archive_after_days()
+    if days is None or user_id is None or get_last_archive_date() == pendulum.now().to_date_string():
+        return
+    try:
+        DuckDBTodoArchive(conn, get_archive_dir()).archive(user_id, pendulum.now().subtract(days=days).int_timestamp)
+    except (duckdb.Error, OSError) as e:
+        # La commande en cours ne doit pas échouer : nouvel essai au prochain lancement
+        logger.warning(f"Archivage automatique impossible : {e}")
+        return
+    update_last_archive_date()
+
+
+def _category_repository(repo):
+    """Repository des catégories du moteur courant (celui du moteur mémoire, sinon la base)."""
+    categories = getattr(repo, "category_repository", None)
+    return categories if categories is not None else DuckDBCategoryRepository(repo._conn)
+
+
 def get_date_format(short:bool = True)-> str:
     try:
         lang, _ = locale.getlocale()
@@ -407,6 +470,11 @@ def _display_detail_view(todo: Todo, children: list[Todo], countchildrecursiv: i
     console.print(" [b]t[/b]: Terminer | [b]s[/b]: Supprimer |  [b]r[/b]: Retour ")
 
 
+def _list_page_size() -> int:
+    """Nombre de racines affichées par page : ce qui tient dans le terminal (bandeaux et invite compris)."""
+    return max(5, (console.size.height or 24) - 12)
+
+
 def create_session_with_history(items: list[str]) -> PromptSession:
     """Crée une session prompt-toolkit avec un historique pré-rempli."""
     history = InMemoryHistory()
@@ -419,6 +487,36 @@ def create_session_with_history(items: list[str]) -> PromptSession:
     )
 
 
+class TitleCompleter(Completer):
+    """Propose les Todos dont le titre correspond à la saisie (index en mémoire, aucun accès base)."""
+
+    def __init__(self, index: TitleIndex):
+        self.index = index
+        self.titles = {entry.uuid: entry.title for entry in index.entries}
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        for entry in self.index.search(text):
+            parent = self.titles.get(entry.parent)
+            yield Completion(
+                f"{entry.title} #{str(entry.uuid)[:8]}",
+                start_position=-len(text),
+                display=entry.title,
+                display_meta=f"{entry.category} ↳ {parent}" if parent else entry.category,
+            )
+
+
+def _resolve_find_answer(index: TitleIndex, answer: str) -> Optional[TitleEntry]:
+    """Une complétion acceptée se termine par '#<uuid8>', sinon on retient le meilleur résultat."""
+    title, _, short_id = answer.strip().rpartition(" #")
+    if title and short_id:
+        for entry in index.entries:
+            if str(entry.uuid).startswith(short_id):
+                return entry
+    results = index.search(answer)
+    return results[0] if results else None
+
+
 def _handle_action(
     choice: str, todo: Todo, children: list[Todo], repo: DuckDBTodoRepository, user_id: UUID
 ) -> tuple[bool, bool]:
@@ -458,7 +556,7 @@ def _handle_action(
             default=current_priority,
         )
 
-        cat_repo = DuckDBCategoryRepository(repo._conn)
+        cat_repo = _category_repository(repo)
         categories = CategoryListUseCase(cat_repo).execute(user_id)
         cat_session = create_session_with_history(categories)
         categories = " / ".join([category for category in categories])
@@ -629,21 +727,20 @@ def _execute_completion_logic(todo: Todo, repo: DuckDBTodoRepository, user_id: U
     return False
 
 
-def _display_root_list(roots: list[Todo], repo, period: str = "all"):
-    # --- CACHE EMOJI
-    emoji_cache = {}
-    if roots:
-        user_id = roots[0].user
-        from todo_bene.infrastructure.persistence.duckdb.duckdb_category_repository import DuckDBCategoryRepository
-        cat_repo = DuckDBCategoryRepository(repo._conn)
-        all_cats = CategoryListUseCase(cat_repo).execute(user_id)
-        for name in all_cats:
-            emoji_cache[name] = Category(name=name, user_id=user_id).emoji
+def _group_header(group: str, period: str) -> str:
+    """Libellé localisé d'un bandeau de la vue agenda (jour pour 'week', semaine pour 'month')."""
+    start = pendulum.parse(group, tz=pendulum.local_timezone())
+    if period == "month":
+        return f"SEMAINE {start.week_of_year} ({start.format('DD/MM', locale=_get_locale())})"
+    return start.format("dddd DD MMMM", locale=_get_locale()).upper()
+
 
+def _display_root_list(items: list[TodoListItem], period: str = "all", start: int = 1):
+    # Émojis et progression viennent de la projection (aucune requête pendant le rendu)
     tz = pendulum.local_timezone()
     date_fmt = get_date_format()
     table = Table(box=box.SIMPLE, header_style="bold", row_styles=["none", "dim"], padding=0)
-    table.add_column("Idx", justify="right", style="cyan", width=3)
+    table.add_column("Idx", justify="right", style="cyan", width=max(3, len(str(start + len(items)))))
     table.add_column(" ", justify="center", width=2)
     table.add_column("Titre", style="blue")
     table.add_column("Description", style="white", no_wrap=True)
@@ -652,34 +749,25 @@ def _display_root_list(roots: list[Todo], repo, period: str = "all"):
 
     last_group = None
 
-    for idx, todo in enumerate(roots, 1):
+    for idx, item in enumerate(items, start):
+        todo = item.todo
         # --- LOGIQUE DE REGROUPEMENT ---
-        current_group = None
-        dt_due = pendulum.from_timestamp(todo.date_due, tz=tz)
-
-        if period == "week":
-            current_group = dt_due.format("dddd DD MMMM", locale=_get_locale()).upper()
-        elif period == "month":
-            current_group = f"SEMAINE {dt_due.week_of_year} ({dt_due.start_of('week').format('DD/MM', locale=_get_locale())})"
-
-        if current_group and current_group != last_group:
+        # Clé calculée et triée par le repository : on ne fait qu'insérer les bandeaux
+        if item.group and item.group != last_group:
             if last_group is not None:
                 table.add_row("", "", "", "", "", "")
 
             table.add_row(
-                "", "", current_group, "", "", "",
+                "", "", _group_header(item.group, period), "", "", "",
                 style=Style(color="yellow", dim=False, bold=True)
             )
             table.add_section()
-            last_group = current_group
+            last_group = item.group
         # ----------------------------------------------
 
         prio_mark = "🔥" if todo.priority else ""
-        count_child, count_completed = repo.count_all_descendants(todo.uuid)
-        emoji = emoji_cache.get(todo.category, "🔖")
-
-        progress_bar = render_inline_progress(count_completed, count_child)
-        display_title = inner_table(todo.title, emoji, progress_bar)
+        progress_bar = render_inline_progress(item.completed, item.total)
+        display_title = inner_table(todo.title, item.emoji, progress_bar)
 
         raw_desc = str(todo.description) if todo.description else ""
         desc = (raw_desc[:15] + "...") if len(raw_desc) > 15 else raw_desc
@@ -696,11 +784,14 @@ def _display_root_list(roots: list[Todo], repo, period: str = "all"):
         )
     console.print(table)
 
-def _handle_list_navigation(choice: str, roots: list[Todo], user_id: UUID, repo: DuckDBTodoRepository) -> bool:
+def _handle_list_navigation(choice: str, roots: list[Todo], user_id: UUID, repo: DuckDBTodoRepository, offset: int = 0) -> bool:
     try:
-        idx = int(choice) - 1
+        # Les index affichés sont globaux : on retire ceux des pages précédentes
+        idx = int(choice) - 1 - offset
         if 0 <= idx < len(roots):
-            show_details(roots[idx].uuid, user_id, repo)
+            # Une occurrence virtuelle de série est matérialisée à l'ouverture (avant modification / complétion)
+            root = MaterializeOccurrenceUseCase(repo).execute(roots[idx])
+            show_details(root.uuid, user_id, repo)
             return True
         else:
             continue_after_invalid("Index inconnu.")
@@ -722,6 +813,11 @@ def _handle_navigation(choice: str, children: list[Todo], user_id: UUID, repo: D
 
 
 def show_details(todo_uuid: UUID, user_id: UUID, repo: DuckDBTodoRepository) -> bool:
+    # Cache de session : naviguer dans l'arbre ne relance pas les mêmes requêtes
+    # (les sous-vues récursives partagent le même cache, invalidé par les écritures).
+    # get_repository fournit déjà un repository en cache ; on ne l'ajoute que s'il manque.
+    if not isinstance(repo, CachingTodoRepository):
+        repo = CachingTodoRepository(repo)
     while True:
             todo, children, countchildrecursiv, _ = TodoGetUseCase(repo).execute(todo_uuid, user_id) # _ = completed, not use there
             _display_detail_view(todo, children, countchildrecursiv, repo)
@@ -738,8 +834,41 @@ def show_details(todo_uuid: UUID, user_id: UUID, repo: DuckDBTodoRepository) ->
 
 
 @app.callback(invoke_without_command=True)
-def main(ctx: typer.Context):
+def main(
+    ctx: typer.Context,
+    engine: Annotated[
+        str,
+        typer.Option("--engine", help="duckdb (défaut) ou memory : copie éphémère de la base, rien n'est enregistré")
+    ] = "duckdb",
+    profile_db: Annotated[
+        bool,
+        typer.Option("--profile-db", help="Affiche les requêtes SQL de la commande (nombre, lignes, durée)")
+    ] = False,
+    profile_db_log: Annotated[
+        bool,
+        typer.Option("--profile-db-log", help="Comme --profile-db, et ajoute le profil au fichier query_profile.jsonl")
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Profile la commande (cProfile .pstats + piles repliées pour flame graph)")
+    ] = False,
+):
     """Pour une organisation simplifiée et lutter contre la procrastination"""
+    if engine not in ENGINES:
+        raise typer.BadParameter(f"Moteur inconnu : {engine} ({', '.join(ENGINES)})")
+    state["engine"] = engine
+    # TODO_BENE_PROFILE_DB=1 équivaut à --profile-db, TODO_BENE_PROFILE_DB=jsonl à --profile-db-log
+    env_profile = (getenv("TODO_BENE_PROFILE_DB") or "").lower()
+    profile_db_log = profile_db_log or env_profile == "jsonl"
+    state["query_profiler"] = None
+    if profile_db or profile_db_log or env_profile in ("1", "true", "jsonl"):
+        profiler = QueryProfiler()
+        state["query_profiler"] = profiler
+        ctx.call_on_close(lambda: _report_query_profile(profiler, ctx.invoked_subcommand, profile_db_log))
+    if profile:
+        # Arrêté à la fermeture du contexte, donc après la sous-commande (même en cas d'erreur ou d'Exit)
+        session = ProfileSession(get_profile_dir(), ctx.invoked_subcommand or "tb").start()
+        ctx.call_on_close(lambda: _report_profile(session))
     if ctx.invoked_subcommand == "register":
         return
     user_id, db_path = ensure_user_setup()
@@ -749,6 +878,33 @@ def main(ctx: typer.Context):
         raise typer.Exit()
 
 
+def _report_query_profile(profiler: QueryProfiler, command: Optional[str], log: bool):
+    """Tableau récapitulatif des requêtes de la commande (et ligne JSONL si demandé)."""
+    table = Table(
+        title=f"Requêtes SQL de 'tb {command or ''}' : {profiler.total_count} en {profiler.total_ms:.1f} ms",
+        box=box.SIMPLE,
+    )
+    table.add_column("Nb", justify="right")
+    table.add_column("Lignes", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Requête", overflow="ellipsis", no_wrap=True, max_width=80)
+    for stats in profiler.summary():
+        table.add_row(
+            str(stats.count), str(stats.rows), f"{stats.total_ms:.1f}", f"{stats.max_ms:.1f}", stats.fingerprint
+        )
+    console.print()
+    console.print(table)
+    if log:
+        profiler.append_jsonl(get_query_profile_path(), command)
+
+
+def _report_profile(session: ProfileSession):
+    pstats_path, collapsed_path = session.stop()
+    console.print(f"[dim]Profil : {pstats_path}[/dim]")
+    console.print(f"[dim]Piles repliées (flame graph) : {collapsed_path}[/dim]")
+
+
 def complete_category(incomplete: str):
     user_id, _, _ = load_user_info()
     if not user_id:
@@ -762,7 +918,7 @@ def complete_category(incomplete: str):
     # 2. Fallback : Si le cache est vide interroger la base
     if not user_categories:
         with get_repository() as repo:
-            cat_repo = DuckDBCategoryRepository(repo._conn)
+            cat_repo = _category_repository(repo)
             user_categories = cat_repo.get_all_categories(user_id)
             save_cached_categories(user_categories)
     
@@ -797,7 +953,7 @@ def create(
     effective_user_id = user_id if user_id else load_user_info()[0]
 
     with get_repository() as repo:
-        cat_repo = DuckDBCategoryRepository(repo._conn)
+        cat_repo = _category_repository(repo)
         list_use_case = CategoryListUseCase(cat_repo)
         all_allowed = list_use_case.execute(effective_user_id)
         temp_cat = Category(name=category or "Quotidien", user_id=effective_user_id)
@@ -883,10 +1039,33 @@ def list_todos(
     ] = "today",
 ):
     user_id, _, _ = load_user_info()
+    page_size = _list_page_size()
+    after = before = None
+    offset = 0
+    mail_started = False
     with get_repository() as repo:
+        use_case = TodoListViewUseCase(repo)
         while True:
-            use_case = TodoGetAllRootsByUserUseCase(repo)
-            roots, postponed_count = use_case.execute(user_id, category=category, exclude_category=exclude_category, period=period)
+            # Une page à la fois (pagination par clé) : une ligne de plus indique s'il reste une page
+            items, postponed_count = use_case.execute(
+                user_id, category=category, exclude_category=exclude_category, period=period,
+                after=after, before=before, limit=page_size + 1,
+            )
+            if before is not None:
+                has_previous, has_next = len(items) > page_size, True
+                items = items[-page_size:]
+                if not has_previous:
+                    offset = 0
+            else:
+                has_previous, has_next = offset > 0, len(items) > page_size
+                items = items[:page_size]
+            if not items and offset:
+                # La page courante s'est vidée (tâches terminées) : retour au début
+                after = before = None
+                offset = 0
+                continue
+            # Triées par échéance par le repository (évite les doublons de bandeaux jaunes)
+            roots = [item.todo for item in items]
             if not roots:
                 msg = f"Aucun Todo trouvé pour la période '{period}'"
                 if category:
@@ -895,14 +1074,19 @@ def list_todos(
                     msg += f" (hors {exclude_category[0]})" if len(exclude_category) == 1 else f" (hors {', '.join(exclude_category)})"
                 show_error(f"{msg}.", title="Vide")
                 return
-            # LANCEMENT DU THREAD (JUSTE APRÈS LA RÉCUPÉRATION)
-            # On passe 'roots' au thread pour éviter un second appel repo.get_all
-            nt_thread = threading.Thread(
-                target=run_mail_jobs_background,
-                args=(roots,),
-                daemon=True
-            )
-            nt_thread.start()
+            # LANCEMENT DU THREAD (une fois, seulement si un envoi est attendu aujourd'hui)
+            # Le mail porte sur toute la période, pas seulement sur la page affichée
+            if not mail_started and has_pending_mail_jobs():
+                all_roots, _ = TodoGetAllRootsByUserUseCase(repo).execute(
+                    user_id, category=category, exclude_category=exclude_category, period=period
+                )
+                nt_thread = threading.Thread(
+                    target=run_mail_jobs_background,
+                    args=(all_roots,),
+                    daemon=True
+                )
+                nt_thread.start()
+            mail_started = True
 
             if sys.stdin.isatty():
                 console.clear()
@@ -915,18 +1099,24 @@ def list_todos(
                     )
                 )
 
-
-            # On trie la liste par date d'échéance pour éviter les doublons de bandeaux jaunes
-            roots = sorted(roots, key=lambda x: x.date_due)
-            # -----------------------------
-            _display_root_list(roots, repo, period=period)
+            _display_root_list(items, period=period, start=offset + 1)
             count = len(roots)
-            message = (
-                f"{count} tâche racine trouvée"
-                if count <= 1
-                else f"{count} tâches racines trouvées"
-            )
+            if has_previous or has_next:
+                message = f"Tâches racines {offset + 1} à {offset + count}"
+            else:
+                message = (
+                    f"{count} tâche racine trouvée"
+                    if count <= 1
+                    else f"{count} tâches racines trouvées"
+                )
             console.print(f"\n[dim] {message} pour la période '{period}'.[/dim]")
+            pages = []
+            if has_previous:
+                pages.append("[b]p[/b]: Page précédente")
+            if has_next:
+                pages.append("[b]n[/b]: Page suivante")
+            if pages:
+                console.print(" " + " | ".join(pages))
             try:
                 choice = Prompt.ask(
                     "\nSaisissez l'index (ou 'q' pour quitter)", default="q"
@@ -935,18 +1125,62 @@ def list_todos(
                 break
             if choice == "q":
                 break
-            _handle_list_navigation(choice, roots, user_id, repo)
+            if choice == "n" and has_next:
+                after, before = items[-1].cursor, None
+                offset += count
+                continue
+            if choice == "p" and has_previous:
+                after, before = None, items[0].cursor
+                offset = max(0, offset - page_size)
+                continue
+            # Après la vue détail on relit la même page (même curseur)
+            _handle_list_navigation(choice, roots, user_id, repo, offset=offset)
+            if not sys.stdin.isatty():
+                break
+
+
+@app.command(name="find")
+def find_todos():
+    """Recherche interactive parmi les Todos actifs (filtrage à chaque frappe)."""
+    user_id, _, _ = load_user_info()
+    with get_repository() as repo:
+        # Chargé une fois : la saisie est ensuite filtrée en mémoire, sans requête par caractère
+        index = TitleIndex(repo.find_title_entries(user_id))
+        if not len(index):
+            show_error("Aucun Todo actif.", title="Vide")
+            return
+        session = PromptSession(completer=TitleCompleter(index), complete_while_typing=True)
+        while True:
+            try:
+                answer = session.prompt("🔎 Rechercher : ")
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not answer.strip():
+                break
+            entry = _resolve_find_answer(index, answer)
+            if entry is None:
+                show_error(f"Aucun Todo ne correspond à '{answer.strip()}'.", title="Recherche")
+            else:
+                show_details(entry.uuid, user_id, repo)
+                # Les titres ont pu changer dans la vue détail : on recharge l'index (une requête)
+                index = TitleIndex(repo.find_title_entries(user_id))
+                session.completer = TitleCompleter(index)
             if not sys.stdin.isatty():
                 break
 
 
 @app.command(name="list-dev")
 def list_dev():
+    """Vue développeur : tous les Todos, en base et archivés (tb archive)."""
     with get_repository() as repo:
-        query = "SELECT * FROM todos"
-        todos = [
-            repo._row_to_todo(todo) for todo in repo._conn.execute(query).fetchall()
-        ]
+        if isinstance(repo, MemoryTodoRepository):
+            todos = list(repo.todos.values())
+        else:
+            # Todos en base et archivés (tb archive)
+            query = f"SELECT * FROM {DuckDBTodoArchive(repo._conn, get_archive_dir()).history_source()}"
+            todos = [
+                repo._row_to_todo(todo) for todo in repo._conn.execute(query).fetchall()
+            ]
         if not todos:
             # console.print("[yellow]La base est vide pour cet utilisateur.[/yellow]")
             show_error("La base est vide pour cet utilisateur.", title="Debug")
@@ -973,6 +1207,46 @@ def list_dev():
         console.print(f"\n[dim] Total : {len(todos)} items en base.[/dim]")
 
 
+@app.command(name="archive")
+def archive_todos(
+    days: Annotated[
+        Optional[int],
+        typer.Option("--days", "-d", help="Âge minimal (jours) des tâches terminées à archiver (défaut : profil, sinon 90)")
+    ] = None,
+    stats: Annotated[
+        bool,
+        typer.Option("--stats", help="Affiche les tâches terminées par mois (base et archive), sans archiver")
+    ] = False,
+):
+    """
+    Déplace les tâches terminées anciennes vers l'archive Parquet (partitionnée par mois).
+    Les tâches archivées ne sont plus proposées par la recherche : seuls --stats et list-dev les lisent.
+    """
+    user_id, _, _ = load_user_info()
+    if state["engine"] == "memory":
+        show_error("L'archivage n'est pas disponible avec --engine memory.", title="Archive")
+        raise typer.Exit(1)
+    with get_repository(read_only=stats) as repo:
+        archive = DuckDBTodoArchive(repo._conn, get_archive_dir())
+        if stats:
+            rows = archive.completion_stats(user_id)
+            title = "Tâches terminées par mois"
+        else:
+            days = days if days is not None else (get_archive_after_days() or 90)
+            rows = list(archive.archive(user_id, pendulum.now().subtract(days=days).int_timestamp).items())
+            title = f"Tâches archivées (terminées depuis plus de {days} jours)"
+    if not rows:
+        show_success("Rien à archiver." if not stats else "Aucune tâche terminée.", title="Archive")
+        return
+    table = Table(title=title, box=box.SIMPLE)
+    table.add_column("Mois")
+    table.add_column("Tâches", justify="right")
+    for month, count in rows:
+        table.add_row(month, str(count))
+    console.print(table)
+    console.print(f"[dim]Archive : {archive.directory}[/dim]")
+
+
 # Création du sous-groupe pour les mails
 mail_app = typer.Typer(help="Gestion de la configuration et des envois d'emails.")
 
@@ -1082,7 +1356,7 @@ def add_job(
     #from application.use_cases.category_use_cases import list_categories
     user_id, _, _ = load_user_info()
     with get_repository() as repo:
-        cat_repo = DuckDBCategoryRepository(repo._conn)
+        cat_repo = _category_repository(repo)
         list_use_case = CategoryListUseCase(cat_repo)
         all_categories= list_use_case.execute(user_id)
 
@@ -1127,5 +1401,85 @@ def add_job(
 app.add_typer(mail_app, name="mail")
 
 
+# Sous-groupe d'entretien de la base
+db_app = typer.Typer(help="Entretien de la base de données.")
+
+
+def _format_size(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f} Mo" if size >= 1024 * 1024 else f"{size / 1024:.1f} Ko"
+
+
+@db_app.command(name="maintain")
+def db_maintain():
+    """CHECKPOINT puis réécriture de la base dans un fichier compact (tailles avant / après)."""
+    _, db_path, _ = load_user_info()
+    if state["engine"] == "memory":
+        show_error("L'entretien de la base n'est pas disponible avec --engine memory.", title="Base")
+        raise typer.Exit(1)
+    try:
+        with console.status("Compactage de la base..."):
+            report = maintain_database(db_path)
+    except (duckdb.IOException, duckdb.InvalidInputException) as e:
+        # Base verrouillée, WAL résiduel ou copie incomplète : le fichier d'origine est intact
+        show_error(f"Entretien impossible : {e}", title="Base")
+        raise typer.Exit(1)
+    table = Table(title=f"Entretien de {db_path}", box=box.SIMPLE)
+    table.add_column("")
+    table.add_column("Avant", justify="right")
+    table.add_column("Après", justify="right")
+    table.add_row("Base", _format_size(report.db_before), _format_size(report.db_after))
+    table.add_row("Journal (WAL)", _format_size(report.wal_before), _format_size(report.wal_after))
+    table.add_row("Total", _format_size(report.before), _format_size(report.after), style="bold")
+    console.print(table)
+    if report.before:
+        console.print(f"[dim]Gain : {100 * (report.before - report.after) / report.before:.0f} %[/dim]")
+
+
+app.add_typer(db_app, name="db")
+
+
+# Sous-groupe de l'agent de clé maître
+agent_app = typer.Typer(help="Agent local de clé maître (évite l'accès au trousseau à chaque commande).")
+
+
+@agent_app.command(name="start")
+def agent_start(
+    timeout: Annotated[
+        int,
+        typer.Option("--timeout", "-t", help="Arrêt automatique après ce nombre de secondes sans demande")
+    ] = DEFAULT_IDLE_TIMEOUT,
+):
+    """Démarre l'agent : la clé est lue une fois dans le trousseau puis servie aux commandes tb."""
+    if not is_supported():
+        show_error("L'agent de clé nécessite les sockets Unix.", title="Agent")
+        raise typer.Exit(1)
+    socket_path = get_agent_socket_path()
+    if start_agent(socket_path, timeout):
+        show_success(f"Agent démarré ({socket_path}), arrêt après {timeout} s d'inactivité.", title="Agent")
+    else:
+        show_success("L'agent tourne déjà.", title="Agent")
+
+
+@agent_app.command(name="stop")
+def agent_stop():
+    """Arrête l'agent (la clé n'est plus conservée en mémoire)."""
+    if stop_agent(get_agent_socket_path()):
+        show_success("Agent arrêté.", title="Agent")
+    else:
+        show_error("Aucun agent en cours.", title="Agent")
+
+
+@agent_app.command(name="status")
+def agent_status():
+    socket_path = get_agent_socket_path()
+    if agent_request(socket_path, b"PING") == b"PONG":
+        console.print(f"[green]Agent actif[/green] [dim]({socket_path})[/dim]")
+    else:
+        console.print("[yellow]Aucun agent en cours.[/yellow]")
+
+
+app.add_typer(agent_app, name="agent")
+
+
 if __name__ == "__main__":
     app()
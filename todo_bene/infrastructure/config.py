@@ -12,6 +12,8 @@ import pendulum
 import keyring
 from cryptography.fernet import Fernet
 
+from todo_bene.infrastructure.key_agent import agent_request
+
 
 class SensitiveDataFilter(logging.Filter):
     """Filtre de sécurité pour masquer les données sensibles dans les logs."""
@@ -75,6 +77,15 @@ def setup_logging():
 
 # Variable globale pour le cache de session (mémoire vive uniquement)
 _SESSION_MASTER_KEY = None
+# Fernet de la clé de session, construit une fois par processus (clé, instance)
+_SESSION_FERNET: Optional[Tuple[bytes, Fernet]] = None
+
+
+def get_agent_socket_path() -> Path:
+    """Socket Unix de l'agent de clé maître (tb agent start), dans le dossier data."""
+    _, data_dir = get_base_paths()
+    return data_dir / "agent.sock"
+
 
 #     return stored_key.encode('utf-8')
 def get_or_create_master_key() -> bytes:
@@ -87,6 +98,12 @@ def get_or_create_master_key() -> bytes:
     if _SESSION_MASTER_KEY is not None:
         return _SESSION_MASTER_KEY
 
+    # Agent local démarré (tb agent start) : pas d'aller-retour avec le trousseau
+    agent_key = agent_request(get_agent_socket_path())
+    if agent_key:
+        _SESSION_MASTER_KEY = agent_key
+        return _SESSION_MASTER_KEY
+
     # Détection de l'environnement de test (via ta variable d'env existante)
     is_test = os.getenv("TODO_BENE_CONFIG_PATH") is not None and "pytest" in os.getenv("TODO_BENE_CONFIG_PATH", "")
 
@@ -119,6 +136,15 @@ def get_or_create_master_key() -> bytes:
     return _SESSION_MASTER_KEY
 
 
+def get_fernet() -> Fernet:
+    """Instance Fernet de la clé maître, mise en cache pour le processus."""
+    global _SESSION_FERNET
+    master_key = get_or_create_master_key()
+    if _SESSION_FERNET is None or _SESSION_FERNET[0] != master_key:
+        _SESSION_FERNET = (master_key, Fernet(master_key))
+    return _SESSION_FERNET[1]
+
+
 def decrypt_value(encrypted_value: str) -> str:
     """
     Déchiffre une valeur (email, mot de passe) en utilisant la Master Key.
@@ -127,8 +153,7 @@ def decrypt_value(encrypted_value: str) -> str:
     if not encrypted_value:
         return ""
 
-    master_key = get_or_create_master_key()
-    f = Fernet(master_key)
+    f = get_fernet()
 
     try:
         # Fernet attend des bytes, on décode la chaîne chiffrée
@@ -147,8 +172,7 @@ def encrypt_value(plain_text: str) -> str:
     if not plain_text:
         return ""
 
-    master_key = get_or_create_master_key()
-    f = Fernet(master_key)
+    f = get_fernet()
 
     # Fernet travaille sur des bytes, on encode le texte
     encrypted_bytes = f.encrypt(plain_text.encode('utf-8'))
@@ -294,6 +318,117 @@ def save_cached_categories(categories: List[str]):
         save_full_config(config)
 
 
+def get_frequency_cache_path() -> Optional[Path]:
+    """
+    Chemin du cache disque des fréquences analysées (dossier data).
+    Retourne None si le profil actif l'a désactivé ("frequency_cache": false).
+    """
+    _, _, profile_name = load_user_info()
+    config = load_full_config()
+    if not config.get("profiles", {}).get(profile_name, {}).get("frequency_cache", True):
+        return None
+    _, data_dir = get_base_paths()
+    return data_dir / "frequency_cache.json"
+
+
+def get_query_profile_path() -> Path:
+    """Fichier JSONL des profils de requêtes (tb --profile-db-log), dans le dossier data."""
+    _, data_dir = get_base_paths()
+    return data_dir / "query_profile.jsonl"
+
+
+def get_profile_dir() -> Path:
+    """Dossier des profils d'exécution (tb --profile), dans le dossier data."""
+    _, data_dir = get_base_paths()
+    return data_dir / "profiles"
+
+
+def get_db_encrypted(db_path: str) -> Optional[bool]:
+    """Chiffrement mémorisé de la base ("db_encrypted" du profil qui l'utilise), None si inconnu."""
+    for profile in load_full_config().get("profiles", {}).values():
+        if profile.get("db_path") == db_path:
+            return profile.get("db_encrypted")
+    return None
+
+
+def save_db_encrypted(db_path: str, encrypted: bool):
+    """Mémorise dans les profils qui l'utilisent si la base est chiffrée (écrit seulement si ça change)."""
+    config = load_full_config()
+    changed = False
+    for profile in config.get("profiles", {}).values():
+        if profile.get("db_path") == db_path and profile.get("db_encrypted") != encrypted:
+            profile["db_encrypted"] = encrypted
+            changed = True
+    if changed:
+        save_full_config(config)
+
+
+def get_crypto_needs_httpfs(duckdb_version: str) -> Optional[bool]:
+    """Besoin de httpfs pour écrire une base chiffrée avec cette version de DuckDB, None si jamais vérifié."""
+    return load_full_config().get("crypto_httpfs", {}).get(duckdb_version)
+
+
+def save_crypto_needs_httpfs(duckdb_version: str, needed: bool):
+    """Mémorise (hors profils : dépend de DuckDB, pas de la base) si l'écriture chiffrée demande httpfs."""
+    config = load_full_config()
+    if config.get("crypto_httpfs", {}).get(duckdb_version) != needed:
+        config.setdefault("crypto_httpfs", {})[duckdb_version] = needed
+        save_full_config(config)
+
+
+def get_archive_dir() -> Path:
+    """Dossier de l'archive Parquet des todos terminés du profil actif (tb archive), dans le dossier data."""
+    _, _, profile_name = load_user_info()
+    _, data_dir = get_base_paths()
+    return data_dir / "archive" / (profile_name or "default")
+
+
+def get_archive_after_days() -> Optional[int]:
+    """
+    Archivage automatique du profil actif ("archive_after_days") : âge en jours au-delà duquel
+    les sous-arbres terminés sont archivés, une fois par jour. None (défaut) le désactive.
+    """
+    _, _, profile_name = load_user_info()
+    config = load_full_config()
+    days = config.get("profiles", {}).get(profile_name, {}).get("archive_after_days")
+    return int(days) if days else None
+
+
+def get_last_archive_date() -> Optional[str]:
+    _, _, profile_name = load_user_info()
+    config = load_full_config()
+    return config.get("profiles", {}).get(profile_name, {}).get("last_auto_archive")
+
+
+def update_last_archive_date():
+    _, _, profile_name = load_user_info()
+    if not profile_name:
+        return
+
+    config = load_full_config()
+    if "profiles" in config and profile_name in config["profiles"]:
+        config["profiles"][profile_name]["last_auto_archive"] = pendulum.now().to_date_string()
+        save_full_config(config)
+
+
+def get_repetition_mode() -> str:
+    """
+    Mode de répétition du profil actif ("repetition_mode") :
+    'materialized' (défaut, toutes les occurrences sont écrites), 'series' (occurrences virtuelles)
+    ou 'horizon' (seules les prochaines occurrences sont écrites, cf. get_repetition_horizon).
+    """
+    _, _, profile_name = load_user_info()
+    config = load_full_config()
+    return config.get("profiles", {}).get(profile_name, {}).get("repetition_mode", "materialized")
+
+
+def get_repetition_horizon() -> int:
+    """Nombre d'occurrences à venir gardées matérialisées en mode 'horizon' ("repetition_horizon", 7 par défaut)."""
+    _, _, profile_name = load_user_info()
+    config = load_full_config()
+    return int(config.get("profiles", {}).get(profile_name, {}).get("repetition_horizon", 7))
+
+
 def get_last_postpone_date() -> Optional[str]:
     _, _, profile_name = load_user_info()
     config = load_full_config()
@@ -0,0 +1,139 @@
+"""
+Agent local de clé maître, à la manière de ssh-agent.
+
+Lancé par `tb agent start`, il lit la clé dans le trousseau une seule fois puis la sert
+sur une socket Unix (accessible au seul utilisateur) aux commandes tb suivantes, qui
+évitent ainsi l'aller-retour D-Bus / Secret Service. Il s'arrête seul après `idle_timeout`
+secondes sans demande, ou sur `tb agent stop`.
+
+Protocole : une ligne par connexion, GET (la clé), PING ou STOP ; réponse sur une ligne.
+"""
+import argparse
+import os
+import socket
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_IDLE_TIMEOUT = 900
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def agent_request(socket_path: Path, command: bytes = b"GET", timeout: float = 0.5) -> Optional[bytes]:
+    """Envoie une commande à l'agent ; None s'il ne tourne pas (socket absente ou orpheline)."""
+    if not is_supported() or not Path(socket_path).exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(command + b"\n")
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = client.recv(256)
+                if not chunk:
+                    break
+                data += chunk
+    except OSError:
+        return None
+    return data.strip() or None
+
+
+class KeyAgent:
+    """Serveur de la clé maître sur une socket Unix, arrêté après `idle_timeout` secondes d'inactivité."""
+
+    def __init__(self, socket_path: Path, key: bytes, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.socket_path = Path(socket_path)
+        self.key = key
+        self.idle_timeout = idle_timeout
+
+    @staticmethod
+    def _same_user(client: socket.socket) -> bool:
+        """Vérifie l'uid du processus client (Linux) ; ailleurs, seules les permissions de la socket protègent."""
+        if not hasattr(socket, "SO_PEERCRED"):
+            return True
+        credentials = client.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+        return uid == os.getuid()
+
+    def serve(self) -> None:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Socket créée en 0600 : pas de fenêtre où un autre utilisateur pourrait s'y connecter
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(self.socket_path))
+        finally:
+            os.umask(previous_umask)
+        server.listen()
+        server.settimeout(self.idle_timeout)
+        try:
+            while True:
+                try:
+                    client, _ = server.accept()
+                except socket.timeout:
+                    break
+                with client:
+                    client.settimeout(1.0)
+                    try:
+                        if not self._same_user(client):
+                            continue
+                        command = client.recv(64).strip()
+                        if command == b"GET":
+                            client.sendall(self.key + b"\n")
+                        elif command == b"PING":
+                            client.sendall(b"PONG\n")
+                        elif command == b"STOP":
+                            client.sendall(b"OK\n")
+                            break
+                    except OSError:
+                        continue
+        finally:
+            server.close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+def start_agent(socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT, wait: float = 5.0) -> bool:
+    """Démarre l'agent en arrière-plan (processus détaché) ; False s'il tournait déjà."""
+    if agent_request(socket_path, b"PING") == b"PONG":
+        return False
+    subprocess.Popen(
+        [sys.executable, "-m", "todo_bene.infrastructure.key_agent",
+         "--socket", str(socket_path), "--timeout", str(idle_timeout)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if agent_request(socket_path, b"PING") == b"PONG":
+            return True
+        time.sleep(0.05)
+    raise RuntimeError(f"L'agent de clé n'a pas démarré ({socket_path})")
+
+
+def stop_agent(socket_path: Path) -> bool:
+    """Arrête l'agent ; False s'il ne tournait pas."""
+    return agent_request(socket_path, b"STOP") == b"OK"
+
+
+def main():
+    cli = argparse.ArgumentParser(description="Agent local de clé maître todo_bene")
+    cli.add_argument("--socket", type=Path, required=True)
+    cli.add_argument("--timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, help="Inactivité (s) avant arrêt")
+    args = cli.parse_args()
+
+    # Import tardif : config interroge l'agent, l'agent n'en dépend qu'ici
+    from todo_bene.infrastructure.config import get_or_create_master_key
+
+    KeyAgent(args.socket, get_or_create_master_key(), args.timeout).serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+from collections import OrderedDict
+from copy import copy
+from typing import Iterator, Optional
+from uuid import UUID
+
+from todo_bene.domain.entities.todo import Todo
+from todo_bene.domain.entities.series import Series
+from todo_bene.domain.entities.todo_list_item import TodoListItem
+from todo_bene.domain.services.title_search import TitleEntry
+from todo_bene.application.interfaces.todo_repository import TodoRepository
+
+
+class _LRU(OrderedDict):
+    """Dictionnaire borné : l'entrée la moins récemment utilisée sort en premier."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class CachingTodoRepository(TodoRepository):
+    """
+    Décorateur de repository avec cache en écriture directe (write-through), pour n'importe
+    quelle implémentation (DuckDB, mémoire).
+
+    Sont mis en cache :
+    - les Todos par uuid (LRU borné), absence comprise ;
+    - l'index parent -> enfants (find_by_parent) et les compteurs de sous-arbre
+      (count_all_descendants charge tout le sous-arbre en une requête) ;
+    - les tâches actives par utilisateur (find_all_active_by_user).
+
+    Les écritures passent au repository décoré, mettent à jour le Todo en cache puis
+    invalident exactement ce qu'elles modifient : la liste d'enfants des parents concernés,
+    les compteurs des ancêtres et les tâches actives de l'utilisateur. Les liens
+    (parent, utilisateur) de chaque Todo vu sont conservés hors LRU pour que
+    l'invalidation reste exacte après une éviction.
+    Les lectures de listes (vue liste, recherche, séries...) ne sont pas mises en cache.
+
+    Les Todos sont copiés à l'entrée et à la sortie : un appelant qui modifie un Todo
+    sans le sauvegarder ne peut pas altérer le cache.
+    """
+    DEFAULT_MAXSIZE = 2048
+
+    def __init__(self, inner: TodoRepository, maxsize: int = DEFAULT_MAXSIZE):
+        self._inner = inner
+        self.maxsize = maxsize
+        self._todos: _LRU = _LRU(maxsize)
+        self._children: _LRU = _LRU(maxsize)
+        self._counts: _LRU = _LRU(maxsize)
+        self._active: dict[UUID, list[Todo]] = {}
+        self._links: dict[UUID, tuple[Optional[UUID], UUID]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        # Attributs propres au repository décoré (ex: _conn pour les catégories)
+        return getattr(self._inner, name)
+
+    def cache_info(self) -> dict:
+        """Compteurs du cache, à la manière de functools.lru_cache."""
+        return {"hits": self.hits, "misses": self.misses, "maxsize": self.maxsize, "currsize": len(self._todos)}
+
+    def _hit(self, cache, key) -> bool:
+        if key in cache:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def _remember(self, todo: Todo) -> None:
+        self._todos[todo.uuid] = todo
+        self._links[todo.uuid] = (todo.parent, todo.user)
+
+    # --- Lectures mises en cache ---
+
+    def get_by_id(self, todo_id: UUID) -> Todo | None:
+        if not self._hit(self._todos, todo_id):
+            todo = self._inner.get_by_id(todo_id)
+            if todo:
+                self._remember(todo)
+            else:
+                self._todos[todo_id] = None
+        todo = self._todos[todo_id]
+        return copy(todo) if todo else None
+
+    def find_by_parent(self, parent_id: UUID) -> list[Todo]:
+        if not self._hit(self._children, parent_id):
+            children = self._inner.find_by_parent(parent_id)
+            for child in children:
+                self._remember(child)
+            self._children[parent_id] = children
+        return [copy(child) for child in self._children[parent_id]]
+
+    def count_all_descendants(self, todo_uuid: UUID) -> tuple[int, int]:
+        if not self._hit(self._counts, todo_uuid):
+            self._load_subtree(todo_uuid)
+        return self._counts[todo_uuid]
+
+    def _load_subtree(self, todo_uuid: UUID) -> None:
+        """Charge le sous-arbre en une requête et calcule les compteurs de tous ses nœuds."""
+        descendants = self._inner.find_descendants(todo_uuid)
+        children_map: dict[UUID, list[Todo]] = {todo_uuid: []}
+        for todo in descendants:
+            children_map.setdefault(todo.uuid, [])
+            children_map.setdefault(todo.parent, []).append(todo)
+            self._remember(todo)
+
+        def count(node: UUID) -> tuple[int, int]:
+            total = completed = 0
+            for child in children_map[node]:
+                subtotal, subcompleted = count(child.uuid)
+                total += 1 + subtotal
+                completed += int(bool(child.state)) + subcompleted
+            self._counts[node] = (total, completed)
+            return total, completed
+
+        count(todo_uuid)
+        for node, children in children_map.items():
+            self._children[node] = children
+
+    def find_all_active_by_user(self, user_id: UUID) -> list[Todo]:
+        if not self._hit(self._active, user_id):
+            active = self._inner.find_all_active_by_user(user_id)
+            for todo in active:
+                self._remember(todo)
+            self._active[user_id] = active
+        return [copy(todo) for todo in self._active[user_id]]
+
+    # --- Écritures : délégation, mise à jour du cache, invalidation ciblée ---
+
+    def _ancestors(self, todo_id: Optional[UUID]) -> Iterator[UUID]:
+        # Un compteur en cache implique que tout son sous-arbre a été vu : ses liens sont connus
+        while todo_id is not None:
+            yield todo_id
+            todo_id = self._links.get(todo_id, (None, None))[0]
+
+    def _invalidate(self, todo_id: UUID, *parents: Optional[UUID], user: Optional[UUID] = None) -> None:
+        parent, known_user = self._links.get(todo_id, (None, None))
+        for node in {p for p in (parent, *parents) if p is not None}:
+            self._children.pop(node, None)
+            for ancestor in self._ancestors(node):
+                self._counts.pop(ancestor, None)
+        for owner in {user, known_user} - {None}:
+            self._active.pop(owner, None)
+
+    def _write(self, todo: Todo) -> None:
+        self._invalidate(todo.uuid, todo.parent, user=todo.user)
+        self._remember(copy(todo))
+
+    def save(self, todo: Todo) -> None:
+        self._inner.save(todo)
+        self._write(todo)
+
+    def save_all(self, todos: list[Todo]) -> None:
+        self._inner.save_all(todos)
+        for todo in todos:
+            self._write(todo)
+
+    def update_state(self, todo_id: UUID, state: bool) -> None:
+        self._inner.update_state(todo_id, state)
+        # Un Todo jamais vu ne figure dans aucune liste ni aucun compteur en cache
+        self._invalidate(todo_id)
+        todo = self._todos.pop(todo_id, None)
+        if todo:
+            todo = copy(todo)
+            todo.state = state
+            self._todos[todo_id] = todo
+
+    def delete(self, todo_id: UUID) -> None:
+        subtree = [todo_id] + [t.uuid for t in self._inner.find_descendants(todo_id)]
+        if todo_id not in self._links:
+            self.get_by_id(todo_id)
+        self._inner.delete(todo_id)
+        self._invalidate(todo_id)
+        for uuid in subtree:
+            self._todos[uuid] = None
+            self._children.pop(uuid, None)
+            self._counts.pop(uuid, None)
+
+    def clone_subtree(self, todo_uuid: UUID, time_deltas: list[int]) -> list[Todo]:
+        new_roots = self._inner.clone_subtree(todo_uuid, time_deltas)
+        # De nouvelles racines actives : seules les tâches actives de leur utilisateur changent
+        for root in new_roots:
+            self._active.pop(root.user, None)
+        return new_roots
+
+    def materialize_occurrence(self, series: Series, delta: int) -> Todo:
+        new_root = self._inner.materialize_occurrence(series, delta)
+        self._active.pop(new_root.user, None)
+        return new_root
+
+    def materialize_horizon(self, series: Series, deltas: list[int]) -> list[Todo]:
+        new_roots = self._inner.materialize_horizon(series, deltas)
+        for root in new_roots:
+            self._active.pop(root.user, None)
+        return new_roots
+
+    # --- Délégation simple ---
+
+    def find_descendants(self, todo_uuid: UUID) -> list[Todo]:
+        return self._inner.find_descendants(todo_uuid)
+
+    def save_series(self, series: Series) -> None:
+        self._inner.save_series(series)
+
+    def get_series(self, series_id: UUID) -> Optional[Series]:
+        return self._inner.get_series(series_id)
+
+    def find_series_by_user(self, user_id: UUID) -> list[Series]:
+        return self._inner.find_series_by_user(user_id)
+
+    def find_top_level_by_user(self, user_id: UUID, *args, **kwargs) -> list[Todo]:
+        return self._inner.find_top_level_by_user(user_id, *args, **kwargs)
+
+    def find_list_view(self, user_id: UUID, *args, **kwargs) -> list[TodoListItem]:
+        return self._inner.find_list_view(user_id, *args, **kwargs)
+
+    def search_by_title(self, user_id: UUID, search_term: str) -> list[Todo]:
+        return self._inner.search_by_title(user_id, search_term)
+
+    def find_title_entries(self, user_id: UUID) -> list[TitleEntry]:
+        return self._inner.find_title_entries(user_id)
+
+    def get_pending_completion_parents(self, user_id: UUID) -> list[Todo]:
+        return self._inner.get_pending_completion_parents(user_id)
+
+    def _row_to_todo(self, row) -> Todo:
+        return self._inner._row_to_todo(row)
@@ -4,7 +4,13 @@ import logging
 
 import duckdb
 
-from todo_bene.infrastructure.config import get_or_create_master_key
+from todo_bene.infrastructure.config import (
+    get_crypto_needs_httpfs,
+    get_db_encrypted,
+    get_or_create_master_key,
+    save_crypto_needs_httpfs,
+    save_db_encrypted,
+)
 
 
 logger = logging.getLogger()
@@ -15,29 +21,12 @@ class DuckDBConnectionManager:
         self.db_path = db_path
         self.access_mode = 'READ_ONLY' if read_only else 'READ_WRITE'
         self.conn = None
+        self.encrypted = False
 
 
     def __enter__(self):
         try:
-            # Récupération de la clé
-            master_key = get_or_create_master_key().decode('utf-8')
-            # Ouverture de la connexion ⚠️ Cette méthode ne fonctionne pas avec la base chiffrée
-            try:
-                self.conn = duckdb.connect(
-                    self.db_path,
-                    config={
-                        'access_mode': self.access_mode,
-                    }
-                )
-            except duckdb.Error:
-                self.conn = duckdb.connect()
-                # self.conn.execute("INSTALL httpfs")
-                self.conn.install_extension("https") # si pas présente dans le cache la télécharge TODO: Voir la gestion des mises à jour avec force_install=True
-                self.conn.load_extension("httpfs")
-                # ATTACH 'encrypted.db' AS enc_db (ACCESS_MODE, ENCRYPTION_KEY 'quack_quack') <<< voir la doc
-                self.conn.execute(f"ATTACH '{self.db_path}' AS enc_db ({self.access_mode}, ENCRYPTION_KEY '{master_key}');")
-                self.conn.execute("USE enc_db;")
-                logger.info(f"Connexion DuckDB établie en mode {self.access_mode} pour {self.db_path}")
+            self._open()
 
             # Exécution des migrations
             if self.access_mode == 'READ_WRITE':
@@ -60,17 +49,118 @@ class DuckDBConnectionManager:
             raise SystemExit(1)
 
 
+    def _open(self):
+        """
+        Ouvre la base en clair ou chiffrée selon ce que le profil a mémorisé ("db_encrypted") :
+        une base connue comme chiffrée est attachée directement, sans l'ouverture en clair
+        vouée à l'échec ni l'accès au trousseau pour une base en clair.
+        """
+        known = get_db_encrypted(self.db_path)
+        if known:
+            try:
+                self._attach_encrypted()
+                return
+            except duckdb.Error:
+                # Mémoire périmée (ex: base remplacée par une base en clair) : ouverture complète
+                self.close()
+        try:
+            self.conn = duckdb.connect(
+                self.db_path,
+                config={
+                    'access_mode': self.access_mode,
+                }
+            )
+        except duckdb.Error:
+            self._attach_encrypted()
+        if self.encrypted != known:
+            save_db_encrypted(self.db_path, self.encrypted)
+
+
+    def _attach_encrypted(self):
+        # Récupération de la clé
+        master_key = get_or_create_master_key().decode('utf-8')
+        self.conn = duckdb.connect()
+        # ATTACH 'encrypted.db' AS enc_db (ACCESS_MODE, ENCRYPTION_KEY 'quack_quack') <<< voir la doc
+        attach = f"ATTACH '{self.db_path}' AS enc_db ({self.access_mode}, ENCRYPTION_KEY '{master_key}');"
+        if self.access_mode == 'READ_WRITE':
+            self._attach_for_write(attach)
+        else:
+            self.conn.execute(attach)
+        self.conn.execute("USE enc_db;")
+        self.encrypted = True
+        logger.info(f"Connexion DuckDB établie en mode {self.access_mode} pour {self.db_path}")
+
+
+    def _attach_for_write(self, attach: str):
+        """
+        Écriture chiffrée : selon la version de DuckDB, le module crypto intégré ne sait que lire
+        et l'ATTACH en écriture est refusé sans httpfs (OpenSSL). Le besoin est vérifié une fois
+        par version puis mémorisé : httpfs n'est chargé d'office que s'il est nécessaire.
+        """
+        version = duckdb.__version__
+        needs_httpfs = get_crypto_needs_httpfs(version)
+        if needs_httpfs:
+            self._load_crypto_extension()
+            self.conn.execute(attach)
+            return
+        try:
+            self.conn.execute(attach)
+        except duckdb.Error:
+            if needs_httpfs is False:
+                raise
+            self._load_crypto_extension()
+            self.conn.execute(attach)
+            save_crypto_needs_httpfs(version, True)
+        else:
+            save_crypto_needs_httpfs(version, False)
+
+
+    def _load_crypto_extension(self):
+        """Charge httpfs depuis le cache local d'extensions ; ne le télécharge qu'à défaut (premier lancement)."""
+        try:
+            self.conn.load_extension("httpfs")
+        except duckdb.Error:
+            self.conn.install_extension("httpfs")  # TODO: Voir la gestion des mises à jour avec force_install=True
+            self.conn.load_extension("httpfs")
+
+
     def __exit__(self, exc_type, exc_val, traceback):
-        try: # if bdd encrypted
-            self.conn.execute("ATTACH ':memory:' as memory_db;")
-            self.conn.execute("USE memory_db;")
-            self.conn.execute("DETACH enc_db;")
+        try:
+            if self.encrypted:
+                self.conn.execute("ATTACH ':memory:' as memory_db;")
+                self.conn.execute("USE memory_db;")
+                self.conn.execute("DETACH enc_db;")
         except duckdb.Error:
-            logger.info(f"MANAGER EXIT : La base n'est pas cryptée, fermeture avec conn.close()")
+            logger.info("MANAGER EXIT : Détachement de la base chiffrée impossible, fermeture avec conn.close()")
         finally:
             self.close()
 
 
+    def copy_database_to(self, target_path: str) -> None:
+        """
+        Recopie la base ouverte dans un nouveau fichier (COPY FROM DATABASE : schéma, index, données),
+        chiffré avec la même clé si elle l'est. Le fichier est réécrit sans les blocs libérés.
+        """
+        source = self.conn.execute("SELECT current_database()").fetchone()[0]
+        options = ""
+        if self.encrypted:
+            options = f" (ENCRYPTION_KEY '{get_or_create_master_key().decode('utf-8')}')"
+        self.conn.execute(f"ATTACH '{target_path}' AS compact_db{options};")
+        try:
+            self.conn.execute(f'COPY FROM DATABASE "{source}" TO compact_db;')
+            tables = [row[0] for row in self.conn.execute(
+                "SELECT table_name FROM duckdb_tables() WHERE database_name = ?", [source]
+            ).fetchall()]
+            for table in tables:
+                counts = self.conn.execute(
+                    f'SELECT (SELECT count(*) FROM "{source}"."{table}"), (SELECT count(*) FROM compact_db."{table}")'
+                ).fetchone()
+                if counts[0] != counts[1]:
+                    raise duckdb.InvalidInputException(f"Copie incomplète de la table {table} : {counts[1]}/{counts[0]}")
+        finally:
+            self.conn.execute("DETACH compact_db;")
+
+
     def get_connection(self):
         return self.conn
 
@@ -1,11 +1,56 @@
+import json
 import duckdb
+from dataclasses import replace
 from uuid import UUID
 from typing import List, Optional
 from todo_bene.domain.entities.todo import Todo
+from todo_bene.domain.entities.category import Category
+from todo_bene.domain.entities.series import Series
+from todo_bene.domain.entities.todo_list_item import TodoListItem
+from todo_bene.domain.services.title_search import MATCH_THRESHOLD, SEARCH_LIMIT, TitleEntry
 from todo_bene.application.interfaces.todo_repository import TodoRepository
 
 
+# Colonnes de la table todos et leur type, dans l'ordre du schéma (sert au chargement en masse)
+TODO_COLUMNS = {
+    "uuid": "UUID",
+    "title": "VARCHAR",
+    "description": "VARCHAR",
+    "category": "VARCHAR",
+    "state": "BOOLEAN",
+    "priority": "BOOLEAN",
+    "date_start": "BIGINT",
+    "date_due": "BIGINT",
+    "user_id": "UUID",
+    "parent_id": "UUID",
+    "frequency": "VARCHAR",
+    "date_final": "BIGINT",
+}
+
+
+def todo_columns(alias: str = "", description_length: Optional[int] = None) -> str:
+    """
+    Liste explicite des colonnes d'un Todo (ordre attendu par _row_to_todo), jamais SELECT *.
+    description_length tronque la description côté SQL pour les vues qui n'en montrent qu'un extrait.
+    """
+    prefix = f"{alias}." if alias else ""
+    columns = []
+    for column in TODO_COLUMNS:
+        if column == "description" and description_length is not None:
+            columns.append(f"left({prefix}description, {int(description_length)}) AS description")
+        else:
+            columns.append(f"{prefix}{column}")
+    return ", ".join(columns)
+
+
 class DuckDBTodoRepository(TodoRepository):
+    SERIES_COLUMNS = "uuid, user_id, template_id, rule, deltas, horizon, materialized"
+    LIST_GROUPS = (None, "day", "week")
+    # Identifiant d'une ligne racine : uuid du Todo, ou de la série pour une occurrence virtuelle
+    ROOT_KEY = "coalesce(uuid, series_id)"
+    # La vue liste affiche 15 caractères de description (+ '...' si elle est plus longue)
+    LIST_DESCRIPTION_LENGTH = 16
+
     def __init__(self, connection):
         # On utilise la connexion
         # fournie par le manager DuckDBConnectionManager
@@ -20,12 +65,12 @@ class DuckDBTodoRepository(TodoRepository):
                 category VARCHAR,
                 state BOOLEAN,
                 priority BOOLEAN,
-                date_start DOUBLE,
-                date_due DOUBLE,
+                date_start BIGINT,
+                date_due BIGINT,
                 user_id UUID,
                 parent_id UUID,
                 frequency VARCHAR,
-                date_final DOUBLE
+                date_final BIGINT
             )
         """))
         # AJOUT : La table users
@@ -53,44 +98,133 @@ class DuckDBTodoRepository(TodoRepository):
                 pass  # Ici, une erreur de fermeture est moins critique qu'un except nu
 
     def save(self, todo: Todo):
+        self._conn.begin()
+        try:
+            previous = self._conn.execute(
+                "SELECT title, user_id FROM todos WHERE uuid = ?", (todo.uuid,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO todos
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+                self._todo_to_row(todo),
+            )
+            # Trigrammes recalculés seulement si le titre change (la plupart des save modifient l'état ou les dates)
+            if previous != (todo.title, todo.user):
+                if previous is not None:
+                    self._conn.execute("DELETE FROM title_index WHERE todo_id = ?", (todo.uuid,))
+                self._conn.execute(
+                    "INSERT INTO title_index SELECT ?, ?, unnest(trigrams_of(?))", (todo.uuid, todo.user, todo.title)
+                )
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            raise
+
+    def save_all(self, todos: list[Todo]) -> None:
+        """
+        Insertion en masse dans une seule transaction.
+
+        Les lignes sont transmises en un seul paramètre JSON décodé par DuckDB (from_json + unnest) :
+        lier les valeurs une à une depuis Python coûte bien plus cher que l'insertion elle-même.
+        """
+        if not todos:
+            return
+        columns = ", ".join(TODO_COLUMNS)
+        schema = json.dumps([TODO_COLUMNS])
+        payload = json.dumps([self._todo_to_json(todo) for todo in todos])
+        self._conn.begin()
+        try:
+            self._conn.execute(
+                f"""
+                INSERT OR REPLACE INTO todos ({columns})
+                SELECT unnest(from_json(?, '{schema}'), recursive := true)
+                """,
+                [payload],
+            )
+            self._reindex_titles(
+                """SELECT unnest(from_json(?, '["UUID"]'))""",
+                [json.dumps([str(todo.uuid) for todo in todos])],
+            )
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            raise
+
+    def _reindex_titles(self, todo_ids_query: str, params: list) -> None:
+        """Recalcule les trigrammes (table title_index) des todos dont la sous-requête renvoie les uuids."""
+        self._conn.execute(f"DELETE FROM title_index WHERE todo_id IN ({todo_ids_query})", params)
         self._conn.execute(
-            """
-            INSERT OR REPLACE INTO todos
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """,
-            (
-                todo.uuid,
-                todo.title,
-                todo.description,
-                todo.category,
-                todo.state,
-                todo.priority,
-                todo.date_start,
-                todo.date_due,
-                todo.user,
-                todo.parent,
-                todo.frequency,
-                todo.date_final,
-            ),
+            f"""
+            INSERT INTO title_index
+            SELECT uuid, user_id, unnest(trigrams_of(title)) FROM todos WHERE uuid IN ({todo_ids_query})
+            """,
+            params,
+        )
+
+    @classmethod
+    def _todo_to_json(cls, todo: Todo) -> dict:
+        row = dict(zip(TODO_COLUMNS, cls._todo_to_row(todo)))
+        for key in ("uuid", "user_id", "parent_id"):
+            if row[key] is not None:
+                row[key] = str(row[key])
+        return row
+
+    @staticmethod
+    def _todo_to_row(todo: Todo) -> tuple:
+        # Fréquence (libellé, nombre) stockée "libellé,nombre" : forme relue en tuple par Todo
+        frequency = todo.frequency
+        if isinstance(frequency, tuple):
+            frequency = ",".join(map(str, frequency))
+        return (
+            todo.uuid,
+            todo.title,
+            todo.description,
+            todo.category,
+            todo.state,
+            todo.priority,
+            todo.date_start,
+            todo.date_due,
+            todo.user,
+            todo.parent,
+            frequency,
+            todo.date_final,
         )
 
     def get_by_id(self, todo_id: UUID) -> Optional[Todo]:
         res = self._conn.execute(
-            "SELECT * FROM todos WHERE uuid = ?", (todo_id,)
+            f"SELECT {todo_columns()} FROM todos WHERE uuid = ?", (todo_id,)
         ).fetchone()
         if res:
             return self._row_to_todo(res)
         return None
 
-    def find_top_level_by_user(
+    def _top_level_query(
         self,
         user_id: UUID,
         category: Optional[list[str]] = None,
         exclude_category: Optional[list[str]] = None,
-        max_date: Optional[int] = None
-    ) -> List[Todo]:
-        # Base de la requête : tâches racines non complétées
-        query = "SELECT * FROM todos WHERE user_id = ? AND parent_id IS NULL AND state = false"
+        max_date: Optional[int] = None,
+        description_length: Optional[int] = None,
+    ) -> tuple[str, list]:
+        # Base de la requête : tâches racines non complétées + occurrences virtuelles des séries
+        # (une ligne par décalage encore virtuel, dates calculées à partir du modèle).
+        # anchor_id désigne la tâche dont le sous-arbre est affiché (le modèle pour une occurrence).
+        description = "t.description" if description_length is None else f"left(t.description, {int(description_length)})"
+        query = f"""
+            SELECT * FROM (
+                SELECT {todo_columns(description_length=description_length)}, NULL::UUID AS series_id, uuid AS anchor_id
+                FROM todos
+                WHERE parent_id IS NULL AND state = false
+                UNION ALL
+                SELECT NULL::UUID, t.title, {description}, t.category, false, t.priority,
+                       t.date_start + d.delta, t.date_due + d.delta, s.user_id, NULL::UUID, '', 0,
+                       s.uuid, t.uuid
+                FROM series s JOIN todos t ON t.uuid = s.template_id, unnest(s.deltas) AS d(delta)
+                WHERE s.horizon IS NULL
+            ) WHERE user_id = ?
+        """
         params = [user_id]
 
         # Filtre de catégorie (inclusion)
@@ -109,16 +243,160 @@ class DuckDBTodoRepository(TodoRepository):
         if max_date is not None:
             query += " AND date_due <= ?"
             params.append(max_date)
+        return query, params
+
+    def find_top_level_by_user(
+        self,
+        user_id: UUID,
+        category: Optional[list[str]] = None,
+        exclude_category: Optional[list[str]] = None,
+        max_date: Optional[int] = None,
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None,
+        limit: Optional[int] = None,
+    ) -> List[Todo]:
+        query, params = self._top_level_query(user_id, category, exclude_category, max_date)
+        # Tri par heure de début puis échéance (l'identifiant départage les ex aequo)
+        query, params = self._paginate(
+            query, params, ["date_start", "date_due", self.ROOT_KEY], after, before, limit
+        )
 
-        # Tri par heure de début puis échéance
-        query += " ORDER BY date_start ASC, date_due ASC"
+        rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_root(row) for row in rows]
 
+    def find_list_view(
+        self,
+        user_id: UUID,
+        category: Optional[list[str]] = None,
+        exclude_category: Optional[list[str]] = None,
+        max_date: Optional[int] = None,
+        group_by: Optional[str] = None,
+        timezone: str = "UTC",
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None,
+        limit: Optional[int] = None,
+    ) -> list[TodoListItem]:
+        if group_by not in self.LIST_GROUPS:
+            raise ValueError(f"Regroupement inconnu : {group_by}")
+        # Projection : la liste n'affiche qu'un extrait de la description, tronquée par DuckDB
+        roots_query, params = self._top_level_query(
+            user_id, category, exclude_category, max_date, description_length=self.LIST_DESCRIPTION_LENGTH
+        )
+        # La page est découpée avant le calcul des compteurs : seuls ses sous-arbres sont parcourus
+        roots_query, params = self._paginate(
+            roots_query, params, ["date_due", "date_start", self.ROOT_KEY], after, before, limit
+        )
+        # Clé de regroupement calculée par DuckDB dans le fuseau de l'utilisateur (ICU)
+        group_key = (
+            f"strftime(date_trunc('{group_by}', timezone(?, to_timestamp(r.date_due))), '%Y-%m-%d')"
+            if group_by else "NULL::VARCHAR"
+        )
+        # Un seul aller-retour : racines, compteurs récursifs de leurs sous-arbres et émoji stocké.
+        # Une occurrence virtuelle reprend le sous-arbre de son modèle, dont aucune tâche n'est encore faite.
+        query = f"""
+            WITH RECURSIVE roots AS ({roots_query}),
+            tree AS (
+                SELECT r.anchor_id AS root_id, c.uuid, c.state
+                FROM (SELECT DISTINCT anchor_id FROM roots) r JOIN todos c ON c.parent_id = r.anchor_id
+                UNION ALL
+                SELECT tree.root_id, c.uuid, c.state FROM tree JOIN todos c ON c.parent_id = tree.uuid
+            ),
+            counts AS (
+                SELECT root_id, count(*) AS total, count(*) FILTER (WHERE state) AS completed
+                FROM tree GROUP BY root_id
+            )
+            SELECT r.* EXCLUDE (anchor_id), cat.emoji, coalesce(c.total, 0),
+                   CASE WHEN r.series_id IS NULL THEN coalesce(c.completed, 0) ELSE 0 END,
+                   {group_key} AS group_key
+            FROM roots r
+            LEFT JOIN counts c ON c.root_id = r.anchor_id
+            LEFT JOIN categories cat ON cat.name = r.category AND cat.user_id = r.user_id
+            ORDER BY group_key ASC, r.date_due ASC, r.date_start ASC, coalesce(r.uuid, r.series_id) ASC
+        """
+        if group_by:
+            params.append(timezone)
         rows = self._conn.execute(query, params).fetchall()
-        return [self._row_to_todo(row) for row in rows]
+        # Catégories par défaut (jamais enregistrées) : émoji du domaine, comme le dépôt mémoire
+        return [
+            TodoListItem(
+                self._row_to_root(row),
+                emoji=row[13] or Category(name=row[3], user_id=user_id).emoji,
+                total=row[14], completed=row[15], group=row[16],
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _paginate(
+        query: str, params: list, order: list[str],
+        after: Optional[tuple], before: Optional[tuple], limit: Optional[int]
+    ) -> tuple[str, list]:
+        """
+        Pagination par clé (keyset) : `after` / `before` sont les valeurs des colonnes de `order`
+        pour la dernière / première ligne de la page courante. Pas d'OFFSET : le coût d'une page
+        ne dépend pas de sa position. Les lignes sont toujours rendues en ordre croissant.
+        """
+        key = f"({', '.join(order)})"
+        placeholders = f"({', '.join(['?'] * len(order))})"
+        params = list(params)
+        if after is not None:
+            query += f" AND {key} > {placeholders}"
+            params.extend(after)
+        if before is not None:
+            query += f" AND {key} < {placeholders}"
+            params.extend(before)
+        # Page précédente : on lit à rebours depuis le curseur, puis on remet dans l'ordre
+        direction = "DESC" if before is not None else "ASC"
+        query += " ORDER BY " + ", ".join(f"{column} {direction}" for column in order)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        if before is not None:
+            query = f"SELECT * FROM ({query}) ORDER BY " + ", ".join(f"{column} ASC" for column in order)
+        return query, params
+
+    def _row_to_root(self, row) -> Todo:
+        """Ligne de find_top_level_by_user : Todo enregistré ou occurrence virtuelle (series_id renseigné)."""
+        todo = self._row_to_todo(row)
+        if row[12] is not None:
+            todo.series = row[12]
+            todo.uuid = Series.occurrence_id(row[12], todo.date_start)
+        return todo
+
+    def save_series(self, series: Series) -> None:
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO series (uuid, user_id, template_id, rule, deltas, horizon, materialized)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (series.uuid, series.user, series.template, series.rule, series.deltas,
+             series.horizon, series.materialized),
+        )
+
+    def get_series(self, series_id: UUID) -> Optional[Series]:
+        res = self._conn.execute(
+            f"SELECT {self.SERIES_COLUMNS} FROM series WHERE uuid = ?", (series_id,)
+        ).fetchone()
+        if res:
+            return self._row_to_series(res)
+        return None
+
+    def find_series_by_user(self, user_id: UUID) -> list[Series]:
+        rows = self._conn.execute(
+            f"SELECT {self.SERIES_COLUMNS} FROM series WHERE user_id = ?", (user_id,)
+        ).fetchall()
+        return [self._row_to_series(row) for row in rows]
+
+    @staticmethod
+    def _row_to_series(row) -> Series:
+        return Series(
+            uuid=row[0], user=row[1], template=row[2], rule=row[3], deltas=row[4],
+            horizon=row[5], materialized=row[6] or 0,
+        )
 
     def find_by_parent(self, parent_id: UUID) -> List[Todo]:
-        query = """
-            SELECT * FROM todos
+        query = f"""
+            SELECT {todo_columns()} FROM todos
             WHERE parent_id = ?
             ORDER BY date_start ASC
         """
@@ -126,24 +404,165 @@ class DuckDBTodoRepository(TodoRepository):
         return [self._row_to_todo(row) for row in rows]
 
     def search_by_title(self, user_id: UUID, search_term: str) -> List[Todo]:
-        query = """
-            SELECT * FROM todos
-            WHERE user_id = ? AND title ILIKE ?
-            ORDER BY title ASC
-            LIMIT 10
         """
-        rows = self._conn.execute(query, (user_id, f"%{search_term}%")).fetchall()
+        Titres contenant la recherche (casse ignorée, toutes écritures), par ordre alphabétique sans casse.
+        (Trier directement sur title avec LIMIT échoue sous DuckDB 1.5.1 sur certains segments de chaînes.)
+        S'il y en a moins de SEARCH_LIMIT, complète par une recherche approchée via l'index trigrammes
+        (fautes de frappe, accents), classée par part des trigrammes de la recherche retrouvés.
+        """
+        query = f"""
+            SELECT {todo_columns()} FROM todos
+            WHERE user_id = ? AND contains(lower(title), lower(?))
+            ORDER BY lower(title) ASC, title ASC
+            LIMIT ?
+        """
+        rows = self._conn.execute(query, (user_id, search_term, SEARCH_LIMIT)).fetchall()
+        todos = [self._row_to_todo(row) for row in rows]
+        if len(todos) < SEARCH_LIMIT:
+            found = {todo.uuid for todo in todos}
+            fuzzy = self._search_by_trigrams(user_id, search_term, SEARCH_LIMIT + len(todos))
+            todos += [todo for todo in fuzzy if todo.uuid not in found][: SEARCH_LIMIT - len(todos)]
+        return todos
+
+    def _search_by_trigrams(self, user_id: UUID, search_term: str, limit: int) -> List[Todo]:
+        query = f"""
+            WITH wanted AS (SELECT unnest(trigrams_of(?)) AS trigram),
+            hits AS (
+                SELECT i.todo_id, count(*) / (SELECT count(*) FROM wanted) AS score
+                FROM title_index i JOIN wanted USING (trigram)
+                WHERE i.user_id = ?
+                GROUP BY i.todo_id
+            )
+            SELECT {todo_columns("t")} FROM hits JOIN todos t ON t.uuid = hits.todo_id
+            WHERE hits.score >= ?
+            ORDER BY hits.score DESC, t.title ASC
+            LIMIT ?
+        """
+        rows = self._conn.execute(query, (search_term, user_id, MATCH_THRESHOLD, limit)).fetchall()
         return [self._row_to_todo(row) for row in rows]
 
+    def find_title_entries(self, user_id: UUID) -> list[TitleEntry]:
+        rows = self._conn.execute(
+            """
+            SELECT uuid, title, category, parent_id FROM todos
+            WHERE user_id = ? AND state = false
+            ORDER BY date_start ASC
+            """,
+            (user_id,),
+        ).fetchall()
+        return [TitleEntry(*row) for row in rows]
+
     def find_all_active_by_user(self, user_id: UUID) -> list[Todo]:
         """Récupère tous les todos de l'utilisateur, sans filtre hiérarchique."""
         res = self._conn.execute(
-            "SELECT * FROM todos WHERE user_id = ? AND state = false ORDER BY date_start ASC",
+            f"SELECT {todo_columns()} FROM todos WHERE user_id = ? AND state = false ORDER BY date_start ASC",
             [str(user_id)],
         ).fetchall()
         # On utilise la méthode de mapping existante
         return [self._row_to_todo(row) for row in res]
 
+    def find_descendants(self, todo_uuid: UUID) -> List[Todo]:
+        """Charge tout le sous-arbre (hors racine) en une seule requête récursive."""
+        query = f"""
+            SELECT {todo_columns()} FROM todos WHERE uuid IN (
+                WITH RECURSIVE tree AS (
+                    SELECT uuid FROM todos WHERE parent_id = ?
+                    UNION ALL
+                    SELECT t.uuid FROM todos t JOIN tree ON t.parent_id = tree.uuid
+                )
+                SELECT uuid FROM tree
+            )
+            ORDER BY date_start ASC
+        """
+        rows = self._conn.execute(query, (todo_uuid,)).fetchall()
+        return [self._row_to_todo(row) for row in rows]
+
+    def clone_subtree(self, todo_uuid: UUID, time_deltas: list[int]) -> list[Todo]:
+        """
+        Répétition côté serveur : le sous-arbre est dupliqué par un INSERT ... SELECT.
+
+        Une table temporaire associe chaque (uuid source, décalage) à un nouvel uuid() ;
+        elle sert à la fois à générer les lignes et à remapper les parent_id.
+        Aucun Todo intermédiaire n'est construit en Python, seules les nouvelles racines sont relues.
+        """
+        deltas = sorted(set(int(delta) for delta in time_deltas))
+        if not deltas:
+            return []
+        self._conn.begin()
+        try:
+            rows = self._clone_subtree_rows(todo_uuid, deltas)
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            raise
+        return [self._row_to_todo(row) for row in rows]
+
+    def _clone_subtree_rows(self, todo_uuid: UUID, deltas: list[int]) -> list[tuple]:
+        """Corps de clone_subtree, sans transaction (l'appelant l'ouvre) ; retourne les lignes des nouvelles racines."""
+        self._conn.execute(
+            """
+            CREATE OR REPLACE TEMP TABLE clone_map AS
+            WITH RECURSIVE tree AS (
+                SELECT uuid FROM todos WHERE uuid = ?
+                UNION ALL
+                SELECT t.uuid FROM todos t JOIN tree ON t.parent_id = tree.uuid
+            )
+            SELECT tree.uuid AS old_uuid, d.delta, uuid() AS new_uuid
+            FROM tree CROSS JOIN (SELECT unnest(?::BIGINT[]) AS delta) d
+            """,
+            [todo_uuid, deltas],
+        )
+        self._conn.execute(
+            """
+            INSERT INTO todos (uuid, title, description, category, state, priority,
+                               date_start, date_due, user_id, parent_id, frequency, date_final)
+            SELECT m.new_uuid, t.title, t.description, t.category, false, t.priority,
+                   t.date_start + m.delta, t.date_due + m.delta, t.user_id, p.new_uuid, '', 0
+            FROM clone_map m
+            JOIN todos t ON t.uuid = m.old_uuid
+            LEFT JOIN clone_map p ON p.old_uuid = t.parent_id AND p.delta = m.delta
+            """
+        )
+        rows = self._conn.execute(
+            f"""
+            SELECT {todo_columns("todos")} FROM todos
+            JOIN clone_map m ON todos.uuid = m.new_uuid
+            WHERE m.old_uuid = ?
+            ORDER BY m.delta
+            """,
+            [todo_uuid],
+        ).fetchall()
+        self._reindex_titles("SELECT new_uuid FROM clone_map", [])
+        self._conn.execute("DROP TABLE clone_map")
+        return rows
+
+    def materialize_occurrence(self, series: Series, delta: int) -> Todo:
+        remaining = [d for d in series.deltas if d != delta]
+        self._conn.begin()
+        try:
+            [row] = self._clone_subtree_rows(series.template, [int(delta)])
+            self._conn.execute("UPDATE series SET deltas = ? WHERE uuid = ?", (remaining, series.uuid))
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            raise
+        series.deltas = remaining
+        return self._row_to_todo(row)
+
+    def materialize_horizon(self, series: Series, deltas: list[int]) -> list[Todo]:
+        # Compteur avancé sur une copie : l'objet appelant ne change qu'une fois la transaction validée
+        advanced = replace(series, materialized=series.materialized + len(deltas))
+        self._conn.begin()
+        try:
+            rows = self._clone_subtree_rows(series.template, [int(delta) for delta in deltas]) if deltas else []
+            self.save_series(advanced)
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            raise
+        series.materialized = advanced.materialized
+        return [self._row_to_todo(row) for row in rows]
+
     def count_all_descendants(self, todo_uuid: UUID) -> tuple[int, int]:
         """Compte récursivement tous les descendants d'un Todo."""
         children = self.find_by_parent(todo_uuid)
@@ -158,18 +577,36 @@ class DuckDBTodoRepository(TodoRepository):
         return total, completed
 
     def delete(self, todo_id: UUID) -> None:
-        """Supprime récursivement un todo et ses enfants via SQL."""
-        query = """
-            DELETE FROM todos WHERE uuid IN (
-                WITH RECURSIVE tree AS (
-                    SELECT uuid FROM todos WHERE uuid = ?
-                    UNION ALL
-                    SELECT t.uuid FROM todos t JOIN tree ON t.parent_id = tree.uuid
-                )
-                SELECT uuid FROM tree
-            )
         """
-        self._conn.execute(query, (todo_id,))
+        Supprime récursivement un todo et ses enfants via SQL.
+
+        Le sous-arbre est parcouru une seule fois ; la liste de ses uuids, passée en paramètre,
+        permet aux deux DELETE de passer par les index (clé primaire, idx_title_index_todo)
+        au lieu de parcourir toute la table des trigrammes.
+        """
+        subtree = self._conn.execute(
+            """
+            WITH RECURSIVE tree AS (
+                SELECT uuid FROM todos WHERE uuid = ?
+                UNION ALL
+                SELECT t.uuid FROM todos t JOIN tree ON t.parent_id = tree.uuid
+            )
+            SELECT uuid FROM tree
+            """,
+            (todo_id,),
+        ).fetchall()
+        ids = """SELECT unnest(from_json(?, '["UUID"]'))"""
+        params = [json.dumps([str(row[0]) for row in subtree])]
+        self._conn.begin()
+        try:
+            self._conn.execute(f"DELETE FROM title_index WHERE todo_id IN ({ids})", params)
+            self._conn.execute(f"DELETE FROM todos WHERE uuid IN ({ids})", params)
+            # Une série dont le modèle disparaît n'a plus de gabarit à développer
+            self._conn.execute("DELETE FROM series WHERE template_id = ?", (todo_id,))
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            raise
 
     def update_state(self, todo_id: UUID, state: bool) -> None:
         """Met à jour l'état d'un todo en base de données."""
@@ -182,8 +619,8 @@ class DuckDBTodoRepository(TodoRepository):
         # On cherche les tâches (P) non complétées
         # QUI ont des enfants
         # ET pour lesquelles il n'existe AUCUN enfant non complété
-        query = """
-                SELECT p.* FROM todos p
+        query = f"""
+                SELECT {todo_columns("p")} FROM todos p
                 WHERE p.user_id = ?
                 AND p.state = false
                 AND EXISTS (SELECT 1 FROM todos c WHERE c.parent_id = p.uuid)
@@ -0,0 +1,84 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+
+from todo_bene.infrastructure.persistence.duckdb.duckdb_connection_manager import DuckDBConnectionManager
+
+
+@dataclass
+class MaintenanceReport:
+    """Tailles (octets) du fichier de base et de son journal (WAL) avant et après maintenance."""
+    db_before: int
+    wal_before: int
+    db_after: int
+    wal_after: int
+
+    @property
+    def before(self) -> int:
+        return self.db_before + self.wal_before
+
+    @property
+    def after(self) -> int:
+        return self.db_after + self.wal_after
+
+
+def _wal_path(path: Path) -> Path:
+    return path.with_name(path.name + ".wal")
+
+
+def _size(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
+
+
+def cluster_title_index(conn) -> None:
+    """
+    Remet l'index trigrammes dans l'ordre (user_id, trigram) de la migration 008 : les lignes
+    ajoutées depuis par save() sont en fin de table, hors des zone maps étroites.
+    """
+    conn.begin()
+    try:
+        conn.execute(
+            "CREATE TEMP TABLE title_index_sorted AS "
+            "SELECT todo_id, user_id, trigram FROM title_index ORDER BY user_id, trigram"
+        )
+        conn.execute("DELETE FROM title_index")
+        conn.execute("INSERT INTO title_index SELECT * FROM title_index_sorted")
+        conn.execute("DROP TABLE title_index_sorted")
+        conn.commit()
+    except duckdb.Error:
+        conn.rollback()
+        raise
+
+
+def maintain_database(db_path: str) -> MaintenanceReport:
+    """
+    CHECKPOINT (vidage du WAL dans la base) puis réécriture complète dans un fichier neuf,
+    qui remplace l'ancien : DuckDB ne rend pas au système les blocs libérés par les
+    suppressions et mises à jour, seule une recopie compacte le fichier.
+
+    L'index trigrammes est remis en ordre au passage (cluster_title_index).
+    Fonctionne aussi sur une base chiffrée (la copie est chiffrée avec la même clé).
+    """
+    path = Path(db_path)
+    wal = _wal_path(path)
+    db_before, wal_before = _size(path), _size(wal)
+    compact = path.with_name(path.name + ".compact")
+    compact.unlink(missing_ok=True)
+    _wal_path(compact).unlink(missing_ok=True)
+
+    manager = DuckDBConnectionManager(db_path)
+    try:
+        with manager as conn:
+            cluster_title_index(conn)
+            conn.execute("CHECKPOINT;")
+            manager.copy_database_to(str(compact))
+        # Un WAL resté après fermeture serait rejoué sur la copie : on garde alors l'ancien fichier
+        if wal.exists():
+            raise duckdb.IOException(f"Journal {wal} non vidé, base laissée en l'état")
+        os.replace(compact, path)
+    finally:
+        compact.unlink(missing_ok=True)
+        _wal_path(compact).unlink(missing_ok=True)
+    return MaintenanceReport(db_before, wal_before, _size(path), _size(wal))
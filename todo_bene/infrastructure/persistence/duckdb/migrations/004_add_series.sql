@@ -0,0 +1,12 @@
+-- Migration 004 : Séries récurrentes non matérialisées
+-- template_id : racine modèle dont le sous-arbre est recopié à la matérialisation
+-- rule : instruction DSL compilée (ex: 'today@daily#1d@∞')
+-- deltas : décalages (secondes) des occurrences encore virtuelles par rapport au modèle
+
+CREATE TABLE IF NOT EXISTS series (
+    uuid UUID PRIMARY KEY,
+    user_id UUID,
+    template_id UUID,
+    rule VARCHAR,
+    deltas BIGINT[]
+);
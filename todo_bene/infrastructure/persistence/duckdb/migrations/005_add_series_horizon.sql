@@ -0,0 +1,6 @@
+-- Migration 005 : Séries à horizon glissant
+-- horizon : nombre d'occurrences à venir gardées matérialisées (NULL = série virtuelle)
+-- materialized : nombre d'occurrences de deltas déjà écrites dans todos (point d'arrêt)
+
+ALTER TABLE series ADD COLUMN horizon INTEGER;
+ALTER TABLE series ADD COLUMN materialized INTEGER DEFAULT 0;
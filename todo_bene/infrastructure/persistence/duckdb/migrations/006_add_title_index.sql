@@ -0,0 +1,22 @@
+-- Migration 006 : Index trigrammes des titres (recherche approchée, sans extension externe)
+-- trigrams_of : minuscules, sans accents ni ponctuation, trigrammes à la pg_trgm ('  mot ')
+-- Même règles que todo_bene/domain/services/title_search.py
+
+CREATE OR REPLACE MACRO trigrams_of(txt) AS list_distinct(flatten(list_transform(
+    list_filter(
+        string_split(regexp_replace(strip_accents(replace(replace(lower(txt), 'œ', 'oe'), 'æ', 'ae')), '[^a-z0-9]+', ' ', 'g'), ' '),
+        w -> w <> ''
+    ),
+    w -> list_transform(range(1, length(w) + 2), i -> substr('  ' || w || ' ', i, 3))
+)));
+
+CREATE TABLE IF NOT EXISTS title_index (
+    todo_id UUID,
+    user_id UUID,
+    trigram VARCHAR
+);
+
+INSERT INTO title_index SELECT uuid, user_id, unnest(trigrams_of(title)) FROM todos;
+
+-- Réindexation d'un todo (save/delete) : accès direct à ses trigrammes
+CREATE INDEX IF NOT EXISTS idx_title_index_todo ON title_index (todo_id);
@@ -0,0 +1,45 @@
+-- Migration 007 : types resserrés pour todos
+-- Dates en BIGINT (secondes epoch, comme le domaine) au lieu de DOUBLE : compression BitPacking
+-- au lieu d'ALP, filtres et tris sur les dates ~5x plus rapides.
+-- NOT NULL / DEFAULT sur les colonnes que le domaine renseigne toujours.
+-- La catégorie reste un VARCHAR : DuckDB la stocke déjà en dictionnaire (cf. pragma_storage_info).
+-- Recopie complète dans une transaction (DuckDB ne sait pas changer le type d'une colonne indexée).
+
+BEGIN TRANSACTION;
+
+CREATE TABLE todos_v7 (
+    uuid UUID PRIMARY KEY,
+    title VARCHAR NOT NULL,
+    description VARCHAR,
+    category VARCHAR NOT NULL DEFAULT 'Quotidien',
+    state BOOLEAN NOT NULL DEFAULT false,
+    priority BOOLEAN NOT NULL DEFAULT false,
+    date_start BIGINT NOT NULL,
+    date_due BIGINT NOT NULL,
+    user_id UUID,
+    parent_id UUID,
+    frequency VARCHAR NOT NULL DEFAULT '',
+    date_final BIGINT
+);
+
+-- Une date absente (NULL) et 0 sont équivalentes pour le domaine (date par défaut)
+INSERT INTO todos_v7
+SELECT
+    uuid,
+    coalesce(title, ''),
+    description,
+    coalesce(category, 'Quotidien'),
+    coalesce(state, false),
+    coalesce(priority, false),
+    coalesce(round(date_start), 0)::BIGINT,
+    coalesce(round(date_due), 0)::BIGINT,
+    user_id,
+    parent_id,
+    coalesce(frequency, ''),
+    round(date_final)::BIGINT
+FROM todos;
+
+DROP TABLE todos;
+ALTER TABLE todos_v7 RENAME TO todos;
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- Migration 008 : Index trigrammes rangé par (user_id, trigram)
+-- Un index ART ne sert pas la recherche approchée : chaque trigramme courant désigne des milliers
+-- de lignes, au-delà du seuil où DuckDB préfère le parcours complet (index_scan_max_count).
+-- Rangée dans l'ordre (user_id, trigram), la table a des zone maps (min/max par groupe de lignes)
+-- étroites : seuls les groupes contenant les trigrammes cherchés sont lus.
+-- Les lignes ajoutées ensuite vont en fin de table ; `tb db maintain` les remet en ordre.
+
+BEGIN TRANSACTION;
+
+CREATE TABLE title_index_v8 AS
+SELECT todo_id, user_id, trigram FROM title_index ORDER BY user_id, trigram;
+
+DROP INDEX IF EXISTS idx_title_index_todo;
+DROP TABLE title_index;
+ALTER TABLE title_index_v8 RENAME TO title_index;
+
+-- Réindexation d'un todo (save/delete) : accès direct à ses trigrammes
+CREATE INDEX IF NOT EXISTS idx_title_index_todo ON title_index (todo_id);
+
+COMMIT;
@@ -0,0 +1,122 @@
+import json
+import re
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Littéraux remplacés par '?' : deux requêtes qui ne diffèrent que par leurs valeurs ont la même empreinte
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """Forme normalisée d'une requête : littéraux masqués, espaces compactés."""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStats:
+    """Compteurs agrégés d'une empreinte de requête."""
+    fingerprint: str
+    count: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class QueryProfiler:
+    """
+    Collecte, pour une commande, le nombre d'exécutions, les lignes lues et la latence
+    (exécution + lecture du résultat) de chaque empreinte de requête.
+    """
+
+    def __init__(self):
+        self.stats: dict[str, QueryStats] = {}
+
+    def record(self, sql: str, elapsed_ms: float) -> QueryStats:
+        key = fingerprint(sql)
+        stats = self.stats.setdefault(key, QueryStats(key))
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        return stats
+
+    def summary(self) -> list[QueryStats]:
+        """Empreintes triées par temps cumulé décroissant."""
+        return sorted(self.stats.values(), key=lambda s: s.total_ms, reverse=True)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(s.total_ms for s in self.stats.values())
+
+    @property
+    def total_count(self) -> int:
+        return sum(s.count for s in self.stats.values())
+
+    def append_jsonl(self, path: Path, command: Optional[str]) -> None:
+        """Ajoute une ligne JSON (commande, horodatage, empreintes) au fichier."""
+        entry = {
+            "command": command,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "statements": [asdict(s) for s in self.summary()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class ProfiledConnection:
+    """
+    Enveloppe d'une connexion DuckDB qui mesure chaque execute().
+
+    Comme DuckDB, execute() renvoie la connexion elle-même : les fetch* qui suivent
+    sont attribués à la dernière requête (lignes lues et temps de lecture).
+    Le reste (begin, commit, close...) est délégué tel quel.
+    """
+
+    def __init__(self, conn, profiler: QueryProfiler):
+        self._conn = conn
+        self._profiler = profiler
+        self._last: Optional[QueryStats] = None
+        self._last_ms = 0.0  # Latence cumulée de la dernière exécution (execute + fetch)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def execute(self, query, parameters=None):
+        start = time.perf_counter()
+        if parameters is None:
+            self._conn.execute(query)
+        else:
+            self._conn.execute(query, parameters)
+        self._last_ms = (time.perf_counter() - start) * 1000
+        self._last = self._profiler.record(query, self._last_ms)
+        return self
+
+    def _fetch(self, method: str, *args):
+        start = time.perf_counter()
+        result = getattr(self._conn, method)(*args)
+        if self._last is not None:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._last_ms += elapsed_ms
+            self._last.total_ms += elapsed_ms
+            self._last.max_ms = max(self._last.max_ms, self._last_ms)
+            if method == "fetchone":
+                self._last.rows += int(result is not None)
+            else:
+                self._last.rows += len(result)
+        return result
+
+    def fetchall(self):
+        return self._fetch("fetchall")
+
+    def fetchone(self):
+        return self._fetch("fetchone")
+
+    def fetchmany(self, size: int = 1):
+        return self._fetch("fetchmany", size)
@@ -0,0 +1,132 @@
+import hashlib
+import uuid
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+import duckdb
+
+from todo_bene.infrastructure.config import get_or_create_master_key
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import TODO_COLUMNS
+
+
+class DuckDBTodoArchive:
+    """
+    Archive froide des sous-arbres terminés : fichiers Parquet partitionnés par mois
+    (`<dossier>/month=AAAA-MM/<lot>_<n>.parquet`), hors de la table todos.
+
+    Un sous-arbre est archivable quand tous ses nœuds sont terminés et que sa dernière échéance
+    est antérieure à la date limite ; les modèles de séries restent en base. history_source()
+    réunit la table et l'archive : seuls `tb archive --stats` et `tb list-dev` la lisent, les
+    vues courantes (list, find, choix du parent) ne portent que sur la table todos.
+    Si la base est chiffrée, les fichiers le sont aussi (clé dérivée de la clé maître).
+    """
+    PARQUET_KEY_NAME = "todo_bene_archive"
+
+    def __init__(self, connection, directory: Path):
+        self._conn = connection
+        self.directory = Path(directory)
+        self._encrypted: Optional[bool] = None
+
+    def _encryption_option(self, read: bool) -> str:
+        """Option de chiffrement Parquet (COPY ou read_parquet), vide pour une base en clair."""
+        if self._encrypted is None:
+            self._encrypted = bool(self._conn.execute(
+                "SELECT encrypted FROM duckdb_databases() WHERE database_name = current_database()"
+            ).fetchone()[0])
+            if self._encrypted:
+                # 32 caractères hexadécimaux : clé AES-256 propre à l'archive
+                key = hashlib.sha256(get_or_create_master_key() + b":parquet").hexdigest()[:32]
+                self._conn.execute(f"PRAGMA add_parquet_key('{self.PARQUET_KEY_NAME}', '{key}')")
+        if not self._encrypted:
+            return ""
+        config = f"{{footer_key: '{self.PARQUET_KEY_NAME}'}}"
+        return f", encryption_config = {config}" if read else f", ENCRYPTION_CONFIG {config}"
+
+    def files(self) -> list[Path]:
+        return sorted(self.directory.glob("month=*/*.parquet"))
+
+    def _read_parquet(self) -> str:
+        pattern = str(self.directory / "month=*" / "*.parquet").replace("'", "''")
+        return (
+            f"read_parquet('{pattern}', hive_partitioning = true, "
+            f"hive_types = {{'month': VARCHAR}}{self._encryption_option(read=True)})"
+        )
+
+    def history_source(self) -> str:
+        """Sous-requête SQL (colonnes de TODO_COLUMNS) des todos en base et archivés."""
+        columns = ", ".join(TODO_COLUMNS)
+        if not self.files():
+            return f"(SELECT {columns} FROM todos)"
+        return f"(SELECT {columns} FROM todos UNION ALL SELECT {columns} FROM {self._read_parquet()})"
+
+    def archive(self, user_id: UUID, older_than: int) -> dict[str, int]:
+        """
+        Déplace les sous-arbres terminés de l'utilisateur dont la dernière échéance est antérieure
+        à `older_than` (timestamp) ; retourne le nombre de todos archivés par mois.
+
+        COPY et DELETE se font dans une transaction : en cas d'échec elle est annulée et les
+        fichiers déjà écrits par le lot sont supprimés.
+        """
+        batch = f"batch_{uuid.uuid4().hex}"
+        columns = ", ".join(TODO_COLUMNS)
+        self._conn.begin()
+        try:
+            self._conn.execute(
+                """
+                CREATE OR REPLACE TEMP TABLE archive_batch AS
+                WITH RECURSIVE tree AS (
+                    SELECT uuid AS root_id, uuid FROM todos
+                    WHERE user_id = ? AND parent_id IS NULL AND state
+                    UNION ALL
+                    SELECT tree.root_id, t.uuid FROM todos t JOIN tree ON t.parent_id = tree.uuid
+                ),
+                roots AS (
+                    SELECT tree.root_id, strftime(make_timestamp(max(t.date_due) * 1000000), '%Y-%m') AS month
+                    FROM tree JOIN todos t ON t.uuid = tree.uuid
+                    GROUP BY tree.root_id
+                    HAVING bool_and(t.state) AND max(t.date_due) < ?
+                        AND NOT bool_or(t.uuid IN (SELECT template_id FROM series WHERE template_id IS NOT NULL))
+                )
+                SELECT tree.uuid, roots.month FROM tree JOIN roots USING (root_id)
+                """,
+                [user_id, older_than],
+            )
+            counts = dict(self._conn.execute(
+                "SELECT month, count(*) FROM archive_batch GROUP BY month ORDER BY month"
+            ).fetchall())
+            if counts:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                target = str(self.directory).replace("'", "''")
+                self._conn.execute(
+                    f"""
+                    COPY (
+                        SELECT {columns}, b.month FROM todos JOIN archive_batch b USING (uuid)
+                    ) TO '{target}' (
+                        FORMAT parquet, PARTITION_BY (month), OVERWRITE_OR_IGNORE,
+                        FILENAME_PATTERN '{batch}_{{i}}'{self._encryption_option(read=False)}
+                    )
+                    """
+                )
+                self._conn.execute("DELETE FROM title_index WHERE todo_id IN (SELECT uuid FROM archive_batch)")
+                self._conn.execute("DELETE FROM todos WHERE uuid IN (SELECT uuid FROM archive_batch)")
+            self._conn.execute("DROP TABLE archive_batch")
+            self._conn.commit()
+        except duckdb.Error:
+            self._conn.rollback()
+            for path in self.directory.glob(f"month=*/{batch}_*.parquet"):
+                path.unlink(missing_ok=True)
+            raise
+        return counts
+
+    def completion_stats(self, user_id: UUID) -> list[tuple[str, int]]:
+        """Todos terminés par mois d'échéance (en base et archivés), du plus ancien au plus récent."""
+        return self._conn.execute(
+            f"""
+            SELECT strftime(make_timestamp(date_due * 1000000), '%Y-%m') AS month, count(*)
+            FROM {self.history_source()} h
+            WHERE user_id = ? AND state
+            GROUP BY month ORDER BY month
+            """,
+            [user_id],
+        ).fetchall()
@@ -1,49 +1,159 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import replace
+import pendulum
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 from todo_bene.domain.entities.todo import Todo
+from todo_bene.domain.entities.series import Series
+from todo_bene.domain.entities.category import Category
+from todo_bene.domain.entities.todo_list_item import TodoListItem
+from todo_bene.domain.services.title_search import MATCH_THRESHOLD, SEARCH_LIMIT, TitleEntry, match_score
 from todo_bene.application.interfaces.todo_repository import TodoRepository
 
+# Borne haute des uuid pour couper l'index (échéance, uuid) à une échéance donnée
+_MAX_UUID = UUID(int=(1 << 128) - 1)
+
+# Longueur de description renvoyée par la vue liste (cf. DuckDBTodoRepository.LIST_DESCRIPTION_LENGTH)
+LIST_DESCRIPTION_LENGTH = 16
+
+
+def _paginate(rows: list, key, after: Optional[tuple], before: Optional[tuple], limit: Optional[int]) -> list:
+    """Pagination par clé, mêmes règles que le repository DuckDB."""
+    rows = sorted(rows, key=key)
+    if after is not None:
+        rows = [row for row in rows if key(row) > tuple(after)]
+    if before is not None:
+        rows = [row for row in rows if key(row) < tuple(before)]
+        return rows[-limit:] if limit else rows
+    return rows[:limit] if limit else rows
+
 
 class MemoryTodoRepository(TodoRepository):
-    def __init__(self):
+    """
+    Stockage en mémoire indexé : sert de double de test et de moteur éphémère (`--engine memory`).
+
+    Index maintenus par save / save_all / update_state / delete :
+    - parent -> enfants (ensemble ordonné d'uuid) ;
+    - utilisateur -> ses Todos ;
+    - utilisateur -> racines triées par échéance (bisect sur max_date).
+    Les valeurs indexées sont mémorisées à l'écriture : un Todo modifié puis sauvegardé
+    est retiré des index sous ses anciennes valeurs.
+    """
+
+    def __init__(self, category_repository=None):
         self.todos = {}
+        self.series = {}
+        # Catégories (émojis enregistrés) du moteur mémoire ; None pour un simple double de test
+        self.category_repository = category_repository
+        self._children: dict[UUID, dict[UUID, None]] = {}
+        self._by_user: dict[UUID, dict[UUID, None]] = {}
+        self._roots_by_due: dict[UUID, list[tuple[float, UUID]]] = {}
+        self._indexed: dict[UUID, tuple] = {}
+
+    def _unindex(self, todo_id: UUID) -> None:
+        parent, user, due = self._indexed.pop(todo_id)
+        if parent is not None:
+            self._children[parent].pop(todo_id, None)
+        else:
+            roots = self._roots_by_due[user]
+            position = bisect_left(roots, (due, todo_id))
+            if position < len(roots) and roots[position] == (due, todo_id):
+                del roots[position]
+        self._by_user[user].pop(todo_id, None)
+
+    def _index(self, todo: Todo) -> None:
+        self._indexed[todo.uuid] = (todo.parent, todo.user, todo.date_due)
+        if todo.parent is not None:
+            self._children.setdefault(todo.parent, {})[todo.uuid] = None
+        else:
+            insort(self._roots_by_due.setdefault(todo.user, []), (todo.date_due, todo.uuid))
+        self._by_user.setdefault(todo.user, {})[todo.uuid] = None
 
     def save(self, todo: Todo) -> None:
+        if todo.uuid in self._indexed:
+            self._unindex(todo.uuid)
         self.todos[todo.uuid] = todo
+        self._index(todo)
+
+    def save_all(self, todos: list[Todo]) -> None:
+        for todo in todos:
+            self.save(todo)
 
     def get_by_id(self, todo_id: UUID) -> Todo | None:
         return self.todos.get(todo_id)
 
     def find_by_parent(self, parent_id: UUID) -> list[Todo]:
-        return [todo for todo in self.todos.values() if todo.parent == parent_id]
-
-    def count_all_descendants(self, todo_uuid: UUID) -> int:
-        children = self.find_by_parent(todo_uuid)
-        total = len(children)
-        completed = sum(1 for child in children if child.state)
-        for child in children:
-            subtotal, subcompleted = self.count_all_descendants(child.uuid)
-            total += subtotal
-            completed += subcompleted
-        return total, completed
+        children = [self.todos[uuid] for uuid in self._children.get(parent_id, ())]
+        return sorted(children, key=lambda x: x.date_start)
+
+    def find_descendants(self, todo_uuid: UUID) -> list[Todo]:
+        descendants, stack = [], [todo_uuid]
+        while stack:
+            for child_id in self._children.get(stack.pop(), ()):
+                descendants.append(self.todos[child_id])
+                stack.append(child_id)
+        return sorted(descendants, key=lambda x: x.date_start)
+
+    def clone_subtree(self, todo_uuid: UUID, time_deltas: list[int]) -> list[Todo]:
+        source_root = self.todos[todo_uuid]
+        subtree = [source_root] + self.find_descendants(todo_uuid)
+        new_roots = []
+        for delta in sorted(set(time_deltas)):
+            new_ids = {todo.uuid: uuid4() for todo in subtree}
+            for todo in subtree:
+                clone = replace(
+                    todo,
+                    uuid=new_ids[todo.uuid],
+                    parent=new_ids.get(todo.parent),
+                    date_start=todo.date_start + delta,
+                    date_due=todo.date_due + delta,
+                    frequency="",
+                    state=False,
+                    date_final=0,
+                )
+                self.save(clone)
+                if todo is source_root:
+                    new_roots.append(clone)
+        return new_roots
+
+    def materialize_occurrence(self, series: Series, delta: int) -> Todo:
+        new_root = self.clone_subtree(series.template, [delta])[0]
+        series.deltas = [d for d in series.deltas if d != delta]
+        self.save_series(series)
+        return new_root
+
+    def materialize_horizon(self, series: Series, deltas: list[int]) -> list[Todo]:
+        new_roots = self.clone_subtree(series.template, deltas) if deltas else []
+        series.materialized += len(deltas)
+        self.save_series(series)
+        return new_roots
+
+    def count_all_descendants(self, todo_uuid: UUID) -> tuple[int, int]:
+        # Parcours itératif de l'index des enfants : O(taille du sous-arbre)
+        descendants = self.find_descendants(todo_uuid)
+        return len(descendants), sum(1 for todo in descendants if todo.state)
+
+    def _user_todos(self, user_id: UUID) -> list[Todo]:
+        return [self.todos[uuid] for uuid in self._by_user.get(user_id, ())]
 
     def find_all_active_by_user(self, user_id: UUID) -> list[Todo]:
         """Récupère toutes les tâches non terminées (actives) d'un utilisateur."""
-        return [
-            todo
-            for todo in self.todos.values()
-            if todo.user == user_id and not todo.state
-        ]
+        return [todo for todo in self._user_todos(user_id) if not todo.state]
 
     def find_top_level_by_user(
-        self, user_id: UUID, category: Optional[list[str]] = None, exclude_category: Optional[list[str]] = None, max_date: Optional[int] = None
+        self, user_id: UUID, category: Optional[list[str]] = None, exclude_category: Optional[list[str]] = None, max_date: Optional[int] = None,
+        after: Optional[tuple] = None, before: Optional[tuple] = None, limit: Optional[int] = None,
     ) -> list[Todo]:
-        # Filtrage de base (racines actives de l'utilisateur)
-        roots = [
-            todo
-            for todo in self.todos.values()
-            if todo.user == user_id and todo.parent is None and todo.state is False
-        ]
+        # Filtrage de base (racines actives de l'utilisateur), coupé par l'index des échéances
+        indexed = self._roots_by_due.get(user_id, [])
+        if max_date is not None:
+            indexed = indexed[:bisect_right(indexed, (max_date, _MAX_UUID))]
+        roots = [self.todos[uuid] for _, uuid in indexed if self.todos[uuid].state is False]
+        # Occurrences virtuelles des séries, développées depuis leur modèle
+        for series in self.series.values():
+            template = self.todos.get(series.template)
+            if series.user == user_id and template and series.horizon is None:
+                roots.extend(series.occurrence(template, delta) for delta in series.deltas)
 
         # Filtre de catégorie (inclusion)
         if category:
@@ -58,37 +168,90 @@ class MemoryTodoRepository(TodoRepository):
             roots = [todo for todo in roots if todo.date_due <= max_date]
 
         # Tri par date_start (heure) puis date_due
-        return sorted(roots, key=lambda x: (x.date_start, x.date_due))
+        return _paginate(roots, lambda x: (x.date_start, x.date_due, x.series or x.uuid), after, before, limit)
+
+    def find_list_view(
+        self, user_id: UUID, category: Optional[list[str]] = None, exclude_category: Optional[list[str]] = None, max_date: Optional[int] = None,
+        group_by: Optional[str] = None, timezone: str = "UTC",
+        after: Optional[tuple] = None, before: Optional[tuple] = None, limit: Optional[int] = None,
+    ) -> list[TodoListItem]:
+        items = []
+        emojis = {}
+        if self.category_repository is not None:
+            emojis = {c.name: c.emoji for c in self.category_repository.get_all_categories_with_emojis(user_id)}
+        roots = self.find_top_level_by_user(user_id, category, exclude_category, max_date)
+        roots = _paginate(roots, lambda x: TodoListItem(x).cursor, after, before, limit)
+        for root in roots:
+            if root.series:
+                # Occurrence virtuelle : sous-arbre du modèle, rien n'y est encore terminé
+                total, _ = self.count_all_descendants(self.series[root.series].template)
+                completed = 0
+            else:
+                total, completed = self.count_all_descendants(root.uuid)
+            emoji = emojis.get(root.category) or Category(name=root.category, user_id=user_id).emoji
+            group = None
+            if group_by:
+                due = pendulum.from_timestamp(root.date_due, tz=timezone)
+                group = due.start_of(group_by).to_date_string()
+            # Même projection que DuckDB : extrait de description, sur une copie (l'original reste intact)
+            summary = replace(root, description=(root.description or "")[:LIST_DESCRIPTION_LENGTH])
+            items.append(TodoListItem(summary, emoji=emoji, total=total, completed=completed, group=group))
+        return sorted(items, key=lambda item: (item.group or "", item.cursor))
 
     def search_by_title(self, user_id: UUID, search_term: str) -> list[Todo]:
-        return [
-            todo
-            for todo in self.todos.values()
-            if todo.user == user_id and search_term.lower() in todo.title.lower()
+        # Même sémantique que DuckDB : sous-chaîne d'abord, trigrammes en complément
+        needle = search_term.lower()
+        todos = self._user_todos(user_id)
+        found = sorted(
+            (todo for todo in todos if needle in todo.title.lower()),
+            key=lambda todo: (todo.title.lower(), todo.title),
+        )
+        if len(found) >= SEARCH_LIMIT:
+            return found[:SEARCH_LIMIT]
+        scored = [
+            (match_score(search_term, todo.title), todo)
+            for todo in todos
+            if needle not in todo.title.lower()
         ]
+        ranked = sorted(
+            ((score, todo) for score, todo in scored if score >= MATCH_THRESHOLD),
+            key=lambda item: (-item[0], item[1].title),
+        )
+        return found + [todo for _, todo in ranked[: SEARCH_LIMIT - len(found)]]
 
-    def delete(self, todo_id: UUID) -> None:
-        # On trouve tous les enfants d'abord
-        children = self.find_by_parent(todo_id)
-        for child in children:
-            self.delete(child.uuid)  # Appel récursif
+    def find_title_entries(self, user_id: UUID) -> list[TitleEntry]:
+        active = sorted(self.find_all_active_by_user(user_id), key=lambda x: x.date_start)
+        return [TitleEntry(todo.uuid, todo.title, todo.category, todo.parent) for todo in active]
 
-        # On supprime le todo lui-même
+    def delete(self, todo_id: UUID) -> None:
+        # Le sous-arbre entier, enfants d'abord, puis le todo lui-même
+        for todo in reversed(self.find_descendants(todo_id)):
+            self._unindex(todo.uuid)
+            del self.todos[todo.uuid]
         if todo_id in self.todos:
+            self._unindex(todo_id)
             del self.todos[todo_id]
+        self._children.pop(todo_id, None)
+        self.series = {k: s for k, s in self.series.items() if s.template != todo_id}
+
+    def save_series(self, series: Series) -> None:
+        self.series[series.uuid] = series
+
+    def get_series(self, series_id: UUID) -> Series | None:
+        return self.series.get(series_id)
+
+    def find_series_by_user(self, user_id: UUID) -> list[Series]:
+        return [series for series in self.series.values() if series.user == user_id]
 
     def update_state(self, todo_id: UUID, state: bool):
         if todo_id in self.todos:
             self.todos[todo_id].state = state
 
     def get_pending_completion_parents(self, user_id: UUID) -> list[Todo]:
-        all_todos = self.todos.values()
-        parents = [t for t in all_todos if t.user == user_id and not t.state]
-
         results = []
-        for p in parents:
-            children = [t for t in all_todos if t.parent == p.uuid]
-            if children and all(c.state for c in children):
+        for p in self.find_all_active_by_user(user_id):
+            children = self._children.get(p.uuid)
+            if children and all(self.todos[uuid].state for uuid in children):
                 results.append(p)
         return results
 
@@ -0,0 +1,25 @@
+from todo_bene.domain.entities.category import Category
+from todo_bene.infrastructure.persistence.duckdb.duckdb_todo_repository import (
+    DuckDBTodoRepository,
+    todo_columns,
+)
+from todo_bene.infrastructure.persistence.memory.memory_category_repository import MemoryCategoryRepository
+from todo_bene.infrastructure.persistence.memory.memory_todo_repository import MemoryTodoRepository
+
+
+def load_snapshot(conn) -> MemoryTodoRepository:
+    """
+    Copie une base DuckDB ouverte (todos, séries, catégories) dans un moteur mémoire.
+    Les écritures suivantes restent en mémoire : la base d'origine n'est jamais modifiée.
+    """
+    source = DuckDBTodoRepository(conn)
+    categories = MemoryCategoryRepository()
+    for name, user_id, emoji in conn.execute("SELECT name, user_id, emoji FROM categories").fetchall():
+        categories.save_category(Category(name=name, user_id=user_id, emoji=emoji))
+
+    repo = MemoryTodoRepository(category_repository=categories)
+    rows = conn.execute(f"SELECT {todo_columns()} FROM todos").fetchall()
+    repo.save_all([source._row_to_todo(row) for row in rows])
+    for row in conn.execute(f"SELECT {source.SERIES_COLUMNS} FROM series").fetchall():
+        repo.save_series(source._row_to_series(row))
+    return repo
@@ -0,0 +1,80 @@
+import cProfile
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+    """
+    Échantillonneur de pile (temps réel) d'un thread cible.
+
+    cProfile ne conserve que les paires appelant/appelé : les piles complètes,
+    nécessaires aux flame graphs, sont relevées ici toutes les `interval` secondes.
+    """
+
+    def __init__(self, target_thread_id: int, interval: float = 0.001):
+        super().__init__(name="tb-stack-sampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def write_collapsed(self, path: Path) -> None:
+        """Format « piles repliées » (une pile par ligne, suivie du nombre d'échantillons)."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class ProfileSession:
+    """
+    Profilage d'une commande : cProfile (fichier .pstats) et échantillonnage de pile
+    (fichier .collapsed, lisible par flamegraph.pl, inferno ou speedscope).
+    Démarré et arrêté depuis le même thread (celui de la commande).
+    """
+
+    def __init__(self, output_dir: Path, name: str, interval: float = 0.001):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.prefix = Path(output_dir) / f"tb-{name}-{stamp}"
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler(threading.get_ident(), interval)
+        self.paths: Optional[tuple[Path, Path]] = None
+
+    def start(self) -> "ProfileSession":
+        self._sampler.start()
+        self._profile.enable()
+        return self
+
+    def stop(self) -> tuple[Path, Path]:
+        """Arrête le profilage et écrit les deux fichiers ; retourne leurs chemins."""
+        self._profile.disable()
+        self._sampler.stop()
+        self.prefix.parent.mkdir(parents=True, exist_ok=True)
+        pstats_path = self.prefix.with_suffix(".pstats")
+        collapsed_path = self.prefix.with_suffix(".collapsed")
+        self._profile.dump_stats(pstats_path)
+        self._sampler.write_collapsed(collapsed_path)
+        self.paths = (pstats_path, collapsed_path)
+        return self.paths